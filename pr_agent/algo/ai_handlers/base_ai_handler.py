@@ -1,4 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
 
 
 class BaseAiHandler(ABC):
@@ -26,3 +28,25 @@ class BaseAiHandler(ABC):
             temperature (float): the temperature to use for the chat completion
         """
         pass
+
+    async def batch_chat_completion(self, requests: list[dict], semaphore: asyncio.Semaphore = None) -> list:
+        """
+        Run several independent chat completions.
+
+        Handlers that support a provider batch interface can override this method.
+        The default implementation runs the requests concurrently.
+        Args:
+            requests (list[dict]): keyword arguments for chat_completion, one dict per request
+            semaphore (asyncio.Semaphore): bounds how many requests are sent at the same time (unbounded if not given)
+        Returns:
+            list: the response text for each request, or the exception it raised, in request order
+        """
+        async def complete(request: dict):
+            async with semaphore or nullcontext():
+                return await self.chat_completion(**request)
+
+        results = await asyncio.gather(
+            *(complete(request) for request in requests),
+            return_exceptions=True
+        )
+        return [result if isinstance(result, BaseException) else result[0] for result in results]
@@ -1,4 +1,6 @@
+import asyncio
 import os
+import time
 import litellm
 import openai
 import requests
@@ -15,6 +17,8 @@ from pr_agent.log import get_logger
 import json
 
 MODEL_RETRIES = 2
+# Providers whose Batch API litellm drives with OpenAI-format request files
+BATCH_API_PROVIDERS = ("openai", "azure")
 
 
 class LiteLLMAIHandler(BaseAiHandler):
@@ -411,6 +415,114 @@ class LiteLLMAIHandler(BaseAiHandler):
 
         return resp, finish_reason
 
+    async def batch_chat_completion(self, requests: list[dict], semaphore: asyncio.Semaphore = None) -> list:
+        """
+        Run several chat completions, through the provider Batch API when enabled.
+
+        Batch API jobs are billed at a discount and share the system prompt prefix,
+        but complete asynchronously; if the models' provider has no Batch API, or the job
+        fails or does not finish within litellm.batch_timeout seconds, the requests are
+        sent individually instead, at most as many at a time as the semaphore allows.
+        """
+        if len(requests) < 2 or not get_settings().litellm.get("use_batch_api", False):
+            return await super().batch_chat_completion(requests, semaphore)
+
+        provider, models = self._get_batch_api_provider(requests)
+        if provider is None:
+            get_logger().info("Batch API is not supported for the requested models, sending requests individually")
+            return await super().batch_chat_completion(requests, semaphore)
+
+        try:
+            return await self._run_batch_api(requests, provider, models)
+        except Exception as e:
+            get_logger().warning(f"Batch API request failed, falling back to individual requests: {e}")
+            return await super().batch_chat_completion(requests, semaphore)
+
+    def _get_batch_api_provider(self, requests: list[dict]) -> tuple:
+        """
+        Resolve the provider that a batch of requests would be submitted to.
+
+        Returns:
+            tuple: the provider and each request's provider-local model name, or (None, None)
+            when the requests span several providers or their provider has no supported Batch API
+        """
+        providers = set()
+        models = []
+        for request in requests:
+            model = 'azure/' + request["model"] if self.azure else request["model"]
+            try:
+                model, provider, _, _ = litellm.get_llm_provider(model)
+            except Exception as e:
+                get_logger().debug(f"Could not determine the provider of {model}: {e}")
+                return None, None
+            providers.add(provider)
+            models.append(model)
+
+        if len(providers) != 1 or not providers <= set(BATCH_API_PROVIDERS):
+            return None, None
+        return providers.pop(), models
+
+    async def _run_batch_api(self, requests: list[dict], provider: str, models: list[str]) -> list:
+        lines = []
+        for i, request in enumerate(requests):
+            # System prompt first, so the shared prefix can be cached by the provider
+            body = {
+                "model": models[i],
+                "messages": [{"role": "system", "content": request["system"]},
+                             {"role": "user", "content": request["user"]}],
+            }
+            if request["model"] not in self.no_support_temperature_models:
+                body["temperature"] = request.get("temperature", 0.2)
+            lines.append(json.dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": body,
+            }))
+
+        batch_file = await litellm.acreate_file(
+            file=("pr_agent_batch.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch",
+            custom_llm_provider=provider,
+        )
+        batch = await litellm.acreate_batch(
+            completion_window="24h",
+            endpoint="/v1/chat/completions",
+            input_file_id=batch_file.id,
+            custom_llm_provider=provider,
+        )
+        get_logger().info(f"Submitted {len(requests)} requests as batch {batch.id}")
+
+        poll_interval = get_settings().litellm.get("batch_poll_interval", 10)
+        deadline = time.monotonic() + get_settings().litellm.get("batch_timeout", 600)
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            if time.monotonic() > deadline:
+                # Cancel the job so the requests are not billed again when they are resent individually
+                try:
+                    await litellm.acancel_batch(batch_id=batch.id, custom_llm_provider=provider)
+                except Exception as e:
+                    get_logger().warning(f"Failed to cancel batch {batch.id}: {e}")
+                raise TimeoutError(f"Batch {batch.id} did not complete in time (status: {batch.status})")
+            await asyncio.sleep(poll_interval)
+            batch = await litellm.aretrieve_batch(batch_id=batch.id, custom_llm_provider=provider)
+
+        if batch.status != "completed" or not batch.output_file_id:
+            raise ValueError(f"Batch {batch.id} ended with status {batch.status}")
+
+        content = await litellm.afile_content(file_id=batch.output_file_id, custom_llm_provider=provider)
+        responses: list = [ValueError("Missing response in batch output")] * len(requests)
+        for line in content.content.decode("utf-8").splitlines():
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            index = int(item["custom_id"])
+            try:
+                responses[index] = item["response"]["body"]["choices"][0]["message"]["content"]
+            except (KeyError, IndexError, TypeError):
+                responses[index] = ValueError(f"Batch request failed: {item.get('error')}")
+
+        return responses
+
     async def _get_completion(self, **kwargs):
         """
         Wrapper that automatically handles streaming for required models.
@@ -0,0 +1,96 @@
+"""
+JSON encoding helpers shared by the caches, state stores and feedback logs.
+
+orjson is used when it is installed and the standard library json module
+otherwise. Both backends produce compact UTF-8 bytes and hand objects JSON
+has no type for (to_dict() objects, dataclasses, datetimes, enums) to the
+same fallback, so the stored format does not depend on which one wrote it.
+"""
+
+import dataclasses
+import json
+from datetime import date, datetime, time
+from enum import Enum
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+
+def _to_serializable(obj: Any) -> Any:
+    """Convert an object JSON has no type for into one it has, for both backends."""
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(
+    obj: Any,
+    *,
+    indent: bool = False,
+    sort_keys: bool = False,
+    append_newline: bool = False,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> bytes:
+    """
+    Serialize an object to JSON bytes.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with two-space indentation
+        sort_keys: Emit dictionary keys in sorted order
+        append_newline: Terminate the output with a newline, as for JSONL records
+        default: Called for objects JSON has no type for, instead of the shared fallback
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if ORJSON_AVAILABLE:
+        # Route dataclasses and datetimes through the fallback, as the json module does
+        option = orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if append_newline:
+            option |= orjson.OPT_APPEND_NEWLINE
+        return orjson.dumps(obj, default=default or _to_serializable, option=option)
+
+    text = json.dumps(
+        obj,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+        sort_keys=sort_keys,
+        default=default or _to_serializable,
+        ensure_ascii=False,
+    )
+    if append_newline:
+        text += "\n"
+    return text.encode("utf-8")
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """
+    Deserialize JSON from bytes or text.
+
+    Args:
+        data: JSON document
+
+    Returns:
+        The decoded Python object
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
@@ -5,13 +5,61 @@ Base class for all pre-merge checks.
 """
 
 from abc import ABC, abstractmethod
+from dataclasses import replace
+from functools import lru_cache
 from typing import Literal, Optional
+import re
 import pathspec
+from pathspec.util import normalize_file
 
 from pr_agent.checks.check_context import CheckContext
 from pr_agent.checks.check_result import CheckResult
 
 
+@lru_cache(maxsize=256)
+def _compile_pathspec(patterns: tuple[str, ...]) -> pathspec.PathSpec:
+    """
+    Compile gitwildmatch patterns, sharing the result between checks with identical patterns.
+
+    Args:
+        patterns: Glob patterns
+
+    Returns:
+        Compiled path spec
+    """
+    return pathspec.PathSpec.from_lines('gitwildmatch', patterns)
+
+
+# Named groups in pathspec's pattern regexes; they collide once patterns are joined
+_NAMED_GROUP_RE = re.compile(r"\(\?P<\w+>")
+
+
+@lru_cache(maxsize=256)
+def _compile_path_regex(patterns: tuple[str, ...]) -> Optional[re.Pattern]:
+    """
+    Combine gitwildmatch patterns into one alternation, so a file is matched with a single search.
+
+    Args:
+        patterns: Glob patterns
+
+    Returns:
+        Combined regex, or None if a pattern is negated ("!pattern"), since the
+        last-match-wins semantics of negation cannot be expressed as a union
+    """
+    alternatives = []
+    for pattern in _compile_pathspec(patterns).patterns:
+        if pattern.include is None:
+            # Blank line or comment
+            continue
+        if not pattern.include:
+            return None
+        alternatives.append(_NAMED_GROUP_RE.sub("(?:", pattern.regex.pattern))
+
+    if not alternatives:
+        return re.compile(r"(?!)")
+    return re.compile("|".join(f"(?:{alternative})" for alternative in alternatives))
+
+
 class BaseCheck(ABC):
     """
     Abstract base class for all pre-merge checks.
@@ -45,8 +93,14 @@ class BaseCheck(ABC):
         self.exclude_paths = exclude_paths or []
 
         # Compile path specs for efficient matching
-        self._path_spec = pathspec.PathSpec.from_lines('gitwildmatch', self.paths)
-        self._exclude_spec = pathspec.PathSpec.from_lines('gitwildmatch', self.exclude_paths) if self.exclude_paths else None
+        self._path_spec = _compile_pathspec(tuple(self.paths))
+        self._exclude_spec = _compile_pathspec(tuple(self.exclude_paths)) if self.exclude_paths else None
+
+        # Single-regex forms of the specs; None where a spec must be evaluated pattern by pattern
+        self._path_re = _compile_path_regex(tuple(self.paths))
+        self._exclude_re = _compile_path_regex(tuple(self.exclude_paths)) if self.exclude_paths else None
+        # The default filter keeps every file, so filter_context can skip matching
+        self._matches_all = self.paths == ["**/*"] and not self.exclude_paths
 
     def should_check_file(self, file_path: str) -> bool:
         """
@@ -58,12 +112,20 @@ class BaseCheck(ABC):
         Returns:
             True if the file matches include patterns and doesn't match exclude patterns
         """
+        norm_file = normalize_file(file_path)
+
         # Check if file matches include patterns
-        if not self._path_spec.match_file(file_path):
+        if self._path_re is not None:
+            if not self._path_re.match(norm_file):
+                return False
+        elif not self._path_spec.match_file(norm_file):
             return False
 
         # Check if file matches exclude patterns
-        if self._exclude_spec and self._exclude_spec.match_file(file_path):
+        if self._exclude_re is not None:
+            if self._exclude_re.match(norm_file):
+                return False
+        elif self._exclude_spec and self._exclude_spec.match_file(norm_file):
             return False
 
         return True
@@ -76,15 +138,46 @@ class BaseCheck(ABC):
             context: Original check context
 
         Returns:
-            New context with filtered_files populated
+            New context with filtered_files populated; checks whose filters keep
+            every changed file share one such context
+        """
+        if self._matches_all:
+            filtered_files = context.files_changed
+        elif self._path_re is not None and (self._exclude_spec is None or self._exclude_re is not None):
+            # Both specs reduce to one regex each: a single search per file and spec
+            filtered_files = [file_path for file_path in context.files_changed if self.should_check_file(file_path)]
+        else:
+            # Match the whole file list per spec instead of calling should_check_file per file
+            included = set(self._path_spec.match_files(context.files_changed))
+            excluded = set(self._exclude_spec.match_files(context.files_changed)) if self._exclude_spec else set()
+
+            filtered_files = [
+                file_path for file_path in context.files_changed
+                if file_path in included and file_path not in excluded
+            ]
+
+        # Return a copy so checks running concurrently don't overwrite each other's filter.
+        # The copy is shallow: patches and derived patch views stay shared.
+        if len(filtered_files) != len(context.files_changed):
+            return replace(context, filtered_files=filtered_files)
+
+        # Every file passed: checks with the same (empty) filter share one copy
+        if context.all_files_view is None:
+            context.all_files_view = replace(context, filtered_files=list(context.files_changed))
+        return context.all_files_view
+
+    def definition(self) -> tuple:
         """
-        filtered_files = [
-            file_path for file_path in context.files_changed
-            if self.should_check_file(file_path)
-        ]
+        Describe the configuration that determines this check's results.
+
+        Stored results are only reused while the definition is unchanged, so
+        subclasses extend it with their own settings (patterns, thresholds,
+        rules, model).
 
-        context.filtered_files = filtered_files
-        return context
+        Returns:
+            Tuple of plain values identifying the check's configuration
+        """
+        return (type(self).__name__, self.description, self.mode, tuple(self.paths), tuple(self.exclude_paths))
 
     @abstractmethod
     async def run(self, context: CheckContext) -> CheckResult:
@@ -7,11 +7,18 @@ Provides commonly-needed check types that can be configured
 via TOML without writing custom code.
 """
 
+import asyncio
+import bisect
+import copy
 import fnmatch
+import hashlib
 import re
-import json
+import time
+from collections import OrderedDict
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass, field
 from typing import Optional, Literal, ClassVar
-from functools import partial
+from functools import lru_cache, partial
 
 try:
     from jinja2 import Template
@@ -20,16 +27,411 @@ except ImportError:
     JINJA2_AVAILABLE = False
     Template = None
 
+try:
+    import regex
+    REGEX_AVAILABLE = True
+except ImportError:
+    REGEX_AVAILABLE = False
+    regex = None
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+    hyperscan = None
+
 from pr_agent.checks.base_check import BaseCheck
-from pr_agent.checks.check_context import CheckContext
+from pr_agent.checks.check_context import CheckContext, patch_line_numbers
 from pr_agent.checks.check_result import CheckResult, CheckDetail
+from pr_agent.algo import json_utils
 from pr_agent.algo.ai_handlers.base_ai_handler import BaseAiHandler
 from pr_agent.algo.ai_handlers.litellm_ai_handler import LiteLLMAIHandler
 from pr_agent.config_loader import get_settings
 from pr_agent.log import get_logger
 
 
-def parse_patch_lines_with_numbers(patch: str) -> list[tuple[str, Optional[int]]]:
+# Bounded LRU cache of FreeTextRuleCheck verdicts, keyed by a SHA-256 digest of
+# everything that is sent to the model. Entries expire after a short TTL so that
+# re-triggered events (e.g. label edits) reuse the previous verdict without
+# pinning stale results forever.
+_VERDICT_CACHE_MAX_ENTRIES = 1000
+_VERDICT_CACHE_TTL_SECONDS = 300
+_verdict_cache: "OrderedDict[str, tuple[float, CheckResult]]" = OrderedDict()
+
+
+def _get_cached_verdict(key: str) -> Optional[CheckResult]:
+    """
+    Look up a cached verdict, evicting it if it has expired.
+
+    Args:
+        key: Cache key produced by FreeTextRuleCheck
+
+    Returns:
+        A copy of the cached CheckResult, or None on miss
+    """
+    entry = _verdict_cache.get(key)
+    if entry is None:
+        return None
+
+    stored_at, result = entry
+    if time.monotonic() - stored_at > _VERDICT_CACHE_TTL_SECONDS:
+        del _verdict_cache[key]
+        return None
+
+    _verdict_cache.move_to_end(key)
+    return copy.deepcopy(result)
+
+
+def _store_verdict(key: str, result: CheckResult) -> None:
+    """
+    Store a verdict in the cache, evicting the least recently used entry when full.
+
+    Args:
+        key: Cache key produced by FreeTextRuleCheck
+        result: Parsed check result to cache
+    """
+    _verdict_cache[key] = (time.monotonic(), copy.deepcopy(result))
+    _verdict_cache.move_to_end(key)
+    while len(_verdict_cache) > _VERDICT_CACHE_MAX_ENTRIES:
+        _verdict_cache.popitem(last=False)
+
+
+# Per-PR evaluation sessions for FreeTextRuleCheck, used to send only the new
+# hunks of a PR revision to the model when most of the diff was already evaluated.
+# Keyed by "<pr_url>::<check name>"; bounded like the verdict cache.
+_DELTA_MIN_OVERLAP = 0.8
+_evaluation_sessions: "OrderedDict[str, dict]" = OrderedDict()
+
+# Model requests currently in flight, keyed by PreparedEvaluation.request_key(), so
+# identical concurrent evaluations share a single call
+_inflight_requests: dict[str, asyncio.Future] = {}
+
+# Rules whose verdict depends on when or by whom they are evaluated; their
+# verdicts are never served from the verdict cache
+_VOLATILE_RULE_RE = re.compile(r"\b(?:today|current time|now|recent|latest commit|author)\b", re.IGNORECASE)
+
+# Hunk boundaries inside a unified diff patch
+_HUNK_SPLIT_RE = re.compile(r"\n(?=@@)")
+
+
+# Leading global inline flags, e.g. "(?i)", which must be scoped before a
+# pattern can be embedded in an alternation
+_GLOBAL_FLAGS_RE = re.compile(r"^\(\?([imsx]+)\)")
+
+
+# Upper bound on a single search with a user-supplied pattern when the regex
+# module is available; protects checks from catastrophic backtracking
+_PATTERN_SEARCH_TIMEOUT_SECONDS = 0.5
+
+
+@lru_cache(maxsize=512)
+def compile_pattern(pattern: str, guarded: bool = False):
+    """
+    Compile a check regex, sharing the result between checks and PR runs with the same pattern.
+
+    Guarded patterns come from user configuration. When the regex module is
+    available they are compiled with it instead of re: it avoids most
+    catastrophic backtracking and supports per-search timeouts (see
+    search_pattern). Patterns are always validated by re first, so the
+    accepted syntax does not depend on the installed modules.
+
+    Args:
+        pattern: Regular expression source
+        guarded: True for user-supplied patterns
+
+    Returns:
+        Compiled pattern (a regex.Pattern for guarded patterns when available)
+
+    Raises:
+        re.error: If the pattern is invalid (failures are not cached)
+    """
+    compiled = re.compile(pattern)
+    if guarded and REGEX_AVAILABLE:
+        return regex.compile(pattern)
+    return compiled
+
+
+def search_pattern(pattern, text: str, pos: int = 0):
+    """
+    Search text with a pattern from compile_pattern or combine_patterns.
+
+    Searches with regex-module patterns are bounded by a timeout. A search that
+    times out is logged and raises, so callers never mistake it for no match.
+
+    Args:
+        pattern: Compiled pattern
+        text: Text to search
+        pos: Index in text where the search starts
+
+    Returns:
+        Match object, or None
+
+    Raises:
+        TimeoutError: If the search exceeded _PATTERN_SEARCH_TIMEOUT_SECONDS
+    """
+    if REGEX_AVAILABLE and isinstance(pattern, regex.Pattern):
+        try:
+            return pattern.search(text, pos, timeout=_PATTERN_SEARCH_TIMEOUT_SECONDS)
+        except TimeoutError:
+            get_logger().warning(f"Pattern search timed out: '{pattern.pattern}'")
+            raise
+    return pattern.search(text, pos)
+
+
+def combine_patterns(patterns: list[re.Pattern]) -> Optional[re.Pattern]:
+    """
+    Combine compiled patterns into a single alternation regex.
+
+    Each pattern becomes a named group "g<index>", so a single search tells
+    whether any pattern matches and ``match.lastgroup`` identifies which one.
+    If any pattern is guarded (see compile_pattern), so is the combination.
+
+    Args:
+        patterns: Compiled patterns to combine
+
+    Returns:
+        Combined pattern, or None if the patterns cannot be combined
+        (e.g. conflicting group names or numbered backreferences)
+    """
+    if not patterns:
+        return None
+
+    guarded = any(not isinstance(pattern, re.Pattern) for pattern in patterns)
+    return _combine_pattern_sources(tuple(pattern.pattern for pattern in patterns), guarded)
+
+
+@lru_cache(maxsize=128)
+def _combine_pattern_sources(sources: tuple[str, ...], guarded: bool = False):
+    """Build the alternation for combine_patterns, shared between checks with the same patterns."""
+    alternatives = []
+    for i, pattern_source in enumerate(sources):
+        source = _GLOBAL_FLAGS_RE.sub(r"(?\1:", pattern_source, count=1)
+        if source != pattern_source:
+            source += ")"
+        alternatives.append(f"(?P<g{i}>{source})")
+
+    try:
+        return compile_pattern("|".join(alternatives), guarded)
+    except re.error:
+        return None
+
+
+# Constructs whose meaning changes when a pattern is scanned across a whole patch
+# instead of line by line. Patterns using them skip the Hyperscan prefilter.
+_BUFFER_ANCHOR_RE = re.compile(r"\\[AZz]|\(\?<[=!]")
+_LINE_START_RE = re.compile(r"(?<!\[)(?<!\\)\^")
+
+
+def build_hyperscan_database(patterns: list[re.Pattern], lines_are_stripped: bool = False):
+    """
+    Compile patterns into a Hyperscan database used to prefilter patch lines.
+
+    The database is only a prefilter: matches may span lines, so it reports a
+    superset of the lines matched by the Python patterns, which are still used
+    to confirm each candidate line. Each pattern keeps its own case sensitivity;
+    matching caselessly would also widen negated classes such as ``[^a-z]`` and
+    drop lines the pattern really matches.
+
+    Args:
+        patterns: Compiled patterns to include
+        lines_are_stripped: True if the caller matches lines without their diff
+            prefix, in which case line-start anchors cannot be prefiltered
+
+    Returns:
+        Hyperscan database, or None if Hyperscan is unavailable or the patterns
+        are not supported
+    """
+    if not HYPERSCAN_AVAILABLE or not patterns:
+        return None
+
+    return _build_hyperscan_database_for(
+        tuple((pattern.pattern, bool(pattern.flags & re.IGNORECASE)) for pattern in patterns),
+        lines_are_stripped
+    )
+
+
+@lru_cache(maxsize=128)
+def _build_hyperscan_database_for(patterns: tuple[tuple[str, bool], ...], lines_are_stripped: bool):
+    """
+    Compile the database for build_hyperscan_database, shared between checks with the same patterns.
+
+    Databases are only scanned synchronously on the event loop thread, so sharing
+    one (and its scratch space) between check instances is safe.
+
+    Args:
+        patterns: (source, ignore case) pairs
+        lines_are_stripped: See build_hyperscan_database
+    """
+    sources = [source for source, _ in patterns]
+    for source in sources:
+        if _BUFFER_ANCHOR_RE.search(source):
+            return None
+        if lines_are_stripped and _LINE_START_RE.search(source):
+            return None
+
+    flags = hyperscan.HS_FLAG_MULTILINE | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+    try:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[source.encode("utf-8") for source in sources],
+            ids=list(range(len(sources))),
+            elements=len(sources),
+            flags=[
+                flags | hyperscan.HS_FLAG_CASELESS if ignore_case else flags
+                for _, ignore_case in patterns
+            ]
+        )
+        return database
+    except Exception as e:
+        get_logger().debug(f"Hyperscan prefilter disabled, patterns not supported: {e}")
+        return None
+
+
+def hyperscan_candidate_lines(
+    database,
+    patch: str,
+    newlines: Optional[list[int]] = None
+) -> Optional[set[int]]:
+    """
+    Scan a whole patch with a Hyperscan database.
+
+    Args:
+        database: Database from build_hyperscan_database
+        patch: Patch text
+        newlines: Byte offsets of the patch's newlines, if already computed
+
+    Returns:
+        Indices (in patch.split('\\n') order) of lines that may match, or None
+        if the patch could not be scanned
+    """
+    line_matches = hyperscan_line_matches(database, patch, newlines)
+    return None if line_matches is None else set(line_matches)
+
+
+def hyperscan_line_matches(
+    database,
+    patch: str,
+    newlines: Optional[list[int]] = None
+) -> Optional[dict[int, set[int]]]:
+    """
+    Scan a whole patch with a Hyperscan database, recording which patterns matched each line.
+
+    Pattern IDs are indices into the pattern list the database was built from.
+    Like the lines, the IDs are a superset: each still has to be confirmed
+    with its Python pattern.
+
+    Args:
+        database: Database from build_hyperscan_database
+        patch: Patch text
+        newlines: Byte offsets of the patch's newlines, if already computed
+
+    Returns:
+        Mapping from indices (in patch.split('\\n') order) of lines that may
+        match to the IDs of the patterns that may match them, or None if the
+        patch could not be scanned
+    """
+    data = patch.encode("utf-8", errors="surrogatepass")
+    if newlines is None:
+        newlines = [m.start() for m in re.finditer(b"\n", data)]
+    line_matches: dict[int, set[int]] = {}
+
+    def on_match(pattern_id, start, end, flags, context):
+        line_matches.setdefault(bisect.bisect_left(newlines, end - 1), set()).add(pattern_id)
+
+    try:
+        database.scan(data, match_event_handler=on_match)
+    except Exception as e:
+        get_logger().debug(f"Hyperscan scan failed, checking all lines: {e}")
+        return None
+
+    return line_matches
+
+
+# Constructs that can make a pattern fail on a whole patch where it matches a single line:
+# anchors and assertions at string ends, lookarounds, atomic groups, possessive
+# quantifiers and scoped flag removal (which could turn off MULTILINE)
+_BUFFER_UNSAFE_RE = re.compile(r"\\[AZzB]|\(\?[=!<>]|\(\?[a-zA-Z]*-|[*+?}]\+")
+
+
+@lru_cache(maxsize=512)
+def buffer_scan_pattern(pattern):
+    """
+    Get a MULTILINE variant of a line pattern for scanning whole patches.
+
+    A line that matches the line pattern overlaps some match of the variant in
+    the whole patch, so the variant's matches give a superset of matching lines.
+
+    Args:
+        pattern: Compiled pattern from compile_pattern
+
+    Returns:
+        Compiled variant, or None if the pattern uses constructs whose meaning
+        differs between a single line and a whole patch
+    """
+    if _BUFFER_UNSAFE_RE.search(pattern.pattern):
+        return None
+    if REGEX_AVAILABLE and isinstance(pattern, regex.Pattern):
+        return regex.compile(pattern.pattern, pattern.flags | regex.MULTILINE)
+    return re.compile(pattern.pattern, pattern.flags | re.MULTILINE)
+
+
+def regex_candidate_lines(pattern, patch: str, newlines: list[int]) -> Optional[set[int]]:
+    """
+    Scan a whole ASCII patch with a pattern from buffer_scan_pattern.
+
+    Args:
+        pattern: Compiled variant from buffer_scan_pattern
+        patch: Patch text (ASCII, so character and byte offsets agree)
+        newlines: Offsets of the patch's newlines
+
+    Returns:
+        Indices (in patch.split('\\n') order) of lines overlapping a match, or
+        None if the scan timed out
+    """
+    candidates: set[int] = set()
+    try:
+        if REGEX_AVAILABLE and isinstance(pattern, regex.Pattern):
+            matches = pattern.finditer(patch, timeout=_PATTERN_SEARCH_TIMEOUT_SECONDS)
+        else:
+            matches = pattern.finditer(patch)
+        for match in matches:
+            first = bisect.bisect_left(newlines, match.start())
+            last = bisect.bisect_left(newlines, max(match.end() - 1, match.start()))
+            candidates.update(range(first, last + 1))
+    except TimeoutError:
+        get_logger().debug(f"Patch scan timed out, checking all lines: '{pattern.pattern}'")
+        return None
+    return candidates
+
+
+def regex_buffer_matches(pattern, text: str) -> bool:
+    """
+    Tell whether a pattern from buffer_scan_pattern may match any line of a buffer.
+
+    One search over the whole buffer, stopping at the first match, rules out
+    buffers where no line can match.
+
+    Args:
+        pattern: Compiled variant from buffer_scan_pattern
+        text: Newline-separated lines
+
+    Returns:
+        False if no line matches; True on a match or if the search timed out
+    """
+    try:
+        if REGEX_AVAILABLE and isinstance(pattern, regex.Pattern):
+            return pattern.search(text, timeout=_PATTERN_SEARCH_TIMEOUT_SECONDS) is not None
+        return pattern.search(text) is not None
+    except TimeoutError:
+        get_logger().debug(f"Buffer search timed out, checking all lines: '{pattern.pattern}'")
+        return True
+
+
+def parse_patch_lines_with_numbers(
+    patch: str,
+    lines: Optional[list[str]] = None
+) -> list[tuple[str, Optional[int]]]:
     """
     Parse patch and return list of (line_content, actual_line_number) tuples.
 
@@ -39,48 +441,45 @@ def parse_patch_lines_with_numbers(patch: str) -> list[tuple[str, Optional[int]]
 
     Args:
         patch: The patch string to parse
+        lines: The patch already split on newlines, if available
 
     Returns:
         List of tuples: (line_content, line_number_in_new_file or None)
     """
-    result = []
-    lines = patch.split('\n')
-
-    # Regex to match hunk headers: @@ -start1,size1 +start2,size2 @@ optional_context
-    hunk_header_re = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))?\ @@")
-
-    current_line_number = None
-
-    for line in lines:
-        # Check if this is a hunk header
-        match = hunk_header_re.match(line)
-        if match:
-            # Extract start line in new file (start2)
-            start2 = int(match.group(3))
-            current_line_number = start2
-            result.append((line, None))  # Hunk header has no line number
-            continue
-
-        if current_line_number is None:
-            # Before first hunk header or in file header
-            result.append((line, None))
-            continue
-
-        # Determine line type and track line number
-        if line.startswith('+'):
-            # Added line - has a line number
-            result.append((line, current_line_number))
-            current_line_number += 1
-        elif line.startswith('-'):
-            # Deleted line - no line number in new file
-            result.append((line, None))
-            # Don't increment line number for deleted lines
-        else:
-            # Context line (starts with space or empty)
-            result.append((line, current_line_number))
-            current_line_number += 1
+    if lines is None:
+        lines = patch.split('\n')
+    return list(zip(lines, patch_line_numbers(lines)))
+
 
-    return result
+@dataclass
+class PreparedEvaluation:
+    """
+    A FreeTextRuleCheck model request, ready to be sent on its own or in a batch.
+    """
+    model: str
+    system: str
+    user: str
+    cache_key: Optional[str]
+    session_key: str
+    rule_key: str
+    block_digests: set[str] = field(default_factory=set)
+    temperature: float = 0.2
+    incremental: bool = False
+
+    def request(self) -> dict:
+        """Keyword arguments for BaseAiHandler.chat_completion."""
+        return {
+            "model": self.model,
+            "system": self.system,
+            "user": self.user,
+            "temperature": self.temperature,
+        }
+
+    def request_key(self) -> str:
+        """SHA-256 digest identifying identical model requests."""
+        return hashlib.sha256(
+            f"{self.model}\0{self.temperature}\0{self.system}\0{self.user}".encode()
+        ).hexdigest()
 
 
 class FreeTextRuleCheck(BaseCheck):
@@ -117,9 +516,203 @@ class FreeTextRuleCheck(BaseCheck):
         self.rule = rule
         self.ai_handler = ai_handler()
         self.logger = get_logger()
+        self._cacheable = not _VOLATILE_RULE_RE.search(rule)
+        if not self._cacheable:
+            self.logger.warning(
+                f"FreeTextRuleCheck {name}: rule depends on time or author, verdicts will not be cached"
+            )
+        # Compiled prompt templates keyed by prompt name, stamped with the
+        # source they were compiled from so runtime settings changes recompile
+        self._templates: dict[str, tuple[str, Template]] = {}
+        prompts = get_settings().get("pr_checks_prompts")
+        if prompts and JINJA2_AVAILABLE:
+            for prompt_name in ("user", "user_delta"):
+                if prompts.get(prompt_name):
+                    self._get_template(prompt_name, prompts.get(prompt_name))
+
+    def definition(self) -> tuple:
+        """Extend the base definition with the rule, model and system prompt."""
+        settings = get_settings()
+        return super().definition() + (
+            self.rule, settings.get("config.model"), settings.get("pr_checks_prompts.system")
+        )
 
-    async def run(self, context: CheckContext) -> CheckResult:
-        """Evaluate the rule using AI."""
+    def _get_template(self, prompt_name: str, source: str) -> Template:
+        """
+        Return the compiled Jinja template for a prompt, compiling it only when its source changed.
+
+        Args:
+            prompt_name: Key of the prompt in pr_checks_prompts
+            source: Current template source from settings
+
+        Returns:
+            Compiled template
+        """
+        cached = self._templates.get(prompt_name)
+        if cached is not None and cached[0] == source:
+            return cached[1]
+
+        template = Template(source)
+        self._templates[prompt_name] = (source, template)
+        return template
+
+    def _verdict_cache_key(
+        self,
+        context: CheckContext,
+        relevant_patches: list,
+        model: str,
+        system_prompt: str
+    ) -> str:
+        """
+        Build the verdict cache key for an evaluation.
+
+        Args:
+            context: Check context
+            relevant_patches: Patches that will be sent to the model
+            model: Model name used for evaluation
+            system_prompt: System prompt used for evaluation
+
+        Returns:
+            Hex SHA-256 digest of the rule, model, prompts and patches
+        """
+        h = hashlib.sha256()
+        for part in (self.rule, model, system_prompt, context.pr_title, context.pr_description):
+            h.update(str(part or "").encode())
+            h.update(b"\0")
+        for p in sorted(relevant_patches, key=lambda p: p.filename):
+            h.update(p.filename.encode())
+            h.update(b"\0")
+            h.update((p.patch or "").encode())
+            h.update(b"\0")
+        return h.hexdigest()
+
+    def _session_key(self, context: CheckContext) -> str:
+        """Key identifying this check's evaluation session for a PR."""
+        return f"{context.pr_url}::{self.name}"
+
+    def _rule_key(self, model: str, system_prompt: str) -> str:
+        """Digest of the inputs that must match for a session to be reused."""
+        return hashlib.sha256(f"{self.rule}\0{model}\0{system_prompt}".encode()).hexdigest()
+
+    @staticmethod
+    def _hash_blocks(relevant_patches: list) -> list[tuple[str, str, str]]:
+        """
+        Split patches into hunks and hash each one.
+
+        Args:
+            relevant_patches: Patches that will be sent to the model
+
+        Returns:
+            Ordered list of (digest, filename, hunk) tuples
+        """
+        blocks = []
+        for p in sorted(relevant_patches, key=lambda p: p.filename):
+            for hunk in _HUNK_SPLIT_RE.split(p.patch or ""):
+                digest = hashlib.sha256(f"{p.filename}\0{hunk}".encode()).hexdigest()
+                blocks.append((digest, p.filename, hunk))
+        return blocks
+
+    @staticmethod
+    def _select_delta_blocks(
+        blocks: list[tuple[str, str, str]],
+        session: Optional[dict],
+        rule_key: str
+    ) -> Optional[list[tuple[str, str, str]]]:
+        """
+        Decide whether an incremental evaluation is possible.
+
+        An incremental evaluation is used when every previously evaluated hunk is
+        still present, the new revision shares at least _DELTA_MIN_OVERLAP of its
+        hunks (Jaccard) with the previous evaluation and all new hunks form a
+        contiguous tail of the diff. The delta prompt keeps findings from the
+        previous verdict, so a removed or rewritten hunk forces a full evaluation.
+
+        Args:
+            blocks: Hashed hunks of the current revision
+            session: Previous evaluation session for this PR and check, if any
+            rule_key: Digest of rule, model and system prompt
+
+        Returns:
+            The new tail hunks to evaluate, or None for a full evaluation
+        """
+        if not session or session["rule_key"] != rule_key:
+            return None
+
+        current = {digest for digest, _, _ in blocks}
+        previous = session["blocks"]
+        if not previous <= current:
+            return None
+        union = current | previous
+        if not union or len(current & previous) / len(union) < _DELTA_MIN_OVERLAP:
+            return None
+
+        first_new = next(
+            (i for i, (digest, _, _) in enumerate(blocks) if digest not in previous),
+            None
+        )
+        if first_new is None or first_new == 0:
+            return None
+
+        tail = blocks[first_new:]
+        if any(digest in previous for digest, _, _ in tail):
+            return None
+
+        return tail
+
+    def _parse_response(self, response: str) -> CheckResult:
+        """
+        Convert the model's JSON response into a CheckResult.
+
+        Args:
+            response: Raw model response
+
+        Returns:
+            Parsed check result
+        """
+        result_data = json_utils.loads(response)
+        return self._result_from_data(result_data)
+
+    @staticmethod
+    def _result_from_data(result_data: dict) -> CheckResult:
+        """
+        Convert a decoded verdict into a CheckResult.
+
+        Args:
+            result_data: Verdict object from the model response
+
+        Returns:
+            Parsed check result
+        """
+        details = [
+            CheckDetail(
+                file_path=d.get("file_path", ""),
+                line_number=d.get("line_number"),
+                message=d.get("message", ""),
+                suggestion=d.get("suggestion")
+            )
+            for d in result_data.get("details", [])
+        ]
+
+        return CheckResult(
+            passed=result_data.get("passed", False),
+            message=result_data.get("message", "Check evaluation completed"),
+            details=details,
+            severity=result_data.get("severity", "info")
+        )
+
+    def prepare_evaluation(self, context: CheckContext) -> "CheckResult | PreparedEvaluation":
+        """
+        Prepare the model request for evaluating the rule.
+
+        Short-circuits with a CheckResult when no model call is needed
+        (missing dependency, no files, or a cached verdict).
+
+        Args:
+            context: Check context filtered for this check
+
+        Returns:
+            Final CheckResult, or the PreparedEvaluation to send to the model
+        """
         if not JINJA2_AVAILABLE:
             return CheckResult(
                 passed=False,
@@ -134,21 +727,56 @@ class FreeTextRuleCheck(BaseCheck):
                 severity="info"
             )
 
-        try:
-            # Build prompt from template
-
-            # Get relevant patches for filtered files
-            relevant_patches = [
-                p for p in context.patches
-                if p.filename in context.filtered_files
-            ]
+        # Get relevant patches for filtered files
+        relevant_patches = [
+            p for p in context.patches
+            if p.filename in context.filtered_files
+        ]
 
-            # Load prompt template
-            settings = get_settings()
-            prompt_template = settings.pr_checks_prompts.user
+        settings = get_settings()
+        model = settings.config.model
+        system_prompt = settings.pr_checks_prompts.system
+
+        # Reuse the previous verdict if nothing sent to the model has changed
+        cache_key = None
+        if self._cacheable:
+            cache_key = self._verdict_cache_key(context, relevant_patches, model, system_prompt)
+            cached_result = _get_cached_verdict(cache_key)
+            if cached_result is not None:
+                self.logger.debug(f"FreeTextRuleCheck {self.name}: using cached verdict")
+                return cached_result
+
+        # Route to an incremental evaluation when only a tail of new hunks was added
+        blocks = self._hash_blocks(relevant_patches)
+        rule_key = self._rule_key(model, system_prompt)
+        session_key = self._session_key(context)
+        session = _evaluation_sessions.get(session_key)
+        delta_blocks = self._select_delta_blocks(blocks, session, rule_key)
+        prompts = settings.pr_checks_prompts
+
+        if delta_blocks is not None and prompts.get("user_delta") and prompts.get("system_delta"):
+            self.logger.debug(
+                f"FreeTextRuleCheck {self.name}: incremental evaluation of {len(delta_blocks)} new hunk(s)"
+            )
+            delta_files: dict[str, list[str]] = {}
+            for _, filename, hunk in delta_blocks:
+                delta_files.setdefault(filename, []).append(hunk)
 
-            template = Template(prompt_template)
-            prompt = template.render(
+            prompt = self._get_template("user_delta", prompts.user_delta).render(
+                rule_description=self.rule,
+                pr_title=context.pr_title,
+                pr_description=context.pr_description,
+                previous_verdict=json_utils.dumps(asdict(session["verdict"])).decode(),
+                files=[{
+                    "filename": filename,
+                    "patch": "\n".join(hunks)
+                } for filename, hunks in delta_files.items()]
+            )
+            request_system_prompt = prompts.system_delta
+            incremental = True
+        else:
+            # Build prompt from template
+            prompt = self._get_template("user", prompts.user).render(
                 rule_description=self.rule,
                 pr_title=context.pr_title,
                 pr_description=context.pr_description,
@@ -157,44 +785,273 @@ class FreeTextRuleCheck(BaseCheck):
                     "patch": p.patch
                 } for p in relevant_patches]
             )
+            request_system_prompt = system_prompt
+            incremental = False
+
+        return PreparedEvaluation(
+            model=model,
+            system=request_system_prompt,
+            user=prompt,
+            cache_key=cache_key,
+            session_key=session_key,
+            rule_key=rule_key,
+            block_digests={digest for digest, _, _ in blocks},
+            incremental=incremental
+        )
 
-            # Call AI model
-            system_prompt = settings.pr_checks_prompts.system
-            response, _, _ = await self.ai_handler.chat_completion(
-                model=get_settings().config.model,
-                temperature=0.2,
-                system=system_prompt,
-                user=prompt
-            )
+    def complete_evaluation(self, prepared: "PreparedEvaluation", response: str) -> CheckResult:
+        """
+        Parse the model response and record it for later cache hits and incremental runs.
 
-            # Parse JSON response
-            result_data = json.loads(response)
+        Args:
+            prepared: The evaluation that was sent to the model
+            response: Raw model response
 
-            # Convert to CheckResult
-            details = [
-                CheckDetail(
-                    file_path=d.get("file_path", ""),
-                    line_number=d.get("line_number"),
-                    message=d.get("message", ""),
-                    suggestion=d.get("suggestion")
-                )
-                for d in result_data.get("details", [])
-            ]
+        Returns:
+            Parsed check result
+        """
+        return self.record_evaluation(prepared, self._parse_response(response))
 
-            return CheckResult(
-                passed=result_data.get("passed", False),
-                message=result_data.get("message", "Check evaluation completed"),
-                details=details,
-                severity=result_data.get("severity", "info")
-            )
+    def record_evaluation(self, prepared: "PreparedEvaluation", result: CheckResult) -> CheckResult:
+        """
+        Record a parsed verdict for later cache hits and incremental runs.
+
+        Args:
+            prepared: The evaluation the verdict answers
+            result: Parsed check result
+
+        Returns:
+            The same check result
+        """
+        if prepared.cache_key is not None:
+            _store_verdict(prepared.cache_key, result)
+        _evaluation_sessions[prepared.session_key] = {
+            "rule_key": prepared.rule_key,
+            "blocks": prepared.block_digests,
+            "verdict": copy.deepcopy(result),
+        }
+        _evaluation_sessions.move_to_end(prepared.session_key)
+        while len(_evaluation_sessions) > _VERDICT_CACHE_MAX_ENTRIES:
+            _evaluation_sessions.popitem(last=False)
+
+        return result
+
+    async def _request_completion(self, prepared: PreparedEvaluation) -> str:
+        """
+        Send an evaluation to the model, sharing the call with identical in-flight requests.
+
+        Args:
+            prepared: The evaluation to send
+
+        Returns:
+            Raw model response
+        """
+        key = prepared.request_key()
+        pending = _inflight_requests.get(key)
+        if pending is not None:
+            self.logger.debug(f"FreeTextRuleCheck {self.name}: joining identical in-flight request")
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        _inflight_requests[key] = future
+        try:
+            response, _ = await self.ai_handler.chat_completion(**prepared.request())
+            future.set_result(response)
+            return response
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark as retrieved when no other check is waiting
+            raise
+        finally:
+            del _inflight_requests[key]
+
+    @staticmethod
+    def error_result(error: Exception) -> CheckResult:
+        """Build the result reported when the evaluation fails."""
+        return CheckResult(
+            passed=False,
+            message=f"Check execution error: {str(error)}",
+            severity="error"
+        )
+
+    async def run(self, context: CheckContext) -> CheckResult:
+        """Evaluate the rule using AI."""
+        try:
+            prepared = self.prepare_evaluation(context)
+            if isinstance(prepared, CheckResult):
+                return prepared
+
+            # Call AI model
+            response = await self._request_completion(prepared)
+
+            return self.complete_evaluation(prepared, response)
 
         except Exception as e:
             self.logger.exception(f"FreeTextRuleCheck failed: {e}")
-            return CheckResult(
-                passed=False,
-                message=f"Check execution error: {str(e)}",
-                severity="error"
-            )
+            return self.error_result(e)
+
+
+class BatchedFreeTextEvaluator:
+    """
+    Evaluates several free-text rules that see the same files with shared model calls.
+
+    The PR title, description and diff are sent once, followed by a numbered
+    list of rules, and the model answers with one verdict per rule name. At
+    most max_rules_per_batch rules share a call, since larger batches degrade
+    accuracy. Incremental evaluations, and rules whose verdict is missing from
+    the batched response, are evaluated on their own.
+    """
+
+    def __init__(self, max_rules_per_batch: int = 3, semaphore: Optional[asyncio.Semaphore] = None):
+        """
+        Initialize batched evaluator.
+
+        Args:
+            max_rules_per_batch: Maximum number of rules evaluated by one model call
+            semaphore: Bounds concurrent model calls (unbounded if not given)
+        """
+        self.max_rules_per_batch = max(1, max_rules_per_batch)
+        self._semaphore = semaphore
+        self._template: Optional[tuple[str, Template]] = None
+        self.logger = get_logger()
+
+    def _get_template(self, source: str) -> Template:
+        """Return the compiled multi-rule prompt template, compiling it only when its source changed."""
+        if self._template is None or self._template[0] != source:
+            self._template = (source, Template(source))
+        return self._template[1]
+
+    async def evaluate(self, context: CheckContext, checks: list[FreeTextRuleCheck]) -> dict[str, CheckResult]:
+        """
+        Evaluate free-text rule checks against the same filtered context.
+
+        Args:
+            context: Check context, filtered identically for all checks
+            checks: Checks to evaluate
+
+        Returns:
+            Results keyed by check name
+        """
+        results: dict[str, CheckResult] = {}
+        batchable = []
+        single = []
+        for check in checks:
+            try:
+                prepared = check.prepare_evaluation(context)
+            except Exception as e:
+                self.logger.error(f"Check {check.name} failed with exception: {e}")
+                results[check.name] = check.error_result(e)
+                continue
+
+            if isinstance(prepared, CheckResult):
+                results[check.name] = prepared
+            elif prepared.incremental:
+                single.append((check, prepared))
+            else:
+                batchable.append((check, prepared))
+
+        prompts = get_settings().get("pr_checks_prompts", {})
+        batches = []
+        if prompts.get("system_multi") and prompts.get("user_multi"):
+            for i in range(0, len(batchable), self.max_rules_per_batch):
+                chunk = batchable[i:i + self.max_rules_per_batch]
+                if len(chunk) > 1:
+                    batches.append(chunk)
+                else:
+                    single.extend(chunk)
+        else:
+            single.extend(batchable)
+
+        outcomes = await asyncio.gather(
+            *(self._evaluate_batch(context, batch, prompts) for batch in batches),
+            *(self._evaluate_single(check, prepared) for check, prepared in single)
+        )
+        for outcome in outcomes:
+            results.update(outcome)
+
+        return {check.name: results[check.name] for check in checks}
+
+    async def _evaluate_single(self, check: FreeTextRuleCheck, prepared: PreparedEvaluation) -> dict[str, CheckResult]:
+        """Evaluate one rule with its own prompt."""
+        try:
+            async with self._semaphore or nullcontext():
+                response = await check._request_completion(prepared)
+            return {check.name: check.complete_evaluation(prepared, response)}
+        except Exception as e:
+            self.logger.error(f"Check {check.name} failed with exception: {e}")
+            return {check.name: check.error_result(e)}
+
+    async def _evaluate_batch(
+        self,
+        context: CheckContext,
+        batch: list[tuple[FreeTextRuleCheck, PreparedEvaluation]],
+        prompts
+    ) -> dict[str, CheckResult]:
+        """
+        Evaluate several rules with one model call.
+
+        Args:
+            context: Check context shared by the rules
+            batch: Checks with their prepared single-rule evaluations
+            prompts: pr_checks_prompts settings
+
+        Returns:
+            Results keyed by check name
+        """
+        _, first_prepared = batch[0]
+        prompt = self._get_template(prompts.get("user_multi")).render(
+            rules=[{"name": check.name, "rule": check.rule} for check, _ in batch],
+            pr_title=context.pr_title,
+            pr_description=context.pr_description,
+            files=[{
+                "filename": p.filename,
+                "patch": p.patch
+            } for p in context.patches if p.filename in context.filtered_files]
+        )
+
+        try:
+            async with self._semaphore or nullcontext():
+                response, _ = await batch[0][0].ai_handler.chat_completion(
+                    model=first_prepared.model,
+                    system=prompts.get("system_multi"),
+                    user=prompt,
+                    temperature=first_prepared.temperature
+                )
+        except Exception as e:
+            self.logger.error(f"Batched evaluation of {len(batch)} rules failed with exception: {e}")
+            return {check.name: check.error_result(e) for check, _ in batch}
+
+        try:
+            verdicts = json_utils.loads(response)
+        except ValueError as e:
+            self.logger.warning(f"Batched evaluation returned invalid JSON, evaluating rules separately: {e}")
+            verdicts = {}
+        if not isinstance(verdicts, dict):
+            verdicts = {}
+
+        results: dict[str, CheckResult] = {}
+        fallback = []
+        for check, prepared in batch:
+            verdict = verdicts.get(check.name)
+            if not isinstance(verdict, dict):
+                fallback.append((check, prepared))
+                continue
+            try:
+                results[check.name] = check.record_evaluation(prepared, check._result_from_data(verdict))
+            except Exception as e:
+                self.logger.warning(f"Check {check.name}: invalid batched verdict, evaluating separately: {e}")
+                fallback.append((check, prepared))
+
+        if fallback:
+            for outcome in await asyncio.gather(
+                *(self._evaluate_single(check, prepared) for check, prepared in fallback)
+            ):
+                results.update(outcome)
+
+        return results
 
 
 class PatternCheck(BaseCheck):
@@ -233,7 +1090,7 @@ class PatternCheck(BaseCheck):
 
         # Compile regex pattern with proper error handling
         try:
-            self.pattern = re.compile(pattern)
+            self.pattern = compile_pattern(pattern, guarded=True)
         except re.error as e:
             self.logger.exception(f"Invalid regex pattern '{pattern}': {e}")
             raise ValueError(
@@ -244,6 +1101,15 @@ class PatternCheck(BaseCheck):
         self.message_template = message
         self.invert = invert
 
+        # Optional Hyperscan prefilter, scanning each patch in one pass
+        self._hyperscan_db = build_hyperscan_database([self.pattern])
+        # Otherwise, one C-level regex pass over each ASCII patch picks the lines to check
+        self._buffer_pattern = buffer_scan_pattern(self.pattern) if self._hyperscan_db is None else None
+
+    def definition(self) -> tuple:
+        """Extend the base definition with the pattern, message and invert flag."""
+        return super().definition() + (self.pattern.pattern, self.message_template, self.invert)
+
     async def run(self, context: CheckContext) -> CheckResult:
         """Search for pattern in changed files."""
         if not context.filtered_files:
@@ -254,17 +1120,41 @@ class PatternCheck(BaseCheck):
             )
 
         details = []
+        # Lines the pattern could not be searched on; never treated as clean
+        timed_out = []
 
         for patch in context.patches:
             if patch.filename not in context.filtered_files:
                 continue
 
-            # Parse patch to get actual line numbers
-            lines_with_numbers = parse_patch_lines_with_numbers(patch.patch)
+            # Parsed once per PR and shared by every line-scanning check
+            lines_with_numbers = context.get_patch_numbered_lines(patch)
+
+            candidates = None
+            if self._hyperscan_db is not None:
+                candidates = hyperscan_candidate_lines(
+                    self._hyperscan_db, patch.patch, context.get_patch_line_offsets(patch)
+                )
+            elif self._buffer_pattern is not None and (patch.patch or "").isascii():
+                candidates = regex_candidate_lines(
+                    self._buffer_pattern, patch.patch or "", context.get_patch_line_offsets(patch)
+                )
 
-            # Search in patch content
-            for line_content, line_number in lines_with_numbers:
-                if self.pattern.search(line_content):
+            # Search in patch content, visiting only candidate lines when a prefilter ran
+            indices = range(len(lines_with_numbers)) if candidates is None else sorted(candidates)
+            for index in indices:
+                line_content, line_number = lines_with_numbers[index]
+                try:
+                    found = search_pattern(self.pattern, line_content)
+                except TimeoutError:
+                    timed_out.append(CheckDetail(
+                        file_path=patch.filename,
+                        line_number=line_number,
+                        message=f"Pattern search timed out: {self.pattern.pattern}",
+                        suggestion="Simplify the pattern to avoid catastrophic backtracking"
+                    ))
+                    continue
+                if found:
                     details.append(CheckDetail(
                         file_path=patch.filename,
                         line_number=line_number,  # Actual file line number or None
@@ -277,15 +1167,19 @@ class PatternCheck(BaseCheck):
             passed = len(details) > 0
             if not passed:
                 message = f"Required pattern not found: {self.pattern.pattern}"
+                details = timed_out
             else:
                 message = f"Required pattern found {len(details)} time(s)"
         else:
-            # Should FORBID pattern - fail if found
-            passed = len(details) == 0
-            if not passed:
+            # Should FORBID pattern - fail if found, or if any line could not be searched
+            passed = len(details) == 0 and not timed_out
+            if details:
                 message = f"Forbidden pattern found {len(details)} time(s): {self.pattern.pattern}"
+            elif timed_out:
+                message = f"Pattern search timed out on {len(timed_out)} line(s): {self.pattern.pattern}"
             else:
                 message = "No forbidden patterns detected"
+            details = details + timed_out
 
         return CheckResult(
             passed=passed,
@@ -329,6 +1223,10 @@ class FileSizeCheck(BaseCheck):
         self.max_pr_lines = max_pr_lines
         self.logger = get_logger()
 
+    def definition(self) -> tuple:
+        """Extend the base definition with the size limits."""
+        return super().definition() + (self.max_file_size_kb, self.max_pr_lines)
+
     async def run(self, context: CheckContext) -> CheckResult:
         """Check file and PR sizes."""
         if not context.filtered_files:
@@ -340,20 +1238,22 @@ class FileSizeCheck(BaseCheck):
 
         details = []
         total_lines = 0
+        # Set lookups keep the patch loop linear in the number of files
+        filtered_files = set(context.filtered_files)
+        check_file_size = self.max_file_size_kb is not None
 
         for patch in context.patches:
-            if patch.filename not in context.filtered_files:
+            if patch.filename not in filtered_files:
                 continue
 
             # Count lines changed
-            lines_changed = patch.num_plus_lines + patch.num_minus_lines
-            total_lines += lines_changed
+            total_lines += patch.num_plus_lines + patch.num_minus_lines
 
             # Check file size if limit is set
-            if self.max_file_size_kb is not None:
+            if check_file_size:
                 # Estimate file size from patch (not perfect but reasonable)
                 # In a real implementation, you'd fetch actual file size from git provider
-                patch_size_kb = len(patch.patch.encode('utf-8')) / 1024
+                patch_size_kb = context.get_patch_bytes(patch) / 1024
 
                 if patch_size_kb > self.max_file_size_kb:
                     details.append(CheckDetail(
@@ -383,6 +1283,10 @@ class FileSizeCheck(BaseCheck):
         )
 
 
+# Characters that make a RequiredFilesCheck pattern a glob rather than a literal path
+_GLOB_CHARS_RE = re.compile(r"[*?\[]")
+
+
 class RequiredFilesCheck(BaseCheck):
     """
     Ensure certain files are modified together.
@@ -420,14 +1324,33 @@ class RequiredFilesCheck(BaseCheck):
         self.message_template = message
         self.logger = get_logger()
 
+        # Patterns without glob characters only match that exact path: test them with set lookups
+        self._trigger_names = frozenset(pattern for pattern in trigger_files if not _GLOB_CHARS_RE.search(pattern))
+        trigger_globs = [pattern for pattern in trigger_files if _GLOB_CHARS_RE.search(pattern)]
+
+        # Precompile glob patterns (fnmatch semantics) once instead of per file/pattern pair
+        self._trigger_regex = (
+            re.compile("|".join(fnmatch.translate(pattern) for pattern in trigger_globs))
+            if trigger_globs else None
+        )
+        self._required_regexes = [
+            (pattern, re.compile(fnmatch.translate(pattern)) if _GLOB_CHARS_RE.search(pattern) else None)
+            for pattern in required_files
+        ]
+
+    def definition(self) -> tuple:
+        """Extend the base definition with the trigger and required files."""
+        return super().definition() + (
+            tuple(self.trigger_files), tuple(self.required_files), self.message_template
+        )
+
     async def run(self, context: CheckContext) -> CheckResult:
         """Check if required files are modified together."""
         changed_files = set(context.files_changed)
 
         # Check if any trigger files were modified
-        trigger_matched = any(
-            any(fnmatch.fnmatch(f, pattern) for pattern in self.trigger_files)
-            for f in changed_files
+        trigger_matched = not self._trigger_names.isdisjoint(changed_files) or (
+            self._trigger_regex is not None and any(self._trigger_regex.match(f) for f in changed_files)
         )
 
         if not trigger_matched:
@@ -437,25 +1360,19 @@ class RequiredFilesCheck(BaseCheck):
                 severity="info"
             )
 
-        # Check if required files were also modified
-        required_matched = all(
-            any(fnmatch.fnmatch(f, pattern) for f in changed_files)
-            for pattern in self.required_files
-        )
+        # Find which required files are missing
+        missing = [
+            pattern for pattern, regex in self._required_regexes
+            if (pattern not in changed_files if regex is None else not any(regex.match(f) for f in changed_files))
+        ]
 
-        if required_matched:
+        if not missing:
             return CheckResult(
                 passed=True,
                 message="All required files were modified",
                 severity="info"
             )
 
-        # Find which required files are missing
-        missing = [
-            pattern for pattern in self.required_files
-            if not any(fnmatch.fnmatch(f, pattern) for f in changed_files)
-        ]
-
         details = [
             CheckDetail(
                 file_path="PR",
@@ -490,6 +1407,11 @@ class ForbiddenPatternsCheck(BaseCheck):
         (r'(?i)Bearer\s+[a-zA-Z0-9_\-\.]{20,}', "Bearer token detected"),
     ]
 
+    # Lowercase literals, at least one of which occurs in any match of DEFAULT_PATTERNS
+    DEFAULT_PATTERN_LITERALS: ClassVar[tuple[str, ...]] = (
+        "api", "passw", "pwd", "secret", "token", "aws_", "begin", "bearer",
+    )
+
     def __init__(
         self,
         name: str,
@@ -519,7 +1441,7 @@ class ForbiddenPatternsCheck(BaseCheck):
         # Compile default patterns
         for pattern, message in self.DEFAULT_PATTERNS:
             try:
-                compiled = re.compile(pattern)
+                compiled = compile_pattern(pattern)
                 self.patterns.append((compiled, message))
             except re.error as e:
                 self.logger.error(f"Invalid default pattern '{pattern}': {e}")
@@ -532,7 +1454,7 @@ class ForbiddenPatternsCheck(BaseCheck):
         if custom_patterns:
             for pattern, message in custom_patterns:
                 try:
-                    compiled = re.compile(pattern)
+                    compiled = compile_pattern(pattern, guarded=True)
                     self.patterns.append((compiled, message))
                 except re.error as e:
                     # Log error but skip invalid custom patterns
@@ -542,6 +1464,26 @@ class ForbiddenPatternsCheck(BaseCheck):
                     )
                     # Continue with other patterns rather than failing completely
 
+        # Literal prefilter for whole patches; custom patterns have no known literals
+        self._literals = None if custom_patterns else self.DEFAULT_PATTERN_LITERALS
+
+        # Single alternation of all patterns, used to skip clean lines with one search
+        self._combined_pattern = combine_patterns([compiled for compiled, _ in self.patterns])
+
+        # Optional Hyperscan prefilter, scanning each patch in one pass
+        self._hyperscan_db = build_hyperscan_database(
+            [compiled for compiled, _ in self.patterns],
+            lines_are_stripped=True
+        )
+        # Otherwise, one search of the combined pattern rules out patches with no match
+        self._buffer_pattern = None
+        if self._hyperscan_db is None and self._combined_pattern is not None:
+            self._buffer_pattern = buffer_scan_pattern(self._combined_pattern)
+
+    def definition(self) -> tuple:
+        """Extend the base definition with the patterns and their messages."""
+        return super().definition() + tuple((pattern.pattern, message) for pattern, message in self.patterns)
+
     async def run(self, context: CheckContext) -> CheckResult:
         """Search for forbidden secret patterns."""
         if not context.filtered_files:
@@ -552,38 +1494,102 @@ class ForbiddenPatternsCheck(BaseCheck):
             )
 
         details = []
+        # Lines a pattern could not be searched on; never treated as clean
+        timed_out = []
 
         for patch in context.patches:
             if patch.filename not in context.filtered_files:
                 continue
 
-            # Parse patch to get actual line numbers
-            lines_with_numbers = parse_patch_lines_with_numbers(patch.patch)
+            # Only added lines are scanned, from one buffer shared by the PR's checks
+            added_text, added_indices = context.get_patch_added_lines(patch)
 
-            # Only check added lines (lines starting with +)
-            for line_content, line_number in lines_with_numbers:
-                if not line_content.startswith('+'):
+            # Most patches add none of the patterns' literals - skip them without any regex work
+            if self._literals is not None:
+                added_lower = added_text.lower()
+                if not any(literal in added_lower for literal in self._literals):
                     continue
 
+            # Clean patches stop at the first search; lines are only visited after a hit
+            if self._buffer_pattern is not None and not regex_buffer_matches(self._buffer_pattern, added_text):
+                continue
+
+            # Parsed once per PR and shared by every line-scanning check
+            lines_with_numbers = context.get_patch_numbered_lines(patch)
+
+            # Hyperscan also reports which patterns may match each line
+            line_matches = None
+            if self._hyperscan_db is not None:
+                line_matches = hyperscan_line_matches(self._hyperscan_db, added_text)
+
+            positions = range(len(added_indices)) if line_matches is None else sorted(line_matches)
+            for position in positions:
+                line_content, line_number = lines_with_numbers[added_indices[position]]
+
                 # Remove the + prefix
                 content = line_content[1:]
 
-                # Check all patterns
-                for pattern, message in self.patterns:
-                    if pattern.search(content):
-                        details.append(CheckDetail(
-                            file_path=patch.filename,
-                            line_number=line_number,  # Actual file line number
-                            message=message,
-                            suggestion="Remove sensitive data and use environment variables or secret management"
-                        ))
+                if line_matches is None:
+                    pattern_indices = range(len(self.patterns))
+                else:
+                    # Only the patterns Hyperscan reported for this line need confirming
+                    pattern_indices = sorted(line_matches[position])
+
+                # Most lines match nothing - rule them out with a single search
+                # (one pattern left to confirm is searched on its own)
+                matched_indices = set()
+                if self._combined_pattern and len(pattern_indices) > 1:
+                    try:
+                        match = search_pattern(self._combined_pattern, content)
+                        if not match:
+                            continue
+                        # Continue the combined search past each match: every pattern that wins
+                        # a match is known to match without a search of its own
+                        while match:
+                            matched_indices.add(int(match.lastgroup[1:]))
+                            pos = match.end() if match.end() > match.start() else match.end() + 1
+                            if pos > len(content):
+                                break
+                            match = search_pattern(self._combined_pattern, content, pos)
+                    except TimeoutError:
+                        # One slow pattern must not hide the others: search each on its own
+                        pass
+
+                # Check the remaining patterns (a line may contain several secrets)
+                for pattern_index in pattern_indices:
+                    pattern, message = self.patterns[pattern_index]
+                    if pattern_index not in matched_indices:
+                        try:
+                            found = search_pattern(pattern, content)
+                        except TimeoutError:
+                            timed_out.append(CheckDetail(
+                                file_path=patch.filename,
+                                line_number=line_number,
+                                message=f"Pattern search timed out: {pattern.pattern}",
+                                suggestion="Simplify the custom pattern to avoid catastrophic backtracking"
+                            ))
+                            continue
+                        if not found:
+                            continue
+                    details.append(CheckDetail(
+                        file_path=patch.filename,
+                        line_number=line_number,  # Actual file line number
+                        message=message,
+                        suggestion="Remove sensitive data and use environment variables or secret management"
+                    ))
 
-        passed = len(details) == 0
+        # A line a pattern could not be searched on is not known to be clean
+        passed = len(details) == 0 and not timed_out
 
         if passed:
             message = "No secrets or sensitive data detected"
-        else:
+        elif details:
             message = f"⚠️ SECURITY: {len(details)} potential secret(s) detected"
+        else:
+            message = f"⚠️ SECURITY: pattern search timed out on {len(timed_out)} line(s)"
+        if details and timed_out:
+            message += f", pattern search timed out on {len(timed_out)} line(s)"
+        details = details + timed_out
 
         return CheckResult(
             passed=passed,
@@ -4,11 +4,49 @@
 Check context data for pre-merge checks.
 """
 
+import hashlib
+import re
 from dataclasses import dataclass, field
-from typing import Optional, Any
+from typing import Callable, Optional, Any
 
 from pr_agent.algo.types import FilePatchInfo
 
+# Hunk headers: @@ -start1,size1 +start2,size2 @@ optional_context
+_HUNK_HEADER_RE = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))?\ @@")
+
+
+def patch_line_numbers(lines: list[str]) -> list[Optional[int]]:
+    """
+    Map patch lines to their line numbers in the new file.
+
+    Uses hunk headers to track positions. Added (+) and context lines have
+    line numbers; hunk headers, file headers and deleted (-) lines have None.
+
+    Args:
+        lines: Patch split on newlines
+
+    Returns:
+        Line number in the new file (or None) for each patch line
+    """
+    numbers = []
+    current_line_number = None
+
+    for line in lines:
+        match = _HUNK_HEADER_RE.match(line)
+        if match:
+            # Extract start line in new file (start2)
+            current_line_number = int(match.group(3))
+            numbers.append(None)
+        elif current_line_number is None or line.startswith('-'):
+            # Before first hunk header, or a deleted line (not in the new file)
+            numbers.append(None)
+        else:
+            # Added or context line
+            numbers.append(current_line_number)
+            current_line_number += 1
+
+    return numbers
+
 
 @dataclass
 class CheckContext:
@@ -33,8 +71,145 @@ class CheckContext:
     # Git provider instance (for advanced checks)
     git_provider: Optional[Any] = None
 
-    # Configuration settings (for check-specific config)
+    # Configuration settings (for check-specific config); read through get_config()
     config: Optional[dict] = None
+    # Produces the settings dict on first use, so runs whose checks never read it skip the copy
+    config_getter: Optional[Callable[[], dict]] = None
 
     # Path filters (files relevant to this check)
     filtered_files: Optional[list[str]] = None
+    # Filtered copy keeping every changed file, shared by the checks whose filters keep them all
+    all_files_view: Optional["CheckContext"] = field(default=None, repr=False, compare=False)
+
+    # Derived per-patch views shared by all checks, keyed by filename
+    patch_lines: dict[str, list[str]] = field(default_factory=dict)
+    patch_bytes: dict[str, int] = field(default_factory=dict)
+    patch_line_offsets: dict[str, list[int]] = field(default_factory=dict)
+    patch_numbered_lines: dict[str, list[tuple[str, Optional[int]]]] = field(default_factory=dict)
+    patch_added_lines: dict[str, tuple[str, list[int]]] = field(default_factory=dict)
+    # Digests keyed by filename, stored with the patch text they were computed from
+    patch_digests: dict[str, tuple[str, bytes]] = field(default_factory=dict)
+
+    def get_config(self) -> Optional[dict]:
+        """
+        Get the configuration settings, materializing them from config_getter on first use.
+
+        Returns:
+            Configuration settings, or None if neither config nor config_getter is set
+        """
+        if self.config is None and self.config_getter is not None:
+            self.config = self.config_getter()
+        return self.config
+
+    def get_patch_lines(self, patch: FilePatchInfo) -> list[str]:
+        """
+        Get the lines of a patch, splitting it only once per PR.
+
+        Args:
+            patch: Patch to split
+
+        Returns:
+            Patch lines
+        """
+        lines = self.patch_lines.get(patch.filename)
+        if lines is None:
+            lines = (patch.patch or "").split('\n')
+            self.patch_lines[patch.filename] = lines
+        return lines
+
+    def get_patch_numbered_lines(self, patch: FilePatchInfo) -> list[tuple[str, Optional[int]]]:
+        """
+        Get (line, line number in the new file) pairs for a patch, parsing hunks only once per PR.
+
+        Args:
+            patch: Patch to parse
+
+        Returns:
+            Pairs in get_patch_lines order; the number is None for lines not in the new file
+        """
+        numbered = self.patch_numbered_lines.get(patch.filename)
+        if numbered is None:
+            lines = self.get_patch_lines(patch)
+            numbered = list(zip(lines, patch_line_numbers(lines)))
+            self.patch_numbered_lines[patch.filename] = numbered
+        return numbered
+
+    def get_patch_added_lines(self, patch: FilePatchInfo) -> tuple[str, list[int]]:
+        """
+        Get the added lines of a patch as one buffer, extracting them only once per PR.
+
+        Line ``i`` of the buffer is line ``indices[i]`` of ``get_patch_lines(patch)``
+        without its '+' prefix.
+
+        Args:
+            patch: Patch to extract from
+
+        Returns:
+            (added lines joined by newlines, their indices in get_patch_lines order)
+        """
+        added = self.patch_added_lines.get(patch.filename)
+        if added is None:
+            lines = self.get_patch_lines(patch)
+            indices = [index for index, line in enumerate(lines) if line.startswith('+')]
+            added = ('\n'.join(lines[index][1:] for index in indices), indices)
+            self.patch_added_lines[patch.filename] = added
+        return added
+
+    def get_patch_bytes(self, patch: FilePatchInfo) -> int:
+        """
+        Get the UTF-8 size of a patch, encoding it only once per PR.
+
+        Args:
+            patch: Patch to measure
+
+        Returns:
+            Patch size in bytes
+        """
+        size = self.patch_bytes.get(patch.filename)
+        if size is None:
+            text = patch.patch or ""
+            # ASCII strings (most diffs) are one byte per character; isascii() is O(1)
+            size = len(text) if text.isascii() else len(text.encode('utf-8'))
+            self.patch_bytes[patch.filename] = size
+        return size
+
+    def get_patch_digest(self, patch: FilePatchInfo) -> bytes:
+        """
+        Get the BLAKE2b digest of a patch's content, hashing it only once per PR.
+
+        The digest is recomputed if the patch text was replaced since it was
+        hashed, since it feeds persistent result cache keys.
+
+        Args:
+            patch: Patch to hash
+
+        Returns:
+            16-byte digest of the patch's UTF-8 encoding
+        """
+        text = patch.patch or ""
+        cached = self.patch_digests.get(patch.filename)
+        if cached is not None and cached[0] is text:
+            return cached[1]
+        digest = hashlib.blake2b(text.encode("utf-8", errors="surrogatepass"), digest_size=16).digest()
+        self.patch_digests[patch.filename] = (text, digest)
+        return digest
+
+    def get_patch_line_offsets(self, patch: FilePatchInfo) -> list[int]:
+        """
+        Get the byte offsets of the newlines in a patch's UTF-8 encoding, computing them only once per PR.
+
+        A match ending at byte offset ``end`` lies on line
+        ``bisect_left(offsets, end - 1)`` of ``get_patch_lines(patch)``.
+
+        Args:
+            patch: Patch to index
+
+        Returns:
+            Sorted newline byte offsets
+        """
+        offsets = self.patch_line_offsets.get(patch.filename)
+        if offsets is None:
+            data = (patch.patch or "").encode("utf-8", errors="surrogatepass")
+            offsets = [match.start() for match in re.finditer(b"\n", data)]
+            self.patch_line_offsets[patch.filename] = offsets
+        return offsets
@@ -8,8 +8,12 @@ import asyncio
 from typing import Optional
 
 from pr_agent.checks.base_check import BaseCheck
+from pr_agent.checks.built_in_checks import (BatchedFreeTextEvaluator,
+                                             FreeTextRuleCheck)
 from pr_agent.checks.check_context import CheckContext
 from pr_agent.checks.check_result import CheckResult
+from pr_agent.checks.result_cache import (CACHE_POLICIES, CheckCacheMissError,
+                                          CheckResultCache)
 from pr_agent.config_loader import get_settings
 from pr_agent.log import get_logger
 
@@ -22,15 +26,31 @@ class CheckOrchestrator:
     to the git provider.
     """
 
-    def __init__(self, checks: list[BaseCheck]):
+    def __init__(self, checks: list[BaseCheck], result_cache: Optional[CheckResultCache] = None):
         """
         Initialize the orchestrator with a list of checks.
 
         Args:
             checks: List of check instances to execute
+            result_cache: Persistent result cache (defaults to config when a cache policy is set)
         """
         self.checks = checks
         self.logger = get_logger()
+        self._blocking_names = frozenset(check.name for check in checks if check.mode == "blocking")
+        checks_settings = get_settings().get("checks", {})
+
+        # Bound concurrent LLM calls to avoid provider rate limits and retry storms
+        max_llm_concurrency = checks_settings.get("max_llm_concurrency", 4)
+        self._llm_semaphore = asyncio.Semaphore(max(1, max_llm_concurrency))
+
+        self._cache_policy = checks_settings.get("cache_policy", "disabled")
+        if self._cache_policy not in CACHE_POLICIES:
+            self.logger.warning(f"Unknown checks cache_policy '{self._cache_policy}', caching disabled")
+            self._cache_policy = "disabled"
+        if self._cache_policy == "disabled":
+            self._result_cache = None
+        else:
+            self._result_cache = result_cache or CheckResultCache()
 
     async def run_all(self, context: CheckContext) -> dict[str, CheckResult]:
         """
@@ -42,33 +62,205 @@ class CheckOrchestrator:
         Returns:
             Dictionary mapping check names to results
         """
-        parallel_execution = get_settings().get("checks", {}).get("parallel_execution", True)
+        checks_settings = get_settings().get("checks", {})
+        parallel_execution = checks_settings.get("parallel_execution", True)
+
+        llm_checks = [check for check in self.checks if isinstance(check, FreeTextRuleCheck)]
+        if parallel_execution and checks_settings.get("batch_rules", False) and len(llm_checks) > 1:
+            return await self._run_rule_batches(context, llm_checks, checks_settings.get("max_rules_per_batch", 3))
+        if parallel_execution and checks_settings.get("batch_llm_checks", False) and len(llm_checks) > 1:
+            return await self._run_batched(context, llm_checks)
 
         if parallel_execution:
             return await self._run_parallel(context)
         else:
             return await self._run_sequential(context)
 
-    async def _run_parallel(self, context: CheckContext) -> dict[str, CheckResult]:
+    async def _run_batched(
+        self,
+        context: CheckContext,
+        llm_checks: list[FreeTextRuleCheck]
+    ) -> dict[str, CheckResult]:
+        """
+        Execute checks in parallel, submitting all free-text rule evaluations as one batch.
+
+        Args:
+            context: Check context
+            llm_checks: Free-text rule checks to evaluate together
+
+        Returns:
+            Results dictionary
+        """
+        self.logger.info(f"Running {len(self.checks)} checks with {len(llm_checks)} batched LLM evaluations")
+
+        results: dict[str, CheckResult] = {}
+        pending = []
+        filtered_contexts = self._filter_contexts(context, self.checks)
+        for check in llm_checks:
+            try:
+                filtered_context = filtered_contexts[check.name]
+                if filtered_context.filtered_files is not None and len(filtered_context.filtered_files) == 0:
+                    results[check.name] = CheckResult(
+                        passed=True,
+                        message="No relevant files to check",
+                        severity="info"
+                    )
+                    continue
+
+                input_hash = None
+                if self._result_cache is not None:
+                    input_hash = self._result_cache.input_hash(filtered_context, check)
+                    cached_result = await self._get_cached_result(check, filtered_context, input_hash)
+                    if cached_result is not None:
+                        results[check.name] = cached_result
+                        continue
+
+                prepared = check.prepare_evaluation(filtered_context)
+                if isinstance(prepared, CheckResult):
+                    results[check.name] = prepared
+                else:
+                    pending.append((check, prepared, filtered_context, input_hash))
+            except Exception as e:
+                self.logger.error(f"Check {check.name} failed with exception: {e}")
+                results[check.name] = check.error_result(e)
+
+        local_checks = [check for check in self.checks if check not in llm_checks]
+
+        async def evaluate_pending() -> list:
+            if not pending:
+                return []
+            ai_handler = pending[0][0].ai_handler
+            return await ai_handler.batch_chat_completion(
+                [prepared.request() for _, prepared, _, _ in pending],
+                semaphore=self._llm_semaphore
+            )
+
+        # Send the batch before local checks occupy the event loop, so they run while it is in flight
+        responses, local_results = await asyncio.gather(
+            evaluate_pending(),
+            self._run_parallel(context, local_checks, filtered_contexts)
+        )
+        results.update(local_results)
+
+        for (check, prepared, filtered_context, input_hash), response in zip(pending, responses):
+            if isinstance(response, BaseException):
+                self.logger.error(f"Check {check.name} failed with exception: {response}")
+                results[check.name] = check.error_result(response)
+                continue
+            try:
+                results[check.name] = check.complete_evaluation(prepared, response)
+                await self._store_result(check, filtered_context, input_hash, results[check.name])
+            except Exception as e:
+                self.logger.error(f"Check {check.name} failed with exception: {e}")
+                results[check.name] = check.error_result(e)
+
+        return {check.name: results[check.name] for check in self.checks if check.name in results}
+
+    async def _run_rule_batches(
+        self,
+        context: CheckContext,
+        llm_checks: list[FreeTextRuleCheck],
+        max_rules_per_batch: int
+    ) -> dict[str, CheckResult]:
+        """
+        Execute checks in parallel, evaluating free-text rules that see the same files in shared prompts.
+
+        Args:
+            context: Check context
+            llm_checks: Free-text rule checks to evaluate
+            max_rules_per_batch: Maximum number of rules evaluated by one model call
+
+        Returns:
+            Results dictionary
+        """
+        self.logger.info(f"Running {len(self.checks)} checks with {len(llm_checks)} free-text rules in shared prompts")
+
+        results: dict[str, CheckResult] = {}
+        filtered_contexts = self._filter_contexts(context, self.checks)
+        # Checks with identical path specs share one filtered context, and so one prompt
+        groups: dict[int, tuple[CheckContext, list[FreeTextRuleCheck]]] = {}
+        input_hashes: dict[str, str] = {}
+        for check in llm_checks:
+            try:
+                filtered_context = filtered_contexts[check.name]
+                if filtered_context.filtered_files is not None and len(filtered_context.filtered_files) == 0:
+                    results[check.name] = CheckResult(
+                        passed=True,
+                        message="No relevant files to check",
+                        severity="info"
+                    )
+                    continue
+
+                if self._result_cache is not None:
+                    input_hash = self._result_cache.input_hash(filtered_context, check)
+                    cached_result = await self._get_cached_result(check, filtered_context, input_hash)
+                    if cached_result is not None:
+                        results[check.name] = cached_result
+                        continue
+                    input_hashes[check.name] = input_hash
+
+                groups.setdefault(id(filtered_context), (filtered_context, []))[1].append(check)
+            except Exception as e:
+                self.logger.error(f"Check {check.name} failed with exception: {e}")
+                results[check.name] = check.error_result(e)
+
+        evaluator = BatchedFreeTextEvaluator(max_rules_per_batch, self._llm_semaphore)
+        local_checks = [check for check in self.checks if check not in llm_checks]
+
+        # Start the model calls before local checks occupy the event loop
+        *group_results, local_results = await asyncio.gather(
+            *(evaluator.evaluate(filtered_context, checks) for filtered_context, checks in groups.values()),
+            self._run_parallel(context, local_checks, filtered_contexts)
+        )
+        results.update(local_results)
+
+        for (filtered_context, checks), group_result in zip(groups.values(), group_results):
+            for check in checks:
+                results[check.name] = group_result[check.name]
+                await self._store_result(
+                    check, filtered_context, input_hashes.get(check.name), group_result[check.name]
+                )
+
+        return {check.name: results[check.name] for check in self.checks if check.name in results}
+
+    async def _run_parallel(
+        self,
+        context: CheckContext,
+        checks: Optional[list[BaseCheck]] = None,
+        filtered_contexts: Optional[dict[str, CheckContext]] = None
+    ) -> dict[str, CheckResult]:
         """
         Execute checks in parallel.
 
+        Free-text checks are started first: local checks run on the event loop
+        without yielding, so starting them first would delay the LLM requests
+        until every local check had finished.
+
         Args:
             context: Check context
+            checks: Checks to execute (defaults to all checks)
+            filtered_contexts: Contexts already filtered per check name
 
         Returns:
             Results dictionary
         """
-        self.logger.info(f"Running {len(self.checks)} checks in parallel")
+        if checks is None:
+            checks = self.checks
+        if filtered_contexts is None:
+            filtered_contexts = self._filter_contexts(context, checks)
+
+        self.logger.info(f"Running {len(checks)} checks in parallel")
 
+        # Stable sort: LLM-bound checks first, otherwise in configured order
+        ordered_checks = sorted(checks, key=lambda check: not isinstance(check, FreeTextRuleCheck))
         tasks = []
-        for check in self.checks:
-            tasks.append(self._run_single_check(check, context))
+        for check in ordered_checks:
+            tasks.append(self._run_single_check(check, context, filtered_contexts.get(check.name)))
 
         results_list = await asyncio.gather(*tasks, return_exceptions=True)
 
         results = {}
-        for check, result in zip(self.checks, results_list):
+        for check, result in zip(ordered_checks, results_list):
             if isinstance(result, Exception):
                 self.logger.error(f"Check {check.name} failed with exception: {result}")
                 results[check.name] = CheckResult(
@@ -79,7 +271,7 @@ class CheckOrchestrator:
             else:
                 results[check.name] = result
 
-        return results
+        return {check.name: results[check.name] for check in checks}
 
     async def _run_sequential(self, context: CheckContext) -> dict[str, CheckResult]:
         """
@@ -93,10 +285,11 @@ class CheckOrchestrator:
         """
         self.logger.info(f"Running {len(self.checks)} checks sequentially")
 
+        filtered_contexts = self._filter_contexts(context, self.checks)
         results = {}
         for check in self.checks:
             try:
-                result = await self._run_single_check(check, context)
+                result = await self._run_single_check(check, context, filtered_contexts.get(check.name))
                 results[check.name] = result
             except Exception as e:
                 self.logger.error(f"Check {check.name} failed with exception: {e}")
@@ -108,13 +301,45 @@ class CheckOrchestrator:
 
         return results
 
-    async def _run_single_check(self, check: BaseCheck, context: CheckContext) -> CheckResult:
+    def _filter_contexts(self, context: CheckContext, checks: list[BaseCheck]) -> dict[str, CheckContext]:
+        """
+        Filter the context for each check, matching the file list once per distinct path spec.
+
+        Checks with identical include/exclude patterns share compiled path specs,
+        so in the common case (no paths configured) the file list is walked once
+        for all checks instead of once per check.
+
+        Args:
+            context: Check context
+            checks: Checks to filter for
+
+        Returns:
+            Filtered contexts keyed by check name
+        """
+        filtered_by_spec: dict[tuple[int, int], CheckContext] = {}
+        filtered_contexts = {}
+        for check in checks:
+            spec_key = (id(check._path_spec), id(check._exclude_spec))
+            filtered_context = filtered_by_spec.get(spec_key)
+            if filtered_context is None:
+                filtered_context = check.filter_context(context)
+                filtered_by_spec[spec_key] = filtered_context
+            filtered_contexts[check.name] = filtered_context
+        return filtered_contexts
+
+    async def _run_single_check(
+        self,
+        check: BaseCheck,
+        context: CheckContext,
+        filtered_context: Optional[CheckContext] = None
+    ) -> CheckResult:
         """
         Execute a single check with logging.
 
         Args:
             check: Check to execute
             context: Check context
+            filtered_context: Context already filtered for this check
 
         Returns:
             Check result
@@ -122,7 +347,8 @@ class CheckOrchestrator:
         self.logger.info(f"Running check: {check.name} ({check.mode} mode)")
 
         # Filter context for this check
-        filtered_context = check.filter_context(context)
+        if filtered_context is None:
+            filtered_context = check.filter_context(context)
 
         # Skip if no relevant files
         if filtered_context.filtered_files is not None and len(filtered_context.filtered_files) == 0:
@@ -133,12 +359,91 @@ class CheckOrchestrator:
                 severity="info"
             )
 
+        input_hash = None
+        if self._result_cache is not None:
+            input_hash = self._result_cache.input_hash(filtered_context, check)
+            cached_result = await self._get_cached_result(check, filtered_context, input_hash)
+            if cached_result is not None:
+                return cached_result
+
         # Run the check
-        result = await check.run(filtered_context)
+        if isinstance(check, FreeTextRuleCheck):
+            async with self._llm_semaphore:
+                result = await check.run(filtered_context)
+        else:
+            result = await check.run(filtered_context)
+
+        await self._store_result(check, filtered_context, input_hash, result)
 
         self.logger.info(f"Check {check.name} completed: {result}")
         return result
 
+    async def _get_cached_result(
+        self,
+        check: BaseCheck,
+        context: CheckContext,
+        input_hash: str
+    ) -> Optional[CheckResult]:
+        """
+        Look up a stored result according to the cache policy.
+
+        Args:
+            check: Check about to run
+            context: Check context filtered for the check
+            input_hash: Digest of the check's inputs
+
+        Returns:
+            Stored result, or None if the check should run
+
+        Raises:
+            CheckCacheMissError: In replay mode, when no result is stored
+        """
+        if self._cache_policy not in ("enabled", "read-only", "replay"):
+            return None
+
+        try:
+            cached_result = await self._result_cache.get(check.name, context.pr_url, input_hash)
+        except Exception as e:
+            self.logger.warning(f"Failed to read cached result for check {check.name}: {e}")
+            cached_result = None
+
+        if cached_result is not None:
+            self.logger.info(f"Check {check.name}: using cached result")
+            return cached_result
+
+        if self._cache_policy == "replay":
+            raise CheckCacheMissError(f"No cached result for check {check.name} on {context.pr_url}")
+
+        return None
+
+    async def _store_result(
+        self,
+        check: BaseCheck,
+        context: CheckContext,
+        input_hash: Optional[str],
+        result: CheckResult
+    ):
+        """
+        Store a fresh result according to the cache policy.
+
+        Evaluation errors are not stored so that a transient failure is retried.
+
+        Args:
+            check: Check that produced the result
+            context: Check context filtered for the check
+            input_hash: Digest of the check's inputs
+            result: Result to store
+        """
+        if input_hash is None or self._cache_policy not in ("enabled", "write-only"):
+            return
+        if result.severity == "error" and not result.passed and not result.details:
+            return
+
+        try:
+            await self._result_cache.put(check.name, context.pr_url, input_hash, result)
+        except Exception as e:
+            self.logger.warning(f"Failed to store result for check {check.name}: {e}")
+
     def has_blocking_failures(self, results: dict[str, CheckResult]) -> bool:
         """
         Determine if any blocking checks failed.
@@ -149,9 +454,11 @@ class CheckOrchestrator:
         Returns:
             True if any blocking check failed
         """
-        for check in self.checks:
-            if check.mode == "blocking":
-                result = results.get(check.name)
-                if result and not result.passed:
-                    return True
-        return False
+        if not self._blocking_names:
+            return False
+
+        return any(
+            not result.passed
+            for name, result in results.items()
+            if name in self._blocking_names
+        )
@@ -0,0 +1,170 @@
+# AGPL-3.0 License
+
+"""
+Persistent cache of check results.
+
+Results are keyed by check name, PR URL and a digest of the check's
+definition and the inputs it saw, so threshold or reporting changes can be iterated on by
+replaying stored results instead of re-running (and re-paying for) checks.
+"""
+
+import hashlib
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+import aiosqlite
+
+from pr_agent.algo import json_utils
+from pr_agent.checks.base_check import BaseCheck
+from pr_agent.checks.check_context import CheckContext
+from pr_agent.checks.check_result import CheckDetail, CheckResult
+from pr_agent.config_loader import get_settings
+from pr_agent.log import get_logger
+
+CACHE_POLICIES = ("enabled", "read-only", "write-only", "replay", "disabled")
+
+
+class CheckCacheMissError(Exception):
+    """Raised in replay mode when a check has no stored result for its inputs."""
+
+
+class CheckResultCache:
+    """
+    Stores check results in SQLite, keyed by (check_name, pr_url, input_hash).
+
+    Uses aiosqlite for async access, like the dashboard metrics collector.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Initialize result cache.
+
+        Args:
+            db_path: Path of the SQLite database (defaults to config)
+        """
+        self.logger = get_logger()
+
+        if db_path is None:
+            db_path = get_settings().get("checks", {}).get("cache_db_path", "~/.pr_agent/cache/checks.db")
+
+        self.db_path = str(Path(db_path).expanduser())
+        self._initialized = False
+
+    async def initialize(self):
+        """
+        Initialize database schema.
+
+        Creates the results table if it doesn't exist.
+        """
+        if self._initialized:
+            return
+
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.execute("""
+                CREATE TABLE IF NOT EXISTS check_results (
+                    check_name TEXT NOT NULL,
+                    pr_url TEXT NOT NULL,
+                    input_hash TEXT NOT NULL,
+                    result_json TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    PRIMARY KEY (check_name, pr_url, input_hash)
+                )
+            """)
+            await db.commit()
+
+        self._initialized = True
+
+    @staticmethod
+    def input_hash(context: CheckContext, check: Optional[BaseCheck] = None) -> str:
+        """
+        Compute the digest of the inputs a check evaluates.
+
+        Args:
+            context: Check context filtered for the check
+            check: Check being run; its definition (patterns, thresholds, rule,
+                model) is part of the digest so configuration changes miss the cache
+
+        Patch contents enter the digest through their per-file digests, which
+        are computed once per PR and shared by every check's filtered context.
+
+        Returns:
+            Hex SHA-256 digest of the check definition, PR title, description
+            and relevant patches
+        """
+        hasher = hashlib.sha256()
+        if check is not None:
+            hasher.update(repr(check.definition()).encode())
+            hasher.update(b"\0")
+        hasher.update(context.pr_title.encode())
+        hasher.update(b"\0")
+        hasher.update(context.pr_description.encode())
+
+        filtered_files = context.filtered_files
+        for patch in sorted(context.patches, key=lambda p: p.filename):
+            if filtered_files is not None and patch.filename not in filtered_files:
+                continue
+            hasher.update(b"\0")
+            hasher.update(patch.filename.encode())
+            hasher.update(b"\0")
+            hasher.update(context.get_patch_digest(patch))
+
+        return hasher.hexdigest()
+
+    async def get(self, check_name: str, pr_url: str, input_hash: str) -> Optional[CheckResult]:
+        """
+        Look up a stored result.
+
+        Args:
+            check_name: Name of the check
+            pr_url: URL of the PR
+            input_hash: Digest from input_hash
+
+        Returns:
+            Stored result, or None on a miss
+        """
+        await self.initialize()
+
+        async with aiosqlite.connect(self.db_path) as db:
+            async with db.execute(
+                "SELECT result_json FROM check_results WHERE check_name = ? AND pr_url = ? AND input_hash = ?",
+                (check_name, pr_url, input_hash)
+            ) as cursor:
+                row = await cursor.fetchone()
+
+        if row is None:
+            return None
+
+        data = json_utils.loads(row[0])
+        data["details"] = [CheckDetail(**detail) for detail in data.get("details", [])]
+        return CheckResult(**data)
+
+    @staticmethod
+    def _encode_result(result: CheckResult) -> str:
+        """Serialize a result to the JSON text stored in result_json."""
+        return json_utils.dumps(asdict(result)).decode()
+
+    async def put(self, check_name: str, pr_url: str, input_hash: str, result: CheckResult):
+        """
+        Store a result, replacing any previous result for the same key.
+
+        Args:
+            check_name: Name of the check
+            pr_url: URL of the PR
+            input_hash: Digest from input_hash
+            result: Result to store
+        """
+        await self.initialize()
+
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.execute(
+                """
+                INSERT OR REPLACE INTO check_results (check_name, pr_url, input_hash, result_json, created_at)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (check_name, pr_url, input_hash, self._encode_result(result), datetime.now().isoformat())
+            )
+            await db.commit()
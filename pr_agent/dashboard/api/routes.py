@@ -7,9 +7,11 @@ Provides endpoints for metrics, trends, and analytics.
 """
 
 from fastapi import FastAPI, HTTPException, Query
+from fastapi.responses import JSONResponse, ORJSONResponse
 from typing import Optional
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
+from pr_agent.algo.json_utils import ORJSON_AVAILABLE
 from pr_agent.config_loader import get_settings
 from pr_agent.log import get_logger
 
@@ -17,7 +19,9 @@ from pr_agent.log import get_logger
 app = FastAPI(
     title="PR-Agent Dashboard API",
     description="Metrics and analytics for PR-Agent",
-    version="1.0.0"
+    version="1.0.0",
+    # Encode every response with orjson when it is installed
+    default_response_class=ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
 )
 
 logger = get_logger()
@@ -47,9 +51,10 @@ async def get_metrics_overview(
     # This is a placeholder for Feature 7 implementation
     logger.info(f"Fetching metrics overview for repo={repo}, days={days}")
 
+    now = datetime.now(timezone.utc)
     return {
-        "period_start": (datetime.now() - timedelta(days=days)).isoformat(),
-        "period_end": datetime.now().isoformat(),
+        "period_start": (now - timedelta(days=days)).isoformat(),
+        "period_end": now.isoformat(),
         "total_prs_reviewed": 0,
         "total_findings": 0,
         "total_checks_run": 0,
@@ -4,15 +4,100 @@
 Metrics collection and storage.
 """
 
+import asyncio
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Any, AsyncIterator, Optional
 import aiosqlite
 
+from pr_agent.algo import json_utils
 from pr_agent.config_loader import get_settings
 from pr_agent.log import get_logger
 
 
+# Applied to every pooled connection. WAL with synchronous=NORMAL avoids an fsync per
+# commit and lets readers proceed while a write is in progress; the rest keep temp
+# tables in memory and give each connection a 256 MiB mmap window and 64 MiB page cache.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+
+# Maximum number of queued metric events written in one transaction
+_FLUSH_BATCH_SIZE = 500
+
+# Timestamps are stored as INTEGER unix microseconds: smaller index entries and
+# integer comparisons instead of ISO-8601 string comparisons
+_CREATE_METRICS_TABLE = """
+    CREATE TABLE IF NOT EXISTS metrics (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp INTEGER NOT NULL,
+        repository TEXT NOT NULL,
+        metric_type TEXT NOT NULL,
+        metric_value REAL NOT NULL,
+        metadata BLOB
+    )
+"""
+
+
+# get_metrics filters, in the order their bits appear in the query mask
+_METRICS_FILTERS = (
+    "repository = ?",
+    "metric_type = ?",
+    "timestamp >= ?",
+    "timestamp <= ?",
+    # Metadata is stored as JSON bytes; the cast keeps SQLite >= 3.45 from reading the BLOB as JSONB
+    "json_extract(CAST(metadata AS TEXT), ?) = ?",
+)
+
+
+# Columns returned by get_metrics, in order
+_METRICS_COLUMNS = ("id", "timestamp", "repository", "metric_type", "metric_value", "metadata")
+
+
+def _build_metrics_query(mask: int) -> str:
+    """Build the get_metrics query for a combination of filters."""
+    query = f"SELECT {', '.join(_METRICS_COLUMNS)} FROM metrics WHERE 1=1"
+    for bit, condition in enumerate(_METRICS_FILTERS):
+        if mask & (1 << bit):
+            query += f" AND {condition}"
+    return query + " ORDER BY timestamp DESC LIMIT ?"
+
+
+# One fixed SQL string per filter combination, so each pooled connection's
+# statement cache reuses the prepared statement
+_METRICS_QUERIES: dict[int, str] = {
+    mask: _build_metrics_query(mask) for mask in range(1 << len(_METRICS_FILTERS))
+}
+
+
+def _dump_metadata(metadata: dict) -> bytes:
+    """Serialize metric metadata to JSON bytes."""
+    return json_utils.dumps(metadata)
+
+
+def _load_metadata(data) -> Optional[dict]:
+    """Deserialize metric metadata stored as JSON bytes (or text, in older rows)."""
+    if not data:
+        return None
+    return json_utils.loads(data)
+
+
+def _to_micros(timestamp: datetime) -> int:
+    """Convert a datetime to unix microseconds."""
+    return round(timestamp.timestamp() * 1_000_000)
+
+
+def _from_micros(micros: int) -> datetime:
+    """Convert unix microseconds to a datetime."""
+    return datetime.fromtimestamp(micros / 1_000_000)
+
+
 @dataclass
 class MetricEvent:
     """
@@ -25,6 +110,80 @@ class MetricEvent:
     metadata: dict
 
 
+class SQLiteConnectionPool:
+    """
+    A small pool of long-lived aiosqlite connections.
+
+    Reusing connections keeps SQLite's page cache warm and avoids paying
+    connection setup and teardown on every query.
+    """
+
+    def __init__(self, db_path: str, size: int = 4):
+        """
+        Initialize connection pool.
+
+        Args:
+            db_path: Path to the SQLite database
+            size: Maximum number of open connections
+        """
+        self.db_path = db_path
+        self.size = max(1, size)
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._connections: list[aiosqlite.Connection] = []
+        self._opened = 0
+
+    async def _open(self) -> aiosqlite.Connection:
+        """Open a new connection and apply the connection pragmas."""
+        db = await aiosqlite.connect(self.db_path)
+        db.row_factory = aiosqlite.Row
+        try:
+            for pragma in _CONNECTION_PRAGMAS:
+                await db.execute(pragma)
+        except Exception:
+            await db.close()
+            raise
+        return db
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[aiosqlite.Connection]:
+        """
+        Acquire a connection, opening one lazily while the pool is below its size.
+
+        Yields:
+            An open connection, returned to the pool on exit
+        """
+        try:
+            db = self._idle.get_nowait()
+        except asyncio.QueueEmpty:
+            if self._opened < self.size:
+                # Reserve the slot before awaiting so concurrent callers can't overshoot the size
+                self._opened += 1
+                try:
+                    db = await self._open()
+                except Exception:
+                    self._opened -= 1
+                    raise
+                self._connections.append(db)
+            else:
+                db = await self._idle.get()
+
+        try:
+            yield db
+        except Exception:
+            await db.rollback()
+            raise
+        finally:
+            self._idle.put_nowait(db)
+
+    async def close(self):
+        """Close all connections opened by the pool."""
+        for db in self._connections:
+            await db.close()
+        self._connections = []
+        self._opened = 0
+        self._idle = asyncio.Queue()
+
+
 class MetricsCollector:
     """
     Collects and stores metrics for the dashboard.
@@ -50,8 +209,22 @@ class MetricsCollector:
         else:
             self.db_path = ".pr_agent_metrics.db"
 
+        self._pool_size = get_settings().get("dashboard", {}).get("db_pool_size", 4)
+        self.refresh_config()
+        self._pool: Optional[SQLiteConnectionPool] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._flusher_task: Optional[asyncio.Task] = None
+        self._init_lock = asyncio.Lock()
         self._initialized = False
 
+    def refresh_config(self):
+        """
+        Re-read settings that are snapshotted at construction time.
+
+        Call after reloading settings so record_metric sees the new values.
+        """
+        self._enabled = bool(get_settings().get("dashboard", {}).get("enabled", False))
+
     async def initialize(self):
         """
         Initialize database schema.
@@ -61,77 +234,153 @@ class MetricsCollector:
         if self._initialized:
             return
 
-        async with aiosqlite.connect(self.db_path) as db:
-            # Create metrics table
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS metrics (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    timestamp TEXT NOT NULL,
-                    repository TEXT NOT NULL,
-                    metric_type TEXT NOT NULL,
-                    metric_value REAL NOT NULL,
-                    metadata TEXT
-                )
-            """)
+        async with self._init_lock:
+            # Another caller may have finished initializing while this one waited
+            if self._initialized:
+                return
+
+            if self._pool is None:
+                self._pool = SQLiteConnectionPool(self.db_path, self._pool_size)
+
+            async with self._pool.connection() as db:
+                # Create metrics table
+                await db.execute(_CREATE_METRICS_TABLE)
+
+                async with db.execute("PRAGMA table_info(metrics)") as cursor:
+                    column_types = {row[1]: row[2] for row in await cursor.fetchall()}
+                if column_types.get("timestamp", "").upper() == "TEXT":
+                    await self._migrate_text_timestamps(db)
+
+                # Create indices for common queries
+                await db.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_metrics_timestamp
+                    ON metrics(timestamp)
+                """)
 
-            # Create indices for common queries
-            await db.execute("""
-                CREATE INDEX IF NOT EXISTS idx_metrics_timestamp
-                ON metrics(timestamp)
-            """)
+                # Serves get_metrics filtered by repository (and type) without a sort step
+                await db.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_metrics_repo_type_ts
+                    ON metrics(repository, metric_type, timestamp DESC)
+                """)
 
-            await db.execute("""
-                CREATE INDEX IF NOT EXISTS idx_metrics_repository
-                ON metrics(repository)
-            """)
+                # Superseded by the composite index above
+                await db.execute("DROP INDEX IF EXISTS idx_metrics_repository")
+                await db.execute("DROP INDEX IF EXISTS idx_metrics_type")
 
-            await db.execute("""
-                CREATE INDEX IF NOT EXISTS idx_metrics_type
-                ON metrics(metric_type)
-            """)
+                await db.commit()
+
+            # Metric events are queued and written in batches by a background task
+            self._queue = asyncio.Queue()
+            self._flusher_task = asyncio.create_task(self._flush_loop())
+
+            self._initialized = True
+            self.logger.info(f"Metrics database initialized at {self.db_path}")
 
-            await db.commit()
+    async def _migrate_text_timestamps(self, db: aiosqlite.Connection):
+        """
+        Rebuild a metrics table created with ISO-8601 TEXT timestamps.
 
-        self._initialized = True
-        self.logger.info(f"Metrics database initialized at {self.db_path}")
+        Args:
+            db: Open connection
+        """
+        self.logger.info("Migrating metrics timestamps to unix microseconds")
+
+        # Renaming moves the old indices along, so they are dropped with the old table
+        await db.execute("ALTER TABLE metrics RENAME TO metrics_text_timestamps")
+        await db.execute(_CREATE_METRICS_TABLE)
+
+        async with db.execute(
+            "SELECT id, timestamp, repository, metric_type, metric_value, metadata FROM metrics_text_timestamps"
+        ) as cursor:
+            rows = await cursor.fetchall()
+
+        await db.executemany(
+            """
+            INSERT INTO metrics (id, timestamp, repository, metric_type, metric_value, metadata)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (row_id, _to_micros(datetime.fromisoformat(timestamp)), repository, metric_type, value, metadata)
+                for row_id, timestamp, repository, metric_type, value, metadata in rows
+            ]
+        )
+        await db.execute("DROP TABLE metrics_text_timestamps")
 
     async def record_metric(self, event: MetricEvent):
         """
         Record a metric event.
 
+        The event is queued and written by the background flush task.
+
         Args:
             event: Metric event to record
         """
         # Check if dashboard is enabled
-        if not get_settings().get("dashboard", {}).get("enabled", False):
+        if not self._enabled:
             self.logger.debug("Dashboard metrics collection is disabled")
             return
 
         await self.initialize()
 
-        try:
-            import json
+        self._queue.put_nowait(event)
+        self.logger.debug(f"Queued metric: {event.metric_type} for {event.repository}")
+
+    async def _flush_loop(self):
+        """
+        Drain queued events, writing up to _FLUSH_BATCH_SIZE of them per transaction.
+        """
+        while True:
+            events = [await self._queue.get()]
+            while len(events) < _FLUSH_BATCH_SIZE:
+                try:
+                    events.append(self._queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            try:
+                await self._write_events(events)
+            finally:
+                for _ in events:
+                    self._queue.task_done()
+
+    async def _write_events(self, events: list[MetricEvent]):
+        """
+        Write metric events in a single transaction.
 
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute(
+        Args:
+            events: Events to write
+        """
+        try:
+            async with self._pool.connection() as db:
+                await db.executemany(
                     """
                     INSERT INTO metrics (timestamp, repository, metric_type, metric_value, metadata)
                     VALUES (?, ?, ?, ?, ?)
                     """,
-                    (
-                        event.timestamp.isoformat(),
-                        event.repository,
-                        event.metric_type,
-                        event.metric_value,
-                        json.dumps(event.metadata)
-                    )
+                    [
+                        (
+                            _to_micros(event.timestamp),
+                            event.repository,
+                            event.metric_type,
+                            event.metric_value,
+                            _dump_metadata(event.metadata)
+                        )
+                        for event in events
+                    ]
                 )
                 await db.commit()
 
-            self.logger.debug(f"Recorded metric: {event.metric_type} for {event.repository}")
+            self.logger.debug(f"Recorded {len(events)} metric(s)")
 
         except Exception as e:
-            self.logger.error(f"Failed to record metric: {e}")
+            self.logger.error(f"Failed to record {len(events)} metric(s): {e}")
+
+    async def flush(self):
+        """
+        Wait until all queued metric events have been written.
+        """
+        if self._queue is not None:
+            await self._queue.join()
 
     async def get_metrics(
         self,
@@ -139,7 +388,9 @@ class MetricsCollector:
         metric_type: Optional[str] = None,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-        limit: int = 1000
+        limit: int = 1000,
+        metadata_field: Optional[str] = None,
+        metadata_value: Any = None
     ) -> list[dict]:
         """
         Query metrics from database.
@@ -150,41 +401,107 @@ class MetricsCollector:
             start_date: Filter by start date
             end_date: Filter by end date
             limit: Maximum number of results
+            metadata_field: Top-level metadata key to filter on (e.g. "pr_id")
+            metadata_value: Value the metadata key must equal
 
         Returns:
-            List of metric records
+            List of metric records, with metadata decoded
         """
-        await self.initialize()
-
-        query = "SELECT * FROM metrics WHERE 1=1"
-        params = []
-
-        if repository:
-            query += " AND repository = ?"
-            params.append(repository)
+        table = await self.get_metrics_rows(
+            repository=repository,
+            metric_type=metric_type,
+            start_date=start_date,
+            end_date=end_date,
+            limit=limit,
+            metadata_field=metadata_field,
+            metadata_value=metadata_value
+        )
+        columns = table["columns"]
+        return [dict(zip(columns, row)) for row in table["rows"]]
+
+    async def get_metrics_rows(
+        self,
+        repository: Optional[str] = None,
+        metric_type: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 1000,
+        metadata_field: Optional[str] = None,
+        metadata_value: Any = None
+    ) -> dict:
+        """
+        Query metrics from database as column names plus row tuples.
 
-        if metric_type:
-            query += " AND metric_type = ?"
-            params.append(metric_type)
+        Cheaper than get_metrics for large results that are serialized
+        straight back out, since no per-row dict is built.
 
-        if start_date:
-            query += " AND timestamp >= ?"
-            params.append(start_date.isoformat())
+        Args:
+            repository: Filter by repository
+            metric_type: Filter by metric type
+            start_date: Filter by start date
+            end_date: Filter by end date
+            limit: Maximum number of results
+            metadata_field: Top-level metadata key to filter on (e.g. "pr_id")
+            metadata_value: Value the metadata key must equal
 
-        if end_date:
-            query += " AND timestamp <= ?"
-            params.append(end_date.isoformat())
+        Returns:
+            {"columns": [...], "rows": [(...), ...]}, with metadata decoded
+        """
+        await self.initialize()
 
-        query += " ORDER BY timestamp DESC LIMIT ?"
+        # Bound parameters of each filter in _METRICS_FILTERS, or None when unset
+        filters = (
+            (repository,) if repository else None,
+            (metric_type,) if metric_type else None,
+            (_to_micros(start_date),) if start_date else None,
+            (_to_micros(end_date),) if end_date else None,
+            (f'$."{metadata_field}"', metadata_value) if metadata_field else None,
+        )
+        mask = 0
+        params = []
+        for bit, values in enumerate(filters):
+            if values is not None:
+                mask |= 1 << bit
+                params.extend(values)
         params.append(limit)
+        query = _METRICS_QUERIES[mask]
+
+        # Make recently recorded events visible to the query
+        await self.flush()
 
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                db.row_factory = aiosqlite.Row
-                async with db.execute(query, params) as cursor:
-                    rows = await cursor.fetchall()
-                    return [dict(row) for row in rows]
+            async with self._pool.connection() as db:
+                rows = await db.execute_fetchall(query, params)
+
+            return {
+                "columns": list(_METRICS_COLUMNS),
+                "rows": [
+                    (row_id, _from_micros(timestamp).isoformat(), repo, kind, value, _load_metadata(metadata))
+                    for row_id, timestamp, repo, kind, value, metadata in rows
+                ],
+            }
 
         except Exception as e:
             self.logger.error(f"Failed to query metrics: {e}")
-            return []
+            return {"columns": [], "rows": []}
+
+    async def close(self):
+        """
+        Write queued metric events and close pooled database connections.
+
+        The pool is reopened lazily if the collector is used again.
+        """
+        if self._flusher_task is not None:
+            await self.flush()
+            self._flusher_task.cancel()
+            try:
+                await self._flusher_task
+            except asyncio.CancelledError:
+                pass
+            self._flusher_task = None
+            self._queue = None
+
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+        self._initialized = False
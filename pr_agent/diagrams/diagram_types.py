@@ -7,7 +7,7 @@ Diagram type definitions.
 from enum import Enum
 
 
-class DiagramType(Enum):
+class DiagramType(str, Enum):
     """
     Types of diagrams that can be generated.
     """
@@ -42,10 +42,14 @@ class DiagramType(Enum):
             ValueError: If value doesn't match any diagram type
         """
         try:
-            return cls(value.lower())
-        except ValueError:
-            valid_types = [dt.value for dt in cls]
-            raise ValueError(f"Invalid diagram type '{value}'. Valid types: {valid_types}")
+            return _DIAGRAM_TYPE_LOOKUP[value.lower()]
+        except KeyError:
+            valid_types = list(_DIAGRAM_TYPE_LOOKUP)
+            raise ValueError(f"Invalid diagram type '{value}'. Valid types: {valid_types}") from None
 
     def __str__(self) -> str:
         return self.value
+
+
+# Built after the class body; an attribute defined inside it would become an enum member
+_DIAGRAM_TYPE_LOOKUP: dict[str, DiagramType] = {dt.value: dt for dt in DiagramType}
@@ -40,7 +40,7 @@ class FeedbackEvent(Enum):
     """User bypassed a blocking check"""
 
 
-@dataclass
+@dataclass(slots=True)
 class FeedbackEventData:
     """
     Complete data for a feedback event.
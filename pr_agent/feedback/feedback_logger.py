@@ -4,16 +4,35 @@
 Feedback event logging and storage.
 """
 
+import asyncio
+from collections import Counter, OrderedDict
 from pathlib import Path
-from typing import Optional
-import json
+from typing import BinaryIO, ClassVar, Optional
 
+from pr_agent.algo import json_utils
 from pr_agent.feedback.feedback_event import FeedbackEvent, FeedbackEventData
 from pr_agent.feedback.preference import Preference
 from pr_agent.config_loader import get_settings
 from pr_agent.log import get_logger
 
 
+# Direction of the signal each event type gives; other event types are neutral
+_EVENT_SIGNS = {
+    FeedbackEvent.SUGGESTION_APPLIED: 1,
+    FeedbackEvent.COMMENT_RESOLVED: 1,
+    FeedbackEvent.THUMBS_UP: 1,
+    FeedbackEvent.SUGGESTION_DISMISSED: -1,
+    FeedbackEvent.THUMBS_DOWN: -1,
+    FeedbackEvent.FINDING_DISPUTED: -1,
+    FeedbackEvent.CHECK_BYPASSED: -1,
+}
+
+# Same step and confidence scale as Preference.update_with_feedback: each
+# signal moves the weight by 0.1, and confidence reaches 1.0 at 10 signals
+_WEIGHT_STEP = 0.1
+_CONFIDENCE_SAMPLES = 10.0
+
+
 class FeedbackLogger:
     """
     Logs user feedback events and manages preference extraction.
@@ -22,6 +41,10 @@ class FeedbackLogger:
     preference models for tuning suggestions.
     """
 
+    # Append handles kept open at once; the least recently written log is
+    # closed first, so servers handling many repositories stay bounded
+    MAX_OPEN_WRITERS: ClassVar[int] = 16
+
     def __init__(self, storage_path: Optional[str] = None):
         """
         Initialize feedback logger.
@@ -42,6 +65,21 @@ class FeedbackLogger:
         self.events_dir.mkdir(parents=True, exist_ok=True)
         self.preferences_dir.mkdir(parents=True, exist_ok=True)
 
+        # Open append-only event logs, keyed by (repository file prefix, day),
+        # least recently written first
+        self._writers: "OrderedDict[tuple[str, str], BinaryIO]" = OrderedDict()
+        self._write_lock = asyncio.Lock()
+
+        self.refresh_config()
+
+    def refresh_config(self):
+        """
+        Re-read settings that are snapshotted at construction time.
+
+        Call after reloading settings so log_event sees the new values.
+        """
+        self._enabled = bool(get_settings().get("feedback", {}).get("enabled", False))
+
     async def log_event(self, event: FeedbackEventData) -> None:
         """
         Log a feedback event.
@@ -50,24 +88,124 @@ class FeedbackLogger:
             event: Feedback event data to log
         """
         # Check if feedback is enabled
-        if not get_settings().get("feedback", {}).get("enabled", False):
+        if not self._enabled:
             self.logger.debug("Feedback logging is disabled")
             return
 
         try:
-            # Create event file (one file per event for simplicity)
-            timestamp_str = event.timestamp.strftime("%Y%m%d_%H%M%S_%f")
-            filename = f"{event.repository.replace('/', '_')}_{timestamp_str}.json"
-            filepath = self.events_dir / filename
-
-            with open(filepath, "w") as f:
-                json.dump(event.to_dict(), f, indent=2)
+            # Append to one JSONL log per repository per day, encoded through to_dict()
+            line = json_utils.dumps(event, append_newline=True)
+            async with self._write_lock:
+                await asyncio.to_thread(
+                    self._append_line,
+                    event.repository.replace("/", "_"),
+                    event.timestamp.strftime("%Y%m%d"),
+                    line
+                )
 
             self.logger.debug(f"Logged feedback event: {event.event_type.value}")
 
         except Exception as e:
             self.logger.error(f"Failed to log feedback event: {e}")
 
+    def _append_line(self, repo_safe: str, day: str, line: bytes) -> None:
+        """
+        Append a line to a repository's event log (blocking; run off the event loop).
+
+        Args:
+            repo_safe: Repository identifier with slashes replaced
+            day: Day of the event as YYYYMMDD
+            line: Serialized event, newline-terminated
+        """
+        writer = self._get_writer(repo_safe, day)
+        writer.write(line)
+        writer.flush()
+
+    def _get_writer(self, repo_safe: str, day: str) -> BinaryIO:
+        """
+        Get the append handle for a repository's event log, rotating it by day.
+
+        At most MAX_OPEN_WRITERS handles stay open; opening another closes the
+        least recently written one.
+
+        Args:
+            repo_safe: Repository identifier with slashes replaced
+            day: Day of the event as YYYYMMDD
+
+        Returns:
+            Open binary file handle
+        """
+        key = (repo_safe, day)
+        writer = self._writers.get(key)
+        if writer is not None:
+            self._writers.move_to_end(key)
+            return writer
+
+        # Close the repository's logs for previous days
+        for stale_key in [stale_key for stale_key in self._writers if stale_key[0] == repo_safe]:
+            self._writers.pop(stale_key).close()
+        while len(self._writers) >= self.MAX_OPEN_WRITERS:
+            self._writers.popitem(last=False)[1].close()
+
+        writer = open(self.events_dir / f"{repo_safe}_{day}.jsonl", "ab")
+        self._writers[key] = writer
+        return writer
+
+    async def close(self) -> None:
+        """
+        Close open event logs.
+        """
+        async with self._write_lock:
+            writers = list(self._writers.values())
+            self._writers.clear()
+            await asyncio.to_thread(self._close_writers, writers)
+
+    @staticmethod
+    def _close_writers(writers: list[BinaryIO]) -> None:
+        """Close event log handles (blocking)."""
+        for writer in writers:
+            writer.close()
+
+    async def load_events(self, repository: str) -> list[FeedbackEventData]:
+        """
+        Load logged feedback events for a repository.
+
+        Reads the JSONL event logs as well as legacy one-file-per-event JSON files.
+
+        Args:
+            repository: Repository identifier (e.g., "owner/repo")
+
+        Returns:
+            List of feedback events
+        """
+        return await asyncio.to_thread(self._load_events_sync, repository)
+
+    def _load_events_sync(self, repository: str) -> list[FeedbackEventData]:
+        """Blocking implementation of load_events."""
+        repo_safe = repository.replace("/", "_")
+        events = []
+
+        for filepath in sorted(self.events_dir.glob(f"{repo_safe}_*")):
+            try:
+                with open(filepath, "r") as f:
+                    if filepath.suffix == ".jsonl":
+                        records = [json_utils.loads(line) for line in f if line.strip()]
+                    elif filepath.suffix == ".json":
+                        records = [json_utils.loads(f.read())]
+                    else:
+                        continue
+            except Exception as e:
+                self.logger.error(f"Failed to read feedback events from {filepath}: {e}")
+                continue
+
+            # The file prefix is ambiguous ("a/b" and "a/b_c" share "a_b_"), so match on the record
+            events.extend(
+                FeedbackEventData.from_dict(record) for record in records
+                if record.get("repository") == repository
+            )
+
+        return events
+
     async def load_preferences(self, repository: str) -> list[Preference]:
         """
         Load preferences for a repository.
@@ -81,12 +219,10 @@ class FeedbackLogger:
         repo_safe = repository.replace("/", "_")
         filepath = self.preferences_dir / f"{repo_safe}.json"
 
-        if not filepath.exists():
-            return []
-
         try:
-            with open(filepath, "r") as f:
-                data = json.load(f)
+            data = await asyncio.to_thread(self._read_json, filepath)
+            if data is None:
+                return []
             return [Preference.from_dict(p) for p in data]
         except Exception as e:
             self.logger.error(f"Failed to load preferences for {repository}: {e}")
@@ -104,12 +240,23 @@ class FeedbackLogger:
         filepath = self.preferences_dir / f"{repo_safe}.json"
 
         try:
-            with open(filepath, "w") as f:
-                json.dump([p.to_dict() for p in preferences], f, indent=2)
+            await asyncio.to_thread(self._write_json, filepath, [p.to_dict() for p in preferences])
             self.logger.debug(f"Saved {len(preferences)} preferences for {repository}")
         except Exception as e:
             self.logger.error(f"Failed to save preferences for {repository}: {e}")
 
+    @staticmethod
+    def _read_json(filepath: Path):
+        """Read a JSON file, returning None if it doesn't exist (blocking)."""
+        if not filepath.exists():
+            return None
+        return json_utils.loads(filepath.read_bytes())
+
+    @staticmethod
+    def _write_json(filepath: Path, data) -> None:
+        """Write a JSON file (blocking)."""
+        filepath.write_bytes(json_utils.dumps(data, indent=True))
+
     async def extract_preferences(self, repository: str) -> list[Preference]:
         """
         Extract preferences from logged events for a repository.
@@ -122,10 +269,65 @@ class FeedbackLogger:
         Returns:
             List of extracted preferences
         """
-        # This is a placeholder for the actual preference extraction logic
-        # which will be implemented in Feature 6
-        self.logger.info(f"Extracting preferences for {repository}")
+        events = await self.load_events(repository)
+        self.logger.info(f"Extracting preferences for {repository} from {len(events)} events")
+
+        # One (pattern_type, pattern) observation per signal the event carries
+        labels = []
+        signs = []
+        for event in events:
+            sign = _EVENT_SIGNS.get(event.event_type)
+            if sign is None:
+                continue
+            if event.finding_category:
+                labels.append(("suggestion_category", event.finding_category))
+                signs.append(sign)
+            if event.file_path and Path(event.file_path).suffix:
+                labels.append(("file_type", f"*{Path(event.file_path).suffix}"))
+                signs.append(sign)
+
+        min_samples = get_settings().get("feedback", {}).get("min_samples_for_preference", 5)
+        return self._aggregate_preferences(labels, signs, min_samples)
+
+    @staticmethod
+    def _aggregate_preferences(
+        labels: list[tuple[str, str]],
+        signs: list[int],
+        min_samples: int
+    ) -> list[Preference]:
+        """
+        Group feedback signals by pattern and turn each group into a preference.
 
-        # For now, just return empty list
-        # TODO: Implement preference extraction algorithm
-        return []
+        Thresholds:
+            - weight: net signal (positive minus negative) times _WEIGHT_STEP
+              (0.1), clamped to [-1, 1]; the clamp applies to the total, so
+              unlike repeated update_with_feedback calls the order of signals
+              does not matter
+            - confidence: sample count / _CONFIDENCE_SAMPLES (10), capped at 1.0
+            - patterns with fewer than min_samples signals (the
+              feedback.min_samples_for_preference setting, 5 by default) are
+              dropped
+
+        Args:
+            labels: (pattern_type, pattern) of each signal
+            signs: +1 or -1 for each signal
+            min_samples: Minimum signals for a pattern to become a preference
+
+        Returns:
+            Preferences, ordered by pattern type and pattern
+        """
+        counts = Counter(labels)
+        net = Counter()
+        for label, sign in zip(labels, signs):
+            net[label] += sign
+        return [
+            Preference(
+                pattern_type=pattern_type,
+                pattern=pattern,
+                weight=max(-1.0, min(1.0, net[(pattern_type, pattern)] * _WEIGHT_STEP)),
+                confidence=min(1.0, count / _CONFIDENCE_SAMPLES),
+                sample_count=count
+            )
+            for (pattern_type, pattern), count in sorted(counts.items())
+            if count >= min_samples
+        ]
@@ -7,7 +7,7 @@ Preference model for learned team preferences.
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Preference:
     """
     A learned preference pattern from user feedback.
@@ -6,12 +6,14 @@ rule merging, allowing teams to customize behavior for different parts of a mono
 """
 
 from pr_agent.path_config.config_discovery import ConfigDiscovery
-from pr_agent.path_config.config_merger import ConfigMerger, MergeStrategy
+from pr_agent.path_config.config_merger import (ConfigMerger, LayeredConfig,
+                                                MergeStrategy)
 from pr_agent.path_config.config_resolver import ConfigResolver
 
 __all__ = [
     'ConfigDiscovery',
     'ConfigMerger',
     'ConfigResolver',
+    'LayeredConfig',
     'MergeStrategy',
 ]
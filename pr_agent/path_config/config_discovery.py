@@ -4,10 +4,11 @@ Configuration discovery module for finding .pr_agent.toml files in a repository.
 This module implements Task 2.1 from Feature 2: Configuration Discovery
 """
 
-from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Optional, Set
-import hashlib
+import os
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple, Union
 
 from pr_agent.log import get_logger
 
@@ -18,14 +19,41 @@ CONFIG_FILENAMES = [
     'pr_agent.toml',
     '.pr-agent.toml',
 ]
+_CONFIG_FILENAME_SET = frozenset(CONFIG_FILENAMES)
 
 
-@dataclass(frozen=True)
-class ConfigFile:
+def resolve_repo_root(repo_root: Union[str, Path]) -> Path:
+    """
+    Resolve a repository root to an absolute path without symlinks.
+
+    Absolute roots are resolved once per process, so the resolver, discovery and
+    merger built for the same repository share one resolution. Relative roots
+    depend on the working directory and are resolved on every call.
+
+    Args:
+        repo_root: Root directory of the repository
+
+    Returns:
+        Resolved repository root
+    """
+    path = os.fspath(repo_root)
+    if not os.path.isabs(path):
+        return Path(path).resolve()
+    return _resolve_absolute_root(path)
+
+
+@lru_cache(maxsize=64)
+def _resolve_absolute_root(path: str) -> Path:
+    """Resolve an absolute repository root for resolve_repo_root."""
+    return Path(path).resolve()
+
+
+class ConfigFile(NamedTuple):
     """
     Represents a discovered configuration file with its metadata.
 
-    Frozen for immutability since it's used in sets and as cache keys.
+    A NamedTuple rather than a frozen dataclass: immutable and hashable, with
+    cheaper construction and a smaller footprint per discovered config.
     """
     path: Path
     depth: int  # Depth from repository root (0 = root)
@@ -51,9 +79,16 @@ class ConfigDiscovery:
             repo_root: Root directory of the repository
             max_depth: Maximum depth to search for config files (security limit)
         """
-        self.repo_root = Path(repo_root).resolve()
+        self.repo_root = resolve_repo_root(repo_root)
+        # The upward walk works on plain strings; Path objects are only built for results
+        self._root_str = str(self.repo_root)
+        self._root_prefix = os.path.join(self._root_str, "")
         self.max_depth = max_depth
-        self._cache: dict[str, List[ConfigFile]] = {}
+        self._cache: dict[FrozenSet[str], List[ConfigFile]] = {}
+        # Per-directory lookup results, shared by all changed files under the same directories
+        self._dir_config_cache: dict[str, Optional[ConfigFile]] = {}
+        # Configs from each fully walked directory up to the root, nearest first
+        self._chain_cache: dict[str, Tuple[ConfigFile, ...]] = {}
         self.logger = get_logger()
 
     def discover_configs(self, changed_files: List[str]) -> List[ConfigFile]:
@@ -71,8 +106,9 @@ class ConfigDiscovery:
         Returns:
             List of ConfigFile objects sorted by depth (root first)
         """
-        # Generate cache key based on changed files
-        cache_key = self._generate_cache_key(changed_files)
+        # Key the cache by the set of changed files; dict hashes frozensets
+        # natively, so no sorting, joining or digesting is needed
+        cache_key = frozenset(changed_files)
 
         # Check cache first
         if cache_key in self._cache:
@@ -102,21 +138,29 @@ class ConfigDiscovery:
         Returns:
             List of ConfigFile objects sorted by depth (root first)
         """
-        discovered_configs: Set[ConfigFile] = set()
+        # Deduplicate by path string; hashing a ConfigFile hashes all three fields
+        discovered_configs: Dict[str, ConfigFile] = {}
 
         # Always check for root config
-        root_config = self._find_config_at_path(self.repo_root)
+        root_config = self._find_config_at_path(self._root_str)
         if root_config:
-            discovered_configs.add(root_config)
-
-        # Check each changed file's directory hierarchy
-        for file_path in changed_files:
-            file_abs_path = self.repo_root / file_path
-            configs = self._walk_up_from_file(file_abs_path)
-            discovered_configs.update(configs)
+            discovered_configs[str(root_config.path)] = root_config
+
+        # Walk each unique directory's hierarchy once, shallowest first, so deeper
+        # walks stop as soon as they reach an ancestor that was already covered
+        # Project to parent directories first, so paths are only joined and
+        # normalized once per directory rather than once per changed file
+        unique_parents = dict.fromkeys(os.path.dirname(file_path) for file_path in changed_files)
+        directories = {
+            os.path.normpath(os.path.join(self._root_str, parent)) for parent in unique_parents
+        }
+        visited: Dict[str, int] = {}
+        for directory in sorted(directories, key=lambda d: d.count(os.sep)):
+            for config in self._walk_up_from_directory(directory, visited):
+                discovered_configs.setdefault(str(config.path), config)
 
         # Sort by depth (root first)
-        sorted_configs = sorted(discovered_configs, key=lambda c: c.depth)
+        sorted_configs = sorted(discovered_configs.values(), key=attrgetter("depth"))
 
         return sorted_configs
 
@@ -130,16 +174,31 @@ class ConfigDiscovery:
         Returns:
             List of discovered ConfigFile objects
         """
-        configs: List[ConfigFile] = []
+        # Start from the file's parent directory. Changed files are files (or,
+        # for deleted files, no longer exist), so no stat is needed to decide
+        return self._walk_up_from_directory(os.path.dirname(os.fspath(file_path)))
+
+    def _walk_up_from_directory(
+        self,
+        start_dir: Union[str, Path],
+        visited: Optional[Dict[str, int]] = None
+    ) -> List[ConfigFile]:
+        """
+        Walk up the directory tree from a directory, finding all config files.
 
-        # Start from the file's parent directory
-        # For files and non-existent paths (e.g., new files in PR), use parent
-        # Only use the path itself if it's actually a directory
-        if file_path.is_dir():
-            current_dir = file_path
-        else:
-            # Either a file or doesn't exist - use parent in both cases
-            current_dir = file_path.parent
+        Args:
+            start_dir: Absolute path of the directory to start from
+            visited: Directories already walked by earlier calls, mapped to the depth
+                they were reached at. The walk stops at a directory that an earlier
+                walk reached with at least as much of the depth budget left.
+
+        Returns:
+            List of discovered ConfigFile objects
+        """
+        configs: List[ConfigFile] = []
+        current_dir = os.fspath(start_dir)
+        walked: List[Tuple[str, Optional[ConfigFile]]] = []
+        chain: Optional[Tuple[ConfigFile, ...]] = None
 
         # Walk up the tree
         depth = 0
@@ -148,7 +207,7 @@ class ConfigDiscovery:
             if depth > self.max_depth:
                 self.logger.warning(
                     f"Maximum config search depth ({self.max_depth}) reached",
-                    extra={"file_path": str(file_path), "max_depth": self.max_depth}
+                    extra={"start_dir": str(start_dir), "max_depth": self.max_depth}
                 )
                 break
 
@@ -156,30 +215,91 @@ class ConfigDiscovery:
             if not self._is_within_repo(current_dir):
                 break
 
+            # Everything above this directory has already been walked
+            if visited is not None:
+                if visited.get(current_dir, self.max_depth + 1) <= depth:
+                    break
+                visited[current_dir] = depth
+
+            # Splice in the chain of an earlier walk through this directory,
+            # keeping only the configs within the remaining depth budget
+            chain = self._chain_cache.get(current_dir)
+            if chain is not None:
+                budget = self.max_depth - depth
+                dir_depth = self._relative_depth(current_dir)
+                configs.extend(c for c in chain if dir_depth - c.depth <= budget)
+                if dir_depth > budget:
+                    self.logger.warning(
+                        f"Maximum config search depth ({self.max_depth}) reached",
+                        extra={"start_dir": str(start_dir), "max_depth": self.max_depth}
+                    )
+                break
+
             # Look for config file at this level
             config = self._find_config_at_path(current_dir)
+            walked.append((current_dir, config))
             if config:
                 configs.append(config)
 
             # Stop if we've reached the repo root
-            if current_dir == self.repo_root:
+            if current_dir == self._root_str:
+                chain = ()
                 break
 
             # Move up one directory
-            parent = current_dir.parent
+            parent = os.path.dirname(current_dir)
             if parent == current_dir:  # Reached filesystem root
                 break
 
             current_dir = parent
             depth += 1
 
+        # Once the chain above the walk is known, every directory walked shares it
+        if chain is not None:
+            for directory, config in reversed(walked):
+                if config:
+                    chain = (config,) + chain
+                self._chain_cache[directory] = chain
+
         return configs
 
-    def _find_config_at_path(self, directory: Path) -> Optional[ConfigFile]:
+    def _relative_depth(self, directory: str) -> int:
         """
-        Find a config file in the specified directory.
+        Get the number of directory components between the repository root and a directory.
+
+        Args:
+            directory: Directory within the repository
+
+        Returns:
+            0 for the root, 1 for its subdirectories, etc.
+        """
+        if directory == self._root_str:
+            return 0
+        return directory[len(self._root_prefix):].count(os.sep) + 1
+
+    def _find_config_at_path(self, directory: str) -> Optional[ConfigFile]:
+        """
+        Find a config file in the specified directory, looking each directory up only once.
+
+        Args:
+            directory: Directory to search in
+
+        Returns:
+            ConfigFile if found, None otherwise
+        """
+        if directory in self._dir_config_cache:
+            return self._dir_config_cache[directory]
+
+        config = self._scan_config_at_path(directory)
+        self._dir_config_cache[directory] = config
+        return config
+
+    def _scan_config_at_path(self, directory: str) -> Optional[ConfigFile]:
+        """
+        Find a config file in the specified directory on disk.
 
         Checks for config files in order of precedence defined in CONFIG_FILENAMES.
+        The directory is listed once rather than probing each candidate name.
 
         Args:
             directory: Directory to search in
@@ -187,32 +307,42 @@ class ConfigDiscovery:
         Returns:
             ConfigFile if found, None otherwise
         """
+        try:
+            with os.scandir(directory) as entries:
+                # DirEntry.is_file() uses the type from readdir; only symlinks need a stat
+                present = {
+                    entry.name for entry in entries
+                    if entry.name in _CONFIG_FILENAME_SET and entry.is_file()
+                }
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            return None
+
         for config_name in CONFIG_FILENAMES:
-            config_path = directory / config_name
-            if config_path.is_file():
-                try:
-                    relative_path = config_path.relative_to(self.repo_root)
-                    # Depth is number of directory components (excluding the filename)
-                    # Root config has 1 part (filename only) -> depth 0
-                    # src/.pr_agent.toml has 2 parts -> depth 1, etc.
-                    depth = len(relative_path.parts) - 1
-
-                    return ConfigFile(
-                        path=config_path,
-                        depth=depth,
-                        relative_path=relative_path
-                    )
-                except ValueError:
+            if config_name in present:
+                config_path = os.path.join(directory, config_name)
+                if directory == self._root_str:
+                    relative_dir = ""
+                elif directory.startswith(self._root_prefix):
+                    relative_dir = directory[len(self._root_prefix):]
+                else:
                     # Path is not relative to repo_root
                     self.logger.warning(
                         f"Config file found outside repository: {config_path}",
-                        extra={"config_path": str(config_path), "repo_root": str(self.repo_root)}
+                        extra={"config_path": config_path, "repo_root": self._root_str}
                     )
                     continue
 
+                # Depth is number of directory components (excluding the filename)
+                # Root config -> depth 0, src/.pr_agent.toml -> depth 1, etc.
+                return ConfigFile(
+                    path=Path(config_path),
+                    depth=self._relative_depth(directory),
+                    relative_path=Path(relative_dir, config_name)
+                )
+
         return None
 
-    def _is_within_repo(self, path: Path) -> bool:
+    def _is_within_repo(self, path: Union[str, Path]) -> bool:
         """
         Check if a path is within the repository root.
 
@@ -222,31 +352,15 @@ class ConfigDiscovery:
         Returns:
             True if path is within repo, False otherwise
         """
-        try:
-            path.relative_to(self.repo_root)
-            return True
-        except ValueError:
-            return False
-
-    def _generate_cache_key(self, changed_files: List[str]) -> str:
-        """
-        Generate a cache key for a set of changed files.
-
-        Args:
-            changed_files: List of file paths
-
-        Returns:
-            Hash-based cache key
-        """
-        # Sort files for consistent hashing
-        sorted_files = sorted(changed_files)
-        content = '|'.join(sorted_files)
-        # Use SHA-256 for cache key (non-cryptographic use, but avoids security linter warnings)
-        return hashlib.sha256(content.encode()).hexdigest()
+        # String prefix comparison avoids relative_to's Path allocation and ValueError
+        path = os.fspath(path)
+        return path == self._root_str or path.startswith(self._root_prefix)
 
     def clear_cache(self) -> None:
         """Clear the discovery cache. Useful for testing or long-running processes."""
         self._cache.clear()
+        self._dir_config_cache.clear()
+        self._chain_cache.clear()
         self.logger.debug("Cleared config discovery cache")
 
     def get_cache_size(self) -> int:
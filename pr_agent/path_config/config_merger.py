@@ -4,16 +4,41 @@ Configuration merger module for path-based configuration merging.
 This module implements Task 2.2 from Feature 2: Path-Based Merge Rules
 """
 
+from collections import OrderedDict
+from collections.abc import Mapping
 from enum import Enum
+from itertools import chain
 from pathlib import Path
-from typing import Any, ClassVar, Dict, List, Optional
+from typing import Any, ClassVar, Dict, Iterator, List, Optional, Set, Tuple
 import tomllib
 import copy
+import hashlib
+import mmap
+import os
+import re
 
 from jinja2.exceptions import SecurityError
 from pr_agent.log import get_logger
 from pr_agent.custom_merge_loader import validate_file_security
-from pr_agent.path_config.config_discovery import ConfigFile
+from pr_agent.path_config.config_discovery import ConfigFile, resolve_repo_root
+
+
+def _compile_prefix_pattern(prefixes: List[str]) -> "re.Pattern[str]":
+    """
+    Compile a list of literal prefixes into a single anchored alternation.
+
+    pattern.match(key) is equivalent to any(key.startswith(p) for p in prefixes),
+    but runs as one C-level regex match per key.
+
+    Args:
+        prefixes: Prefixes to match
+
+    Returns:
+        Compiled pattern; never matches if prefixes is empty
+    """
+    if not prefixes:
+        return re.compile(r"(?!)")
+    return re.compile("(?:" + "|".join(re.escape(prefix) for prefix in prefixes) + ")")
 
 
 class MergeStrategy(Enum):
@@ -29,6 +54,110 @@ class MergeStrategy(Enum):
     INHERIT = "inherit"
 
 
+# Directive value -> strategy; a dict lookup avoids Enum.__call__ and its ValueError path
+_MERGE_STRATEGIES: Dict[str, MergeStrategy] = {strategy.value: strategy for strategy in MergeStrategy}
+
+_MISSING = object()
+
+
+class LayeredConfig(Mapping):
+    """
+    Read-only view of merged configuration layers.
+
+    Each validated config file is kept as a separate layer, and a top-level
+    section is merged across the layers only when it is first read. Callers
+    that consult a handful of settings skip merging the rest of the config.
+    Merging is per section, so the result equals merging all files eagerly.
+    Each section is copied when it is merged, so values read from the view
+    never share objects with the merger's parse cache.
+    """
+
+    def __init__(
+        self,
+        merger: "ConfigMerger",
+        base: Dict[str, Any],
+        layers: List[Tuple[ConfigFile, Dict[str, Any]]]
+    ):
+        """
+        Initialize the layered view.
+
+        Args:
+            merger: ConfigMerger providing the merge rules
+            base: Base configuration, below all layers
+            layers: (ConfigFile, parsed data) pairs sorted by depth
+        """
+        self._merger = merger
+        self._base = base
+        self._layers = layers
+        # Key order matches an eager merge: base keys first, then new keys in layer order
+        self._keys = dict.fromkeys(chain(base, *(data for _, data in layers)))
+        self._sections: Dict[str, Any] = {}
+        # Nested lookups by key parts, including misses (stored as _MISSING)
+        self._paths: Dict[Tuple[str, ...], Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._sections:
+            return self._sections[key]
+        if key not in self._keys:
+            raise KeyError(key)
+
+        value = self._base.get(key, _MISSING)
+        for config_file, data in self._layers:
+            if key not in data:
+                continue
+            if value is _MISSING:
+                value = data[key]
+            else:
+                value = self._merger._merge_value(
+                    value, data, key, config_file, is_root=(config_file.depth == 0)
+                )
+
+        # Layer data is shared with the parse cache; hand out a private copy
+        value = copy.deepcopy(value)
+        self._sections[key] = value
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        return f"LayeredConfig({self.to_dict()!r})"
+
+    def get_path(self, parts: Tuple[str, ...], default: Any = None) -> Any:
+        """
+        Look up a nested setting by its key parts, resolving each path only once.
+
+        Args:
+            parts: Keys from the top-level section down, e.g. ("pr_reviewer", "num_max_findings")
+            default: Value returned when the path does not exist
+
+        Returns:
+            The setting value, or default if not found
+        """
+        value = self._paths.get(parts, _MISSING)
+        if value is _MISSING and parts not in self._paths:
+            value = self
+            try:
+                for part in parts:
+                    value = value[part]
+            except (KeyError, TypeError):
+                value = _MISSING
+            self._paths[parts] = value
+        return default if value is _MISSING else value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Merge every section into a plain dictionary.
+
+        Returns:
+            Fully merged configuration dictionary
+        """
+        return {key: self[key] for key in self._keys}
+
+
 class ConfigMerger:
     """
     Merges multiple configuration files with path-based precedence rules.
@@ -65,6 +194,12 @@ class ConfigMerger:
         "bitbucket.bearer_token",
     ]
 
+    # Maximum number of parsed config files kept; least recently used are evicted first
+    MAX_PARSE_CACHE_ENTRIES: ClassVar[int] = 128
+
+    # Config files at least this large are memory-mapped instead of read in one call
+    MMAP_MIN_BYTES: ClassVar[int] = 4096
+
     def __init__(
         self,
         repo_root: Path,
@@ -81,16 +216,25 @@ class ConfigMerger:
             allowed_overrides: List of setting paths allowed to be overridden (None = use defaults)
             denied_overrides: List of setting paths denied from override (None = use defaults)
         """
-        self.repo_root = Path(repo_root).resolve()
+        self.repo_root = resolve_repo_root(repo_root)
         self.max_depth = max_depth
         self.allowed_overrides = allowed_overrides or self.DEFAULT_ALLOWED_OVERRIDES
         self.denied_overrides = denied_overrides or self.DENIED_OVERRIDES
+        self._allowed_re = _compile_prefix_pattern(self.allowed_overrides)
+        self._denied_re = _compile_prefix_pattern(self.denied_overrides)
+        # Top-level section -> whether any allowed/denied prefix can match a key under it
+        self._relevant_sections: Dict[str, bool] = {}
+        # Parsed TOML per config path, with the (st_mtime_ns, st_size) it was parsed at and a content digest
+        self._parse_cache: "OrderedDict[Path, Tuple[Tuple[int, int], Dict[str, Any], bytes]]" = OrderedDict()
+        # Digests of file contents that already passed validate_file_security
+        self._validated_hashes: Set[bytes] = set()
         self.logger = get_logger()
 
     def merge_configs(
         self,
         config_files: List[ConfigFile],
-        base_config: Optional[Dict[str, Any]] = None
+        base_config: Optional[Dict[str, Any]] = None,
+        issues: Optional[List[Dict[str, Any]]] = None
     ) -> Dict[str, Any]:
         """
         Merge multiple configuration files with depth-aware precedence.
@@ -101,11 +245,38 @@ class ConfigMerger:
         Args:
             config_files: List of ConfigFile objects sorted by depth
             base_config: Optional base configuration to start with
+            issues: Optional list to append validation issues to, in the format
+                returned by validate_config_consistency
 
         Returns:
-            Merged configuration dictionary
+            Merged configuration dictionary, owned by the caller
+        """
+        return self.merge_layered(config_files, base_config, issues).to_dict()
+
+    def merge_layered(
+        self,
+        config_files: List[ConfigFile],
+        base_config: Optional[Dict[str, Any]] = None,
+        issues: Optional[List[Dict[str, Any]]] = None
+    ) -> LayeredConfig:
+        """
+        Load and validate configuration files, deferring the merge of each section until it is read.
+
+        Takes the same arguments as merge_configs and merges the same way, but
+        returns a read-only LayeredConfig so callers that read only a few
+        settings skip merging the rest.
+
+        Args:
+            config_files: List of ConfigFile objects sorted by depth
+            base_config: Optional base configuration to start with
+            issues: Optional list to append validation issues to, in the format
+                returned by validate_config_consistency
+
+        Returns:
+            Read-only mapping of the merged configuration
         """
-        merged = copy.deepcopy(base_config) if base_config else {}
+        base = copy.deepcopy(base_config) if base_config else {}
+        layers: List[Tuple[ConfigFile, Dict[str, Any]]] = []
 
         self.logger.debug(
             f"Merging {len(config_files)} configuration files",
@@ -113,24 +284,22 @@ class ConfigMerger:
         )
 
         for config_file in config_files:
+            issue_type = "load_error"
             try:
                 # Load the config file
                 config_data = self._load_config_file(config_file)
 
                 # Validate security
-                validate_file_security(config_data, str(config_file.path))
+                self._validate_file_security(config_file, config_data)
 
                 # Validate overrides if not root config
                 if config_file.depth > 0:
+                    issue_type = "security_violation"
                     self._validate_overrides(config_data, config_file)
+                    issue_type = "load_error"
 
-                # Merge into accumulated config
-                merged = self._merge_dict(
-                    merged,
-                    config_data,
-                    config_file,
-                    is_root=(config_file.depth == 0)
-                )
+                # Layer onto accumulated config
+                layers.append((config_file, config_data))
 
                 self.logger.info(
                     f"Merged config from {config_file.relative_path}",
@@ -141,6 +310,12 @@ class ConfigMerger:
                 )
 
             except Exception as e:
+                if issues is not None:
+                    issues.append({
+                        "file": str(config_file.relative_path),
+                        "type": issue_type,
+                        "message": str(e)
+                    })
                 self.logger.exception(
                     f"Failed to merge config from {config_file.path}",
                     extra={"config_path": str(config_file.path)}
@@ -148,20 +323,77 @@ class ConfigMerger:
                 # Continue with other configs rather than failing completely
                 continue
 
-        return merged
+        return LayeredConfig(self, base, layers)
 
     def _load_config_file(self, config_file: ConfigFile) -> Dict[str, Any]:
         """
         Load a TOML configuration file.
 
+        Parsed files are cached and reparsed only when their modification time
+        or size changes, so a rewrite within the filesystem's timestamp
+        granularity is still picked up when the size differs; the cache keeps
+        the MAX_PARSE_CACHE_ENTRIES most recently used files. The returned dict
+        is shared with the cache and must not be mutated; _merge_dict and the
+        validators only read it.
+
         Args:
             config_file: ConfigFile object to load
 
         Returns:
             Parsed configuration dictionary
         """
-        with open(config_file.path, 'rb') as f:
-            return tomllib.load(f)
+        st = config_file.path.stat()
+        cached = self._parse_cache.get(config_file.path)
+        if cached is not None and cached[0] == (st.st_mtime_ns, st.st_size):
+            self._parse_cache.move_to_end(config_file.path)
+            return cached[1]
+
+        # Read the file from a raw descriptor rather than a buffered file object;
+        # its size and mtime come from the same descriptor. Typical configs fit
+        # one read, and only large files are worth the fixed cost of a mapping
+        fd = os.open(config_file.path, os.O_RDONLY)
+        try:
+            st = os.fstat(fd)
+            if st.st_size == 0:
+                raw = b""
+            elif st.st_size < self.MMAP_MIN_BYTES:
+                raw = os.read(fd, st.st_size)
+            else:
+                with mmap.mmap(fd, st.st_size, access=mmap.ACCESS_READ) as mapped:
+                    raw = mapped.read()
+        finally:
+            os.close(fd)
+        config_data = tomllib.loads(raw.decode("utf-8"))
+
+        content_hash = hashlib.blake2b(raw, digest_size=16).digest()
+        self._parse_cache[config_file.path] = ((st.st_mtime_ns, st.st_size), config_data, content_hash)
+        self._parse_cache.move_to_end(config_file.path)
+        if len(self._parse_cache) > self.MAX_PARSE_CACHE_ENTRIES:
+            self._parse_cache.popitem(last=False)
+        return config_data
+
+    def _validate_file_security(self, config_file: ConfigFile, config_data: Dict[str, Any]) -> None:
+        """
+        Run validate_file_security, skipping file contents that already passed it.
+
+        Args:
+            config_file: ConfigFile the data was loaded from by _load_config_file
+            config_data: Parsed configuration data
+
+        Raises:
+            SecurityError: If forbidden directives are found
+        """
+        content_hash = self._parse_cache[config_file.path][2]
+        if content_hash in self._validated_hashes:
+            return
+
+        validate_file_security(config_data, str(config_file.path))
+        self._validated_hashes.add(content_hash)
+
+    def clear_cache(self) -> None:
+        """Clear the parsed config cache. Useful for testing or long-running processes."""
+        self._parse_cache.clear()
+        self._validated_hashes.clear()
 
     def _validate_overrides(self, config_data: Dict[str, Any], config_file: ConfigFile) -> None:
         """
@@ -174,12 +406,42 @@ class ConfigMerger:
         Raises:
             SecurityError: If forbidden overrides are detected
         """
-        # Flatten the config to check all paths
-        flat_config = self._flatten_dict(config_data)
+        for section, value in config_data.items():
+            if section == '_merge_strategy':
+                continue
 
-        for key_path, _value in flat_config.items():
+            # No override rule mentions this section, so none of its keys can be
+            # denied or allowed; warn once for the section instead of flattening it
+            if not self._is_relevant_section(section):
+                self.logger.warning(
+                    f"Config override not in allowed list: {section}",
+                    extra={
+                        "config_path": str(config_file.relative_path),
+                        "setting": section,
+                        "depth": config_file.depth
+                    }
+                )
+                continue
+
+            self._validate_section_overrides(section, value, config_file)
+
+    def _validate_section_overrides(self, section: str, value: Any, config_file: ConfigFile) -> None:
+        """
+        Validate the flattened keys of one top-level config section.
+
+        Args:
+            section: Top-level section name
+            value: Section value
+            config_file: Source ConfigFile for error messages
+
+        Raises:
+            SecurityError: If forbidden overrides are detected
+        """
+        # Walk the flattened config paths without building the flat dict
+        flat_items = self._iter_flat(value, section) if isinstance(value, dict) else [(section, value)]
+        for key_path, _value in flat_items:
             # Check if this is a denied override
-            if any(key_path.startswith(denied) for denied in self.denied_overrides):
+            if self._denied_re.match(key_path):
                 raise SecurityError(
                     f"Security error in {config_file.path}: "
                     f"Setting '{key_path}' cannot be overridden in subdirectory configs. "
@@ -187,12 +449,7 @@ class ConfigMerger:
                 )
 
             # Check if this is an allowed override
-            is_allowed = any(
-                key_path.startswith(allowed) or key_path == allowed
-                for allowed in self.allowed_overrides
-            )
-
-            if not is_allowed:
+            if not self._allowed_re.match(key_path):
                 self.logger.warning(
                     f"Config override not in allowed list: {key_path}",
                     extra={
@@ -202,6 +459,30 @@ class ConfigMerger:
                     }
                 )
 
+    def _is_relevant_section(self, section: str) -> bool:
+        """
+        Check whether any allowed or denied override prefix can match keys in a section.
+
+        Flattened keys under the section start with "section." (or are the section
+        itself), so a prefix can only match if it extends "section." or the section
+        name starts with it.
+
+        Args:
+            section: Top-level section name
+
+        Returns:
+            True if keys in the section must be checked individually
+        """
+        relevant = self._relevant_sections.get(section)
+        if relevant is None:
+            section_prefix = f"{section}."
+            relevant = any(
+                prefix == section or prefix.startswith(section_prefix) or section.startswith(prefix)
+                for prefix in chain(self.allowed_overrides, self.denied_overrides)
+            )
+            self._relevant_sections[section] = relevant
+        return relevant
+
     def _merge_dict(
         self,
         base: Dict[str, Any],
@@ -211,7 +492,12 @@ class ConfigMerger:
         parent_key: str = ""
     ) -> Dict[str, Any]:
         """
-        Recursively merge two configuration dictionaries.
+        Merge two configuration dictionaries, nested sections included.
+
+        Neither input is mutated: a new dict is built for every merged level,
+        while values taken unchanged from either side are shared rather than
+        copied. Overlays come straight from tomllib, so they are already owned.
+        Nested sections are merged from an explicit stack instead of recursion.
 
         Args:
             base: Base configuration dictionary
@@ -223,48 +509,80 @@ class ConfigMerger:
         Returns:
             Merged configuration dictionary
         """
-        result = copy.deepcopy(base)
+        result = dict(base)
+        # Sections still to merge: (merged copy of the base level, overlay level, is_root, key path)
+        stack = [(result, overlay, is_root, parent_key)]
+
+        while stack:
+            target, current, current_is_root, prefix = stack.pop()
+            for key, value in current.items():
+                if key not in target:
+                    # Key doesn't exist in base, just add it
+                    target[key] = value
+                    continue
+
+                base_value = target[key]
+                if isinstance(value, dict) and isinstance(base_value, dict):
+                    if self._get_merge_strategy(current, key, current_is_root) == MergeStrategy.OVERRIDE:
+                        target[key] = value
+                    else:
+                        # EXTEND, INHERIT or default: merge this level on a later iteration
+                        target[key] = merged = dict(base_value)
+                        stack.append((merged, value, False, f"{prefix}.{key}" if prefix else key))
+                else:
+                    target[key] = self._merge_value(
+                        base_value, current, key, config_file, current_is_root, prefix
+                    )
 
-        for key, value in overlay.items():
-            full_key = f"{parent_key}.{key}" if parent_key else key
+        return result
 
-            # Check for merge strategy directive
-            merge_strategy = self._get_merge_strategy(overlay, key, is_root)
+    def _merge_value(
+        self,
+        base_value: Any,
+        overlay: Dict[str, Any],
+        key: str,
+        config_file: ConfigFile,
+        is_root: bool = False,
+        parent_key: str = ""
+    ) -> Any:
+        """
+        Merge an overlay value into the existing value for the same key.
 
-            if key not in result:
-                # Key doesn't exist in base, just add it
-                result[key] = copy.deepcopy(value)
-            elif isinstance(value, dict) and isinstance(result[key], dict):
-                # Both are dicts, merge recursively
-                if merge_strategy == MergeStrategy.OVERRIDE:
-                    result[key] = copy.deepcopy(value)
-                elif merge_strategy == MergeStrategy.EXTEND:
-                    result[key] = self._merge_dict(
-                        result[key],
-                        value,
-                        config_file,
-                        is_root=False,
-                        parent_key=full_key
-                    )
-                else:  # INHERIT or default
-                    result[key] = self._merge_dict(
-                        result[key],
-                        value,
-                        config_file,
-                        is_root=False,
-                        parent_key=full_key
-                    )
-            elif isinstance(value, list) and isinstance(result[key], list):
-                # Both are lists, merge based on strategy
-                if merge_strategy == MergeStrategy.EXTEND:
-                    result[key] = result[key] + value
-                else:  # OVERRIDE or INHERIT
-                    result[key] = copy.deepcopy(value)
-            else:
-                # Different types or scalar values - overlay wins
-                result[key] = copy.deepcopy(value)
+        Args:
+            base_value: Existing value for the key
+            overlay: Overlay configuration dictionary containing the key
+            key: Key being merged
+            config_file: Source ConfigFile for logging
+            is_root: Whether this is the root config
+            parent_key: Parent key path for nested merging
 
-        return result
+        Returns:
+            Merged value
+        """
+        value = overlay[key]
+        if isinstance(value, dict) and isinstance(base_value, dict):
+            # Both are dicts, merge them level by level; only dict sections can carry
+            # a merge strategy directive, so the strategy is looked up here
+            merge_strategy = self._get_merge_strategy(overlay, key, is_root)
+            if merge_strategy == MergeStrategy.OVERRIDE:
+                return value
+            # EXTEND, INHERIT or default
+            full_key = f"{parent_key}.{key}" if parent_key else key
+            return self._merge_dict(
+                base_value,
+                value,
+                config_file,
+                is_root=False,
+                parent_key=full_key
+            )
+        elif isinstance(value, list) and isinstance(base_value, list):
+            # Both are lists; lists carry no directive, so only root configs extend
+            if is_root:
+                return base_value + value
+            return value  # OVERRIDE or INHERIT
+        else:
+            # Different types or scalar values - overlay wins
+            return value
 
     def _get_merge_strategy(
         self,
@@ -293,13 +611,13 @@ class ConfigMerger:
         if isinstance(config_section.get(key), dict):
             strategy_value = config_section[key].get('_merge_strategy')
             if strategy_value:
-                try:
-                    return MergeStrategy(strategy_value)
-                except ValueError:
-                    self.logger.warning(
-                        f"Invalid merge strategy '{strategy_value}', using default",
-                        extra={"strategy": strategy_value, "key": key}
-                    )
+                strategy = _MERGE_STRATEGIES.get(strategy_value) if isinstance(strategy_value, str) else None
+                if strategy is not None:
+                    return strategy
+                self.logger.warning(
+                    f"Invalid merge strategy '{strategy_value}', using default",
+                    extra={"strategy": strategy_value, "key": key}
+                )
 
         # Default strategy for non-root configs
         return MergeStrategy.OVERRIDE
@@ -321,20 +639,41 @@ class ConfigMerger:
         Returns:
             Flattened dictionary with dot-notation keys
         """
-        items = []
-        for key, value in d.items():
-            new_key = f"{parent_key}{sep}{key}" if parent_key else key
+        return dict(self._iter_flat(d, parent_key, sep=sep))
 
-            # Skip merge strategy directives
-            if key == '_merge_strategy':
-                continue
+    def _iter_flat(
+        self,
+        d: Dict[str, Any],
+        parent_key: str = "",
+        sep: str = "."
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        Iterate over the dot-notation paths and leaf values of a nested dictionary.
 
-            if isinstance(value, dict):
-                items.extend(self._flatten_dict(value, new_key, sep=sep).items())
-            else:
-                items.append((new_key, value))
+        Uses an explicit stack instead of recursion; nested sections are yielded
+        after the leaves of their parent.
 
-        return dict(items)
+        Args:
+            d: Dictionary to flatten
+            parent_key: Parent key path
+            sep: Separator for key paths
+
+        Yields:
+            (key path, value) pairs for every non-dict value
+        """
+        stack = [(parent_key, d)]
+        while stack:
+            prefix, current = stack.pop()
+            for key, value in current.items():
+                # Skip merge strategy directives
+                if key == '_merge_strategy':
+                    continue
+
+                new_key = f"{prefix}{sep}{key}" if prefix else key
+                if isinstance(value, dict):
+                    stack.append((new_key, value))
+                else:
+                    yield new_key, value
 
     def validate_config_consistency(
         self,
@@ -343,37 +682,16 @@ class ConfigMerger:
         """
         Validate configuration files for conflicts and issues.
 
+        Runs the same load and validation pass as merge_configs; callers that
+        also need the merged config should pass an issues list to merge_configs
+        or merge_layered instead of calling both.
+
         Args:
             config_files: List of ConfigFile objects to validate
 
         Returns:
             List of validation issues found
         """
-        issues = []
-
-        for config_file in config_files:
-            try:
-                config_data = self._load_config_file(config_file)
-
-                # Validate security
-                validate_file_security(config_data, str(config_file.path))
-
-                # Validate overrides for non-root configs
-                if config_file.depth > 0:
-                    try:
-                        self._validate_overrides(config_data, config_file)
-                    except Exception as e:
-                        issues.append({
-                            "file": str(config_file.relative_path),
-                            "type": "security_violation",
-                            "message": str(e)
-                        })
-
-            except Exception as e:
-                issues.append({
-                    "file": str(config_file.relative_path),
-                    "type": "load_error",
-                    "message": str(e)
-                })
-
+        issues: List[Dict[str, Any]] = []
+        self.merge_layered(config_files, issues=issues)
         return issues
@@ -4,28 +4,47 @@ Configuration resolver module for getting effective configuration for specific f
 This module implements Task 2.4 from Feature 2: Per-File Configuration Resolution
 """
 
+from collections import OrderedDict
+from functools import lru_cache
+import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, ClassVar, Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple
 
 from pr_agent.log import get_logger
 from pr_agent.config_loader import get_settings
-from pr_agent.path_config.config_discovery import ConfigDiscovery, ConfigFile
-from pr_agent.path_config.config_merger import ConfigMerger
+from pr_agent.path_config.config_discovery import ConfigDiscovery, ConfigFile, resolve_repo_root
+from pr_agent.path_config.config_merger import ConfigMerger, LayeredConfig
 
 
-@dataclass
-class ResolvedConfig:
+@lru_cache(maxsize=256)
+def _split_setting_path(setting_path: str) -> Tuple[str, ...]:
+    """Split a dot-notation setting path into lowercased key parts."""
+    return tuple(setting_path.lower().split('.'))
+
+
+# Marks settings missing from a resolved config
+_NOT_FOUND = object()
+
+# Shared read-only containers for files resolved with path-based config disabled
+_EMPTY_CONFIG: Mapping[str, Any] = MappingProxyType({})
+_NO_SOURCE_CONFIGS: Tuple[ConfigFile, ...] = ()
+
+
+class ResolvedConfig(NamedTuple):
     """
     Represents a resolved configuration for a specific file.
 
+    A NamedTuple like ConfigFile: immutable, so results can be shared by the
+    resolution cache and callers, and cheap to build for every file in a PR.
+
     Attributes:
-        config: The effective configuration dictionary
-        source_configs: List of config files that contributed to this resolution
+        config: The effective configuration mapping
+        source_configs: Config files that contributed to this resolution, root first
         file_path: The file this config was resolved for
     """
-    config: Dict[str, Any]
-    source_configs: List[ConfigFile]
+    config: Mapping[str, Any]
+    source_configs: Sequence[ConfigFile]
     file_path: str
 
     def get_applied_config_info(self) -> str:
@@ -50,6 +69,12 @@ class ConfigResolver:
     the final effective configuration for any given file path.
     """
 
+    # Maximum number of per-file resolutions kept; least recently used are evicted first
+    MAX_RESOLUTION_CACHE_ENTRIES: ClassVar[int] = 4096
+
+    # Maximum number of directories whose applicable configs are kept; least recently used are evicted first
+    MAX_DIR_CACHE_ENTRIES: ClassVar[int] = 1024
+
     def __init__(
         self,
         repo_root: Path,
@@ -64,17 +89,33 @@ class ConfigResolver:
             max_depth: Maximum depth for config search
             enable_path_config: Whether path-based config is enabled
         """
-        self.repo_root = Path(repo_root).resolve()
+        self.repo_root = resolve_repo_root(repo_root)
         self.max_depth = max_depth
         self.enable_path_config = enable_path_config
         self.logger = get_logger()
 
-        # Initialize discovery and merger
-        self.discovery = ConfigDiscovery(repo_root, max_depth)
-        self.merger = ConfigMerger(repo_root, max_depth)
+        # Initialize discovery and merger with the already resolved root
+        self.discovery = ConfigDiscovery(self.repo_root, max_depth)
+        self.merger = ConfigMerger(self.repo_root, max_depth)
+
+        # Cache for resolved configs per file, bounded for long-running processes
+        self._resolution_cache: "OrderedDict[str, ResolvedConfig]" = OrderedDict()
 
-        # Cache for resolved configs per file
-        self._resolution_cache: Dict[str, ResolvedConfig] = {}
+        # Applicable and merged configs per parent directory, shared by sibling
+        # files; the configs that apply to a file depend only on its ancestors.
+        # Bounded like the resolution cache
+        self._dir_configs: "OrderedDict[str, Tuple[List[ConfigFile], Mapping[str, Any]]]" = OrderedDict()
+
+        # Directory index of the most recently discovered config list; discovery
+        # returns the same cached list for the same changed files
+        self._indexed_configs: Optional[List[ConfigFile]] = None
+        self._configs_by_dir: Dict[Tuple[str, ...], List[ConfigFile]] = {}
+
+        # With path-based config disabled every file resolves to the global config:
+        # bind versions that skip the caches and the enabled check on every call
+        if not enable_path_config:
+            self.get_config_for_file = self._get_global_config_for_file
+            self.get_config_for_files = self._get_global_config_for_files
 
     def get_config_for_file(
         self,
@@ -100,27 +141,31 @@ class ConfigResolver:
         # Check cache
         if file_path in self._resolution_cache:
             self.logger.debug(f"Using cached config resolution for {file_path}")
+            self._resolution_cache.move_to_end(file_path)
             return self._resolution_cache[file_path]
 
         # If path-based config is disabled, return global config only
         if not self.enable_path_config:
-            return ResolvedConfig(
-                config={},  # Empty - will use global settings
-                source_configs=[],
-                file_path=file_path
-            )
+            return self._get_global_config_for_file(file_path)
 
-        # Discover configs
-        files_to_check = changed_files or [file_path]
-        all_configs = self.discovery.discover_configs(files_to_check)
+        parent_dir = str((self.repo_root / file_path).parent)
+        if parent_dir in self._dir_configs:
+            self._dir_configs.move_to_end(parent_dir)
+            applicable_configs, merged_config = self._dir_configs[parent_dir]
+        else:
+            # Discover configs
+            files_to_check = changed_files or [file_path]
+            all_configs = self.discovery.discover_configs(files_to_check)
 
-        # Filter configs that apply to this specific file
-        applicable_configs = self._filter_applicable_configs(file_path, all_configs)
+            # Filter configs that apply to this specific file
+            applicable_configs = self._filter_applicable_configs(file_path, all_configs)
 
-        # Merge the applicable configs
-        merged_config = self.merger.merge_configs(applicable_configs)
+            # Merge the applicable configs
+            merged_config = self.merger.merge_layered(applicable_configs)
+            self._cache_dir_configs(parent_dir, (applicable_configs, merged_config))
 
-        # Create resolved config
+        # Create resolved config; the interned path is shared by its cache key and the result
+        file_path = sys.intern(file_path)
         resolved = ResolvedConfig(
             config=merged_config,
             source_configs=applicable_configs,
@@ -128,7 +173,7 @@ class ConfigResolver:
         )
 
         # Cache the result
-        self._resolution_cache[file_path] = resolved
+        self._cache_resolution(file_path, resolved)
 
         self.logger.info(
             f"Resolved config for {file_path}",
@@ -149,6 +194,9 @@ class ConfigResolver:
         Get effective configuration for multiple files efficiently.
 
         This method discovers configs once and reuses them for all files.
+        Files in the same directory share one applicable-config lookup, also
+        across calls, and files with the same applicable configs share one
+        merged config.
 
         Args:
             file_paths: List of file paths (relative to repo root)
@@ -157,25 +205,50 @@ class ConfigResolver:
             Dictionary mapping file paths to ResolvedConfig objects
         """
         if not self.enable_path_config or not file_paths:
-            return {
-                path: ResolvedConfig(config={}, source_configs=[], file_path=path)
-                for path in file_paths
-            }
-
-        # Discover all configs once
-        all_configs = self.discovery.discover_configs(file_paths)
+            return self._get_global_config_for_files(file_paths)
 
-        # Resolve for each file
         results = {}
+        # Parent directory of each file still to resolve
+        pending: Dict[str, str] = {}
         for file_path in file_paths:
             # Check cache first
             if file_path in self._resolution_cache:
+                self._resolution_cache.move_to_end(file_path)
                 results[file_path] = self._resolution_cache[file_path]
-                continue
+            else:
+                pending[sys.intern(file_path)] = str((self.repo_root / file_path).parent)
+
+        # Directories resolved by earlier calls, taken out of the bounded cache
+        # up front so that entries stored below cannot evict them mid-batch
+        dir_configs = {}
+        for parent_dir in set(pending.values()):
+            if parent_dir in self._dir_configs:
+                self._dir_configs.move_to_end(parent_dir)
+                dir_configs[parent_dir] = self._dir_configs[parent_dir]
+
+        # Discover configs once, in one shared upward walk, for the files whose
+        # directory has not been resolved yet, and index them by directory once
+        undiscovered = [path for path, parent_dir in pending.items() if parent_dir not in dir_configs]
+        if undiscovered:
+            all_configs = self.discovery.discover_configs(undiscovered)
+            configs_by_dir = self._index_configs_by_dir(all_configs)
+        # Merged config per applicable config set; merged configs are read-only
+        merged_configs: Dict[Tuple[str, ...], Mapping[str, Any]] = {}
 
+        # Resolve for each file
+        for file_path, parent_dir in pending.items():
             # Filter and merge
-            applicable_configs = self._filter_applicable_configs(file_path, all_configs)
-            merged_config = self.merger.merge_configs(applicable_configs)
+            if parent_dir in dir_configs:
+                applicable_configs, merged_config = dir_configs[parent_dir]
+            else:
+                applicable_configs = self._filter_applicable_configs(file_path, all_configs, configs_by_dir)
+                merge_key = tuple(str(config.path) for config in applicable_configs)
+                merged_config = merged_configs.get(merge_key)
+                if merged_config is None:
+                    merged_config = self.merger.merge_layered(applicable_configs)
+                    merged_configs[merge_key] = merged_config
+                dir_configs[parent_dir] = (applicable_configs, merged_config)
+                self._cache_dir_configs(parent_dir, dir_configs[parent_dir])
 
             resolved = ResolvedConfig(
                 config=merged_config,
@@ -183,42 +256,134 @@ class ConfigResolver:
                 file_path=file_path
             )
 
-            self._resolution_cache[file_path] = resolved
+            self._cache_resolution(file_path, resolved)
             results[file_path] = resolved
 
-        return results
+        return {file_path: results[file_path] for file_path in file_paths}
+
+    @staticmethod
+    def _get_global_config_for_file(
+        file_path: str,
+        changed_files: Optional[List[str]] = None
+    ) -> ResolvedConfig:
+        """
+        Resolve a file to the global configuration only, without path-based overrides.
+
+        Args:
+            file_path: Path to the file (relative to repo root)
+            changed_files: Unused; accepted for signature compatibility with get_config_for_file
+
+        Returns:
+            ResolvedConfig with an empty config and no source configs
+        """
+        # Empty config - will use global settings
+        return ResolvedConfig(_EMPTY_CONFIG, _NO_SOURCE_CONFIGS, sys.intern(file_path))
+
+    @staticmethod
+    def _get_global_config_for_files(file_paths: List[str]) -> Dict[str, ResolvedConfig]:
+        """
+        Resolve files to the global configuration only, without path-based overrides.
+
+        Args:
+            file_paths: List of file paths (relative to repo root)
+
+        Returns:
+            Dictionary mapping file paths to ResolvedConfig objects with empty configs
+        """
+        return {
+            path: ResolvedConfig(_EMPTY_CONFIG, _NO_SOURCE_CONFIGS, path)
+            for path in map(sys.intern, file_paths)
+        }
+
+    def _cache_resolution(self, file_path: str, resolved: ResolvedConfig) -> None:
+        """
+        Store a file's resolved config, evicting the least recently used entry when full.
+
+        Args:
+            file_path: File path the config was resolved for
+            resolved: Resolved configuration
+        """
+        self._resolution_cache[file_path] = resolved
+        self._resolution_cache.move_to_end(file_path)
+        if len(self._resolution_cache) > self.MAX_RESOLUTION_CACHE_ENTRIES:
+            self._resolution_cache.popitem(last=False)
+
+    def _cache_dir_configs(
+        self,
+        parent_dir: str,
+        entry: Tuple[List[ConfigFile], Mapping[str, Any]]
+    ) -> None:
+        """
+        Store a directory's applicable and merged configs, evicting the least recently used entry when full.
+
+        Args:
+            parent_dir: Absolute path of the directory
+            entry: (applicable configs, merged config) for files in the directory
+        """
+        self._dir_configs[parent_dir] = entry
+        self._dir_configs.move_to_end(parent_dir)
+        if len(self._dir_configs) > self.MAX_DIR_CACHE_ENTRIES:
+            self._dir_configs.popitem(last=False)
+
+    def _index_configs_by_dir(self, all_configs: List[ConfigFile]) -> Dict[Tuple[str, ...], List[ConfigFile]]:
+        """
+        Index config files by the directory they are in.
+
+        Directories are keyed by the path parts of their location relative to
+        the repository root, so the root directory is the empty tuple. The index
+        of the last discovered config list is reused, so repeated lookups against
+        the same discovery result index its configs only once.
+
+        Args:
+            all_configs: All discovered config files
+
+        Returns:
+            Dictionary mapping relative directory parts to the configs in them
+        """
+        if all_configs is self._indexed_configs:
+            return self._configs_by_dir
+
+        configs_by_dir: Dict[Tuple[str, ...], List[ConfigFile]] = {}
+        for config in all_configs:
+            configs_by_dir.setdefault(config.relative_path.parent.parts, []).append(config)
+
+        self._indexed_configs = all_configs
+        self._configs_by_dir = configs_by_dir
+        return configs_by_dir
 
     def _filter_applicable_configs(
         self,
         file_path: str,
-        all_configs: List[ConfigFile]
+        all_configs: List[ConfigFile],
+        configs_by_dir: Optional[Dict[Tuple[str, ...], List[ConfigFile]]] = None
     ) -> List[ConfigFile]:
         """
         Filter config files to those that apply to the given file path.
 
         A config applies to a file if the file is in the same directory
-        or a subdirectory of the config file.
+        or a subdirectory of the config file. Each prefix of the file's
+        directory parts, from the repository root down, is looked up in a
+        directory index rather than testing every config.
 
         Args:
             file_path: File path relative to repo root
-            all_configs: All discovered config files
+            all_configs: All discovered config files, sorted by depth
+            configs_by_dir: Index from _index_configs_by_dir, built if not given
 
         Returns:
-            List of applicable ConfigFile objects
+            List of applicable ConfigFile objects, root first
         """
-        file_abs_path = self.repo_root / file_path
-        applicable = []
+        if configs_by_dir is None:
+            configs_by_dir = self._index_configs_by_dir(all_configs)
 
-        for config in all_configs:
-            config_dir = config.path.parent
+        dir_parts = Path(file_path).parent.parts
+        applicable = []
 
-            # Check if file is in this config's directory or subdirectory
-            try:
-                file_abs_path.relative_to(config_dir)
-                applicable.append(config)
-            except ValueError:
-                # File is not in this config's directory tree
-                continue
+        # Walk the file's ancestors from the repository root down
+        for end in range(len(dir_parts) + 1):
+            configs = configs_by_dir.get(dir_parts[:end])
+            if configs:
+                applicable.extend(configs)
 
         return applicable
 
@@ -247,20 +412,27 @@ class ConfigResolver:
         # Get resolved config
         resolved = self.get_config_for_file(file_path)
 
-        # Try to get from resolved config first (using lowercase)
-        parts = setting_path.lower().split('.')
+        # Try to get from resolved config first (using lowercase); merged configs
+        # remember each looked-up path, so repeated settings cost one dict lookup
+        parts = _split_setting_path(setting_path)
         current = resolved.config
 
-        try:
-            for part in parts:
-                current = current[part]
-        except (KeyError, TypeError):
-            pass
+        if isinstance(current, LayeredConfig):
+            value = current.get_path(parts, _NOT_FOUND)
+            if value is not _NOT_FOUND:
+                return value
         else:
-            return current
-
-        # Fall back to global settings (also using lowercase for consistency)
-        global_value = get_settings().get(setting_path.lower())
+            try:
+                for part in parts:
+                    current = current[part]
+            except (KeyError, TypeError):
+                pass
+            else:
+                return current
+
+        # Fall back to global settings (also using lowercase for consistency).
+        # Not cached: settings are updated in place with set()
+        global_value = get_settings().get('.'.join(parts))
         if global_value is not None:
             return global_value
 
@@ -330,5 +502,9 @@ class ConfigResolver:
     def clear_cache(self) -> None:
         """Clear all caches. Useful for testing or long-running processes."""
         self._resolution_cache.clear()
+        self._dir_configs.clear()
+        self._indexed_configs = None
+        self._configs_by_dir = {}
         self.discovery.clear_cache()
+        self.merger.clear_cache()
         self.logger.debug("Cleared all configuration caches")
@@ -6,11 +6,32 @@ Finding data structure for tracking review findings.
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Literal, Optional
+from typing import Literal, Optional, Union
 import hashlib
 
 
-@dataclass
+def encode_timestamp(timestamp: Optional[datetime]) -> Optional[int]:
+    """Convert a datetime to unix microseconds for serialization."""
+    if timestamp is None:
+        return None
+    return round(timestamp.timestamp() * 1_000_000)
+
+
+def decode_timestamp(value: Union[int, float, str, None]) -> Optional[datetime]:
+    """
+    Convert a serialized timestamp back to a datetime.
+
+    Accepts unix microseconds as written by encode_timestamp, and ISO 8601
+    strings as written by earlier versions.
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return datetime.fromtimestamp(value / 1_000_000)
+
+
+@dataclass(slots=True)
 class Finding:
     """
     A finding from a code review that can be tracked across PR updates.
@@ -47,6 +68,7 @@ class Finding:
         Returns:
             Stable finding ID
         """
+        # Must stay SHA-256: stored findings are matched against newly generated IDs
         content = f"{self.file_path}:{self.line_range[0]}-{self.line_range[1]}:{self.category}:{self.message}"
         return hashlib.sha256(content.encode()).hexdigest()[:16]
 
@@ -76,15 +98,15 @@ class Finding:
             "message": self.message,
             "suggestion": self.suggestion,
             "status": self.status,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "resolved_at": self.resolved_at.isoformat() if self.resolved_at else None,
+            "created_at": encode_timestamp(self.created_at),
+            "resolved_at": encode_timestamp(self.resolved_at),
         }
 
     @classmethod
     def from_dict(cls, data: dict) -> "Finding":
         """Create Finding from dictionary."""
-        created_at = datetime.fromisoformat(data["created_at"]) if data.get("created_at") else None
-        resolved_at = datetime.fromisoformat(data["resolved_at"]) if data.get("resolved_at") else None
+        created_at = decode_timestamp(data.get("created_at"))
+        resolved_at = decode_timestamp(data.get("resolved_at"))
 
         return cls(
             id=data["id"],
@@ -4,14 +4,20 @@
 PR state data structure.
 """
 
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import islice
 from typing import Literal, Optional
 
-from pr_agent.state.finding import Finding
+from pr_agent.state.finding import Finding, decode_timestamp, encode_timestamp
 
+_RESOLVED_STATUSES = frozenset({"resolved", "invalidated", "dismissed"})
 
-@dataclass
+DEFAULT_MAX_CONVERSATION_HISTORY = 200
+
+
+@dataclass(slots=True)
 class Message:
     """
     A message in a conversation history.
@@ -28,7 +34,7 @@ class Message:
         return {
             "role": self.role,
             "content": self.content,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": encode_timestamp(self.timestamp),
             "metadata": self.metadata,
         }
 
@@ -38,12 +44,12 @@ class Message:
         return cls(
             role=data["role"],
             content=data["content"],
-            timestamp=datetime.fromisoformat(data["timestamp"]),
+            timestamp=decode_timestamp(data["timestamp"]),
             metadata=data.get("metadata", {}),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PRState:
     """
     Complete state for a pull request.
@@ -58,15 +64,34 @@ class PRState:
     reviewed_commits: list[str] = field(default_factory=list)
     last_review_at: Optional[datetime] = None
     paused: bool = False
-    conversation_history: list[Message] = field(default_factory=list)
+    conversation_history: deque[Message] = field(default_factory=deque)
     metadata: dict = field(default_factory=dict)
+    max_conversation_history: int = field(default=DEFAULT_MAX_CONVERSATION_HISTORY, compare=False)
+    _finding_ids: set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+    _indexed_count: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Bound the conversation history and index the IDs of loaded findings."""
+        # Only the most recent messages are kept; older ones are dropped as new ones arrive
+        self.conversation_history = deque(self.conversation_history, maxlen=self.max_conversation_history)
+        self._index_findings()
+
+    def _index_findings(self):
+        """Rebuild the finding ID index from the findings list."""
+        self._finding_ids = {f.id for f in self.findings}
+        self._indexed_count = len(self.findings)
 
     def add_finding(self, finding: Finding):
         """Add a new finding to the state."""
+        # Reindex if the findings list was modified directly
+        if self._indexed_count != len(self.findings):
+            self._index_findings()
+
         # Check for duplicates
-        existing_ids = {f.id for f in self.findings}
-        if finding.id not in existing_ids:
+        if finding.id not in self._finding_ids:
             self.findings.append(finding)
+            self._finding_ids.add(finding.id)
+            self._indexed_count += 1
 
     def get_active_findings(self) -> list[Finding]:
         """Get all findings that are still open."""
@@ -74,7 +99,7 @@ class PRState:
 
     def get_resolved_findings(self) -> list[Finding]:
         """Get all findings that have been resolved."""
-        return [f for f in self.findings if f.status in ["resolved", "invalidated", "dismissed"]]
+        return [f for f in self.findings if f.status in _RESOLVED_STATUSES]
 
     def add_message(self, role: Literal["user", "assistant"], content: str, metadata: dict = None):
         """Add a message to conversation history."""
@@ -88,27 +113,29 @@ class PRState:
 
     def get_recent_messages(self, limit: int = 10) -> list[Message]:
         """Get the most recent messages from conversation history."""
-        return self.conversation_history[-limit:]
+        start = max(0, len(self.conversation_history) - limit)
+        return list(islice(self.conversation_history, start, None))
 
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
         return {
             "pr_id": self.pr_id,
             "provider": self.provider,
-            "findings": [f.to_dict() for f in self.findings],
+            "findings": list(map(Finding.to_dict, self.findings)),
             "reviewed_commits": self.reviewed_commits,
-            "last_review_at": self.last_review_at.isoformat() if self.last_review_at else None,
+            "last_review_at": encode_timestamp(self.last_review_at),
             "paused": self.paused,
-            "conversation_history": [m.to_dict() for m in self.conversation_history],
+            "conversation_history": list(map(Message.to_dict, self.conversation_history)),
             "metadata": self.metadata,
+            "max_conversation_history": self.max_conversation_history,
         }
 
     @classmethod
     def from_dict(cls, data: dict) -> "PRState":
         """Create PRState from dictionary."""
-        findings = [Finding.from_dict(f) for f in data.get("findings", [])]
-        conversation_history = [Message.from_dict(m) for m in data.get("conversation_history", [])]
-        last_review_at = datetime.fromisoformat(data["last_review_at"]) if data.get("last_review_at") else None
+        findings = list(map(Finding.from_dict, data.get("findings", [])))
+        conversation_history = list(map(Message.from_dict, data.get("conversation_history", [])))
+        last_review_at = decode_timestamp(data.get("last_review_at"))
 
         return cls(
             pr_id=data["pr_id"],
@@ -119,4 +146,5 @@ class PRState:
             paused=data.get("paused", False),
             conversation_history=conversation_history,
             metadata=data.get("metadata", {}),
+            max_conversation_history=data.get("max_conversation_history", DEFAULT_MAX_CONVERSATION_HISTORY),
         )
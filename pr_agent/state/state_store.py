@@ -7,9 +7,14 @@ Abstract state storage interface and implementations.
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Optional
-import json
+import asyncio
+import copy
+import os
+import tempfile
+import time
 import aiosqlite
 
+from pr_agent.algo import json_utils
 from pr_agent.state.pr_state import PRState
 from pr_agent.log import get_logger
 
@@ -60,18 +65,34 @@ class FileStateStore(StateStore):
     """
     File-based state storage implementation.
 
-    Stores each PR's state as a JSON file in a directory.
+    Stores each PR's state as a JSON file in a directory. File I/O runs in a
+    worker thread, and saves replace the file atomically so concurrent readers
+    never see a partially written state.
+
+    By default save() writes the state before returning. With a positive
+    flush_delay, saves are coalesced instead: the state is snapshotted and
+    written after flush_delay seconds, so repeated saves of the same PR in that
+    window cost one write. Callers opting in must call flush() or close()
+    before shutdown to write pending states and surface write errors.
     """
 
-    def __init__(self, base_path: str = ".pr_agent_state"):
+    def __init__(self, base_path: str = ".pr_agent_state", flush_delay: float = 0):
         """
         Initialize file-based state store.
 
         Args:
             base_path: Directory to store state files
+            flush_delay: Seconds to wait before writing saved states; 0 (the
+                default) writes on every save and raises write errors from save()
         """
         self.base_path = Path(base_path)
+        self.flush_delay = flush_delay
         self.logger = get_logger()
+        # Snapshots of saved states not yet written, by PR ID
+        self._pending: dict[str, dict] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        # Serializes writes and deletes so an older snapshot never lands last
+        self._write_lock = asyncio.Lock()
 
     def _get_file_path(self, pr_id: str) -> Path:
         """Get file path for a PR's state."""
@@ -80,44 +101,246 @@ class FileStateStore(StateStore):
         return self.base_path / f"{safe_id}.json"
 
     async def load(self, pr_id: str) -> Optional[PRState]:
-        """Load PR state from JSON file."""
-        file_path = self._get_file_path(pr_id)
+        """Load PR state from JSON file, or from a pending save."""
+        data = self._pending.get(pr_id)
+        if data is not None:
+            # The loaded state must not share lists and dicts with the pending snapshot
+            data = copy.deepcopy(data)
+        else:
+            file_path = self._get_file_path(pr_id)
 
-        if not file_path.exists():
-            self.logger.debug(f"No state file found for {pr_id}")
-            return None
+            try:
+                data = await asyncio.to_thread(self._read_state_file, file_path)
+            except Exception as e:
+                self.logger.error(f"Failed to load state for {pr_id}: {e}")
+                return None
+
+            if data is None:
+                self.logger.debug(f"No state file found for {pr_id}")
+                return None
 
         try:
-            with open(file_path, "r") as f:
-                data = json.load(f)
             return PRState.from_dict(data)
         except Exception as e:
             self.logger.error(f"Failed to load state for {pr_id}: {e}")
             return None
 
     async def save(self, state: PRState) -> None:
-        """Save PR state to JSON file."""
-        # Ensure directory exists
-        self.base_path.mkdir(parents=True, exist_ok=True)
-
-        file_path = self._get_file_path(state.pr_id)
-
+        """Save PR state to JSON file, coalescing writes within flush_delay if it is set."""
         try:
-            with open(file_path, "w") as f:
-                json.dump(state.to_dict(), f, indent=2)
-            self.logger.debug(f"Saved state for {state.pr_id}")
+            # to_dict() shares lists and dicts with the live state, so later mutations would leak in
+            self._pending[state.pr_id] = copy.deepcopy(state.to_dict())
         except Exception as e:
             self.logger.error(f"Failed to save state for {state.pr_id}: {e}")
             raise
 
+        if self.flush_delay <= 0:
+            await self.flush()
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_after_delay())
+
+    async def _flush_after_delay(self) -> None:
+        """Write pending states once flush_delay has passed."""
+        await asyncio.sleep(self.flush_delay)
+        try:
+            await self.flush()
+        except Exception:
+            # Already logged per state by flush
+            pass
+
+    async def flush(self) -> None:
+        """
+        Write all pending states to disk.
+
+        States that fail to write stay pending; the first write error is raised
+        after every pending state has been attempted.
+        """
+        async with self._write_lock:
+            pending, self._pending = self._pending, {}
+            error = None
+            for pr_id, data in pending.items():
+                try:
+                    await asyncio.to_thread(self._write_state_file, self._get_file_path(pr_id), data)
+                    self.logger.debug(f"Saved state for {pr_id}")
+                except Exception as e:
+                    self.logger.error(f"Failed to save state for {pr_id}: {e}")
+                    # Keep the state for the next flush unless it was saved again meanwhile
+                    self._pending.setdefault(pr_id, data)
+                    error = error or e
+            if error is not None:
+                raise error
+
     async def delete(self, pr_id: str) -> None:
-        """Delete PR state file."""
+        """Delete PR state file and any pending save."""
         file_path = self._get_file_path(pr_id)
 
-        if file_path.exists():
+        async with self._write_lock:
+            self._pending.pop(pr_id, None)
             try:
-                file_path.unlink()
+                await asyncio.to_thread(file_path.unlink, missing_ok=True)
                 self.logger.debug(f"Deleted state for {pr_id}")
             except Exception as e:
                 self.logger.error(f"Failed to delete state for {pr_id}: {e}")
                 raise
+
+    async def close(self) -> None:
+        """Cancel the scheduled flush and write pending states."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        await self.flush()
+
+    @staticmethod
+    def _read_state_file(file_path: Path) -> Optional[dict]:
+        """Read a state file, returning None if it doesn't exist (blocking)."""
+        try:
+            raw = file_path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+        return json_utils.loads(raw)
+
+    def _write_state_file(self, file_path: Path, data: dict) -> None:
+        """Write a state file through a temporary file and atomic rename (blocking)."""
+        payload = json_utils.dumps(data, indent=True)
+
+        prefix = f".{file_path.name}."
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.base_path, prefix=prefix, suffix=".tmp")
+        except FileNotFoundError:
+            # Create the directory on the first save instead of checking for it on every save
+            self.base_path.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.base_path, prefix=prefix, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+
+_CREATE_STATE_TABLE = """
+    CREATE TABLE IF NOT EXISTS pr_state (
+        pr_id TEXT PRIMARY KEY,
+        data BLOB NOT NULL,
+        updated_at REAL NOT NULL
+    )
+"""
+
+
+class SQLiteStateStore(StateStore):
+    """
+    SQLite-based state storage implementation.
+
+    Stores every PR's state as a JSON blob in a single table keyed by PR ID,
+    so loads are an index lookup and saves a single upsert. One connection is
+    kept open in WAL mode and writes are serialized through a lock.
+    """
+
+    def __init__(self, db_path: str = ".pr_agent_state.db"):
+        """
+        Initialize SQLite state store.
+
+        Args:
+            db_path: Path of the SQLite database
+        """
+        self.db_path = str(Path(db_path).expanduser())
+        self.logger = get_logger()
+        self._db: Optional[aiosqlite.Connection] = None
+        self._lock = asyncio.Lock()
+
+    async def _connection(self) -> aiosqlite.Connection:
+        """Open the database connection and create the schema on first use."""
+        if self._db is not None:
+            return self._db
+
+        async with self._lock:
+            # Another caller may have opened the connection while this one waited
+            if self._db is None:
+                Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+                db = await aiosqlite.connect(self.db_path)
+                try:
+                    await db.execute("PRAGMA journal_mode=WAL")
+                    await db.execute("PRAGMA synchronous=NORMAL")
+                    await db.execute(_CREATE_STATE_TABLE)
+                    await db.commit()
+                except BaseException:
+                    await db.close()
+                    raise
+                self._db = db
+
+        return self._db
+
+    @staticmethod
+    def _encode(state: PRState) -> bytes:
+        """Serialize a PR state to JSON bytes."""
+        return json_utils.dumps(state.to_dict())
+
+    @staticmethod
+    def _decode(data: bytes) -> dict:
+        """Deserialize JSON bytes stored by _encode."""
+        return json_utils.loads(data)
+
+    async def load(self, pr_id: str) -> Optional[PRState]:
+        """Load PR state from the database."""
+        try:
+            db = await self._connection()
+            async with db.execute("SELECT data FROM pr_state WHERE pr_id = ?", (pr_id,)) as cursor:
+                row = await cursor.fetchone()
+        except Exception as e:
+            self.logger.error(f"Failed to load state for {pr_id}: {e}")
+            return None
+
+        if row is None:
+            self.logger.debug(f"No stored state found for {pr_id}")
+            return None
+
+        try:
+            return PRState.from_dict(self._decode(row[0]))
+        except Exception as e:
+            self.logger.error(f"Failed to load state for {pr_id}: {e}")
+            return None
+
+    async def save(self, state: PRState) -> None:
+        """Save PR state to the database."""
+        try:
+            data = self._encode(state)
+            db = await self._connection()
+            async with self._lock:
+                await db.execute(
+                    "INSERT OR REPLACE INTO pr_state (pr_id, data, updated_at) VALUES (?, ?, ?)",
+                    (state.pr_id, data, time.time())
+                )
+                await db.commit()
+            self.logger.debug(f"Saved state for {state.pr_id}")
+        except Exception as e:
+            self.logger.error(f"Failed to save state for {state.pr_id}: {e}")
+            raise
+
+    async def delete(self, pr_id: str) -> None:
+        """Delete PR state from the database."""
+        try:
+            db = await self._connection()
+            async with self._lock:
+                await db.execute("DELETE FROM pr_state WHERE pr_id = ?", (pr_id,))
+                await db.commit()
+            self.logger.debug(f"Deleted state for {pr_id}")
+        except Exception as e:
+            self.logger.error(f"Failed to delete state for {pr_id}: {e}")
+            raise
+
+    async def close(self) -> None:
+        """
+        Close the database connection.
+
+        The connection is reopened lazily if the store is used again.
+        """
+        async with self._lock:
+            if self._db is not None:
+                await self._db.close()
+                self._db = None
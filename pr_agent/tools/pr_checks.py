@@ -7,12 +7,18 @@ This tool executes custom checks against a PR and reports results
 either as GitHub check runs or as PR comments.
 """
 
+import asyncio
+import hashlib
+import io
+from collections import OrderedDict
 from functools import partial
 from typing import Optional
 
+from tenacity import retry, stop_after_attempt, wait_exponential
+
+from pr_agent.algo import json_utils
 from pr_agent.algo.ai_handlers.base_ai_handler import BaseAiHandler
 from pr_agent.algo.ai_handlers.litellm_ai_handler import LiteLLMAIHandler
-from pr_agent.algo.pr_processing import get_pr_diff
 from pr_agent.checks.base_check import BaseCheck
 from pr_agent.checks.check_context import CheckContext
 from pr_agent.checks.check_result import CheckResult
@@ -28,6 +34,52 @@ from pr_agent.config_loader import get_settings
 from pr_agent.git_providers.git_provider import get_git_provider_with_context
 from pr_agent.log import get_logger
 
+# Keys of the [checks] section that configure the checks tool rather than define a check
+META_KEYS = frozenset([
+    "enable_auto_checks", "default_mode", "parallel_execution", "enable_auto_checks_feedback",
+    "excluded_checks_list", "persistent_comment", "enable_help_text", "final_update_message",
+    "max_llm_concurrency", "batch_llm_checks", "batch_rules", "max_rules_per_batch",
+    "cache_policy", "cache_db_path", "background_reporting",
+])
+
+# Local (non-LLM) checks built from identical configuration, reused across runs; least recently used first.
+# Free-text rule checks are always rebuilt, since their AI handler is bound to the current request's settings.
+_CHECKS_CACHE: "OrderedDict[str, BaseCheck]" = OrderedDict()
+MAX_CHECKS_CACHE_ENTRIES = 256
+
+
+def _check_cache_key(name: str, check_type: str, config: dict, default_mode: str) -> str:
+    """
+    Compute the cache key of a check definition.
+
+    Args:
+        name: Check name
+        check_type: Check type
+        config: Check configuration section
+        default_mode: Mode applied when the section sets none
+
+    Returns:
+        Hex digest identifying the check definition
+    """
+    key_data = [name, check_type, default_mode, config]
+    payload = json_utils.dumps(key_data, sort_keys=True, default=str)
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+# Results comment status icon by outcome ("pass", or the severity of a failed result)
+_ICON = {"pass": "✅", "error": "❌", "warning": "⚠️", "info": "ℹ️"}
+# Results comment badge by check mode
+_MODE_BADGE = {"blocking": "🔒 **BLOCKING**", "advisory": "💡 Advisory"}
+
+# Attempts at publishing the results comment before giving up
+PUBLISH_RETRIES = 3
+
+# Header that identifies the persistent results comment on the PR
+_COMMENT_HEADER = "## 🔍 PR Checks Results"
+
+# Reporting tasks detached from run(); referenced here so they are not garbage collected mid-flight
+_background_tasks: set[asyncio.Task] = set()
+
 
 class PRChecks:
     """
@@ -75,7 +127,13 @@ class PRChecks:
             results = await orchestrator.run_all(context)
 
             # Report results
-            await self._report_results(checks, results)
+            if get_settings().get("checks", {}).get("background_reporting", False):
+                # Return to the caller (e.g. a webhook handler) without waiting on provider API calls
+                task = asyncio.create_task(self._report_results(checks, results))
+                _background_tasks.add(task)
+                task.add_done_callback(_background_tasks.discard)
+            else:
+                await self._report_results(checks, results)
 
             self.logger.info(f"Checks completed: {len(results)} checks run")
 
@@ -90,23 +148,21 @@ class PRChecks:
         Looks for check definitions in .pr_agent.toml under [checks.*] sections.
         """
         checks = []
-        settings = get_settings()
+        checks_config = get_settings().get("checks", {})
 
         # Check if checks are enabled
-        if not settings.get("checks", {}).get("enable_auto_checks", False):
+        if not checks_config.get("enable_auto_checks", False):
             self.logger.debug("Auto checks are not enabled")
             return checks
 
         try:
             # Get all check configurations
             # The configuration format is: [checks.<check_name>]
-            checks_config = settings.get("checks", {})
+            default_mode = checks_config.get("default_mode", "advisory")
 
             for key in checks_config.keys():
                 # Skip meta-configuration keys
-                if key in ["enable_auto_checks", "default_mode", "parallel_execution",
-                          "enable_auto_checks_feedback", "excluded_checks_list",
-                          "persistent_comment", "enable_help_text", "final_update_message"]:
+                if key in META_KEYS:
                     continue
 
                 # This is a check configuration
@@ -119,8 +175,20 @@ class PRChecks:
                 # Get check type
                 check_type = check_config.get("type", "pattern")
 
-                # Create appropriate check instance
-                check = await self._create_check(key, check_type, check_config)
+                # Create appropriate check instance, reusing one built from the same definition
+                if check_type == "free_text":
+                    check = await self._create_check(key, check_type, check_config, default_mode)
+                else:
+                    cache_key = _check_cache_key(key, check_type, check_config, default_mode)
+                    check = _CHECKS_CACHE.get(cache_key)
+                    if check is not None:
+                        _CHECKS_CACHE.move_to_end(cache_key)
+                    else:
+                        check = await self._create_check(key, check_type, check_config, default_mode)
+                        if check:
+                            _CHECKS_CACHE[cache_key] = check
+                            if len(_CHECKS_CACHE) > MAX_CHECKS_CACHE_ENTRIES:
+                                _CHECKS_CACHE.popitem(last=False)
                 if check:
                     checks.append(check)
 
@@ -129,12 +197,23 @@ class PRChecks:
 
         return checks
 
-    async def _create_check(self, name: str, check_type: str, config: dict) -> Optional[BaseCheck]:
+    async def _create_check(
+        self,
+        name: str,
+        check_type: str,
+        config: dict,
+        default_mode: Optional[str] = None
+    ) -> Optional[BaseCheck]:
         """Create a check instance from configuration."""
         try:
             # Extract common parameters
             description = config.get("description", name)
-            mode = config.get("mode", get_settings().get("checks", {}).get("default_mode", "advisory"))
+            if "mode" in config:
+                mode = config["mode"]
+            else:
+                if default_mode is None:
+                    default_mode = get_settings().get("checks", {}).get("default_mode", "advisory")
+                mode = default_mode
             paths = config.get("paths", None)
             exclude_paths = config.get("exclude_paths", None)
 
@@ -212,10 +291,32 @@ class PRChecks:
 
     async def _build_check_context(self) -> CheckContext:
         """Build context for check execution."""
-        # Get diff files
-        patches = await get_pr_diff(self.git_provider, self.git_provider.incremental)
+        # Provider calls are blocking and providers are not thread-safe (they memoize
+        # results and lazily complete API objects), so fetch everything in one worker thread
+        patches, pr_description, pr_labels, pr_title, pr_author = await asyncio.to_thread(self._fetch_pr_data)
         files_changed = [p.filename for p in patches]
 
+        # Build context
+        context = CheckContext(
+            pr_url=self.pr_url,
+            pr_title=pr_title,
+            pr_description=pr_description,
+            pr_author=pr_author,
+            pr_labels=pr_labels,
+            files_changed=files_changed,
+            patches=patches,
+            git_provider=self.git_provider,
+            config_getter=lambda: get_settings().as_dict()
+        )
+
+        return context
+
+    def _fetch_pr_data(self) -> tuple:
+        """Fetch the diff files, description, labels, title and author of the PR (blocking)."""
+        patches = self.git_provider.get_diff_files()
+        pr_description = self.git_provider.get_pr_description()
+        pr_labels = self._get_pr_labels()
+
         # Extract PR data from git provider
         # Use hasattr checks for safety across different provider implementations
         pr_title = ""
@@ -228,28 +329,16 @@ class PRChecks:
             if user:
                 pr_author = getattr(user, 'login', "")
 
-        # Get labels using the provider's accessor method
-        pr_labels = []
+        return patches, pr_description, pr_labels, pr_title, pr_author
+
+    def _get_pr_labels(self) -> list[str]:
+        """Get labels using the provider's accessor method, or an empty list if unavailable."""
         try:
             labels_obj = self.git_provider.get_pr_labels()
-            pr_labels = labels_obj if labels_obj else []
+            return labels_obj if labels_obj else []
         except Exception as e:
             self.logger.debug(f"Could not retrieve PR labels: {e}")
-
-        # Build context
-        context = CheckContext(
-            pr_url=self.pr_url,
-            pr_title=pr_title,
-            pr_description=self.git_provider.get_pr_description(),
-            pr_author=pr_author,
-            pr_labels=pr_labels,
-            files_changed=files_changed,
-            patches=patches,
-            git_provider=self.git_provider,
-            config=get_settings().as_dict()
-        )
-
-        return context
+            return []
 
     async def _report_results(self, checks: list[BaseCheck], results: dict[str, CheckResult]):
         """
@@ -268,6 +357,7 @@ class PRChecks:
         Returns True if check runs were created successfully.
         """
         try:
+            run_requests = []
             for check in checks:
                 result = results.get(check.name)
                 if not result:
@@ -297,16 +387,23 @@ class PRChecks:
 
                     output["text"] = "\n\n".join(text_lines)
 
-                # Create check run
-                check_id = self.git_provider.create_check_run(
-                    name=f"PR-Agent: {check.name}",
+                run_requests.append((check.name, conclusion, output))
+
+            # Create check runs concurrently; provider calls are blocking, so each runs in a worker thread
+            check_ids = await asyncio.gather(*(
+                asyncio.to_thread(
+                    self.git_provider.create_check_run,
+                    name=f"PR-Agent: {name}",
                     status="completed",
                     conclusion=conclusion,
                     output=output
                 )
+                for name, conclusion, output in run_requests
+            ))
 
+            for (name, _, _), check_id in zip(run_requests, check_ids):
                 if check_id:
-                    self.logger.debug(f"Created check run for '{check.name}' with ID {check_id}")
+                    self.logger.debug(f"Created check run for '{name}' with ID {check_id}")
 
             return True
 
@@ -319,11 +416,12 @@ class PRChecks:
         Create or update a comment with check results.
         """
         # Build comment markdown
-        lines = ["## 🔍 PR Checks Results\n"]
+        buf = io.StringIO()
+        buf.write(f"{_COMMENT_HEADER}\n\n")
 
         # Add check run notice if created
         if check_runs_created:
-            lines.append("_Check details are also available in the Checks tab above._\n")
+            buf.write("_Check details are also available in the Checks tab above._\n\n")
 
         # Count results
         passed_count = sum(1 for r in results.values() if r.passed)
@@ -331,9 +429,9 @@ class PRChecks:
 
         # Add summary
         if failed_count == 0:
-            lines.append(f"✅ **All {len(results)} checks passed!**\n")
+            buf.write(f"✅ **All {len(results)} checks passed!**\n\n")
         else:
-            lines.append(f"⚠️ **{failed_count} of {len(results)} checks failed**\n")
+            buf.write(f"⚠️ **{failed_count} of {len(results)} checks failed**\n\n")
 
         # Add individual check results
         for check in checks:
@@ -341,61 +439,76 @@ class PRChecks:
             if not result:
                 continue
 
-            # Status icon
-            if result.passed:
-                icon = "✅"
-            elif result.severity == "error":
-                icon = "❌"
-            elif result.severity == "warning":
-                icon = "⚠️"
-            else:
-                icon = "ℹ️"
-
-            # Mode badge
-            mode_badge = "🔒 **BLOCKING**" if check.mode == "blocking" else "💡 Advisory"
+            icon = _ICON.get("pass" if result.passed else result.severity, _ICON["info"])
+            mode_badge = _MODE_BADGE.get(check.mode, _MODE_BADGE["advisory"])
 
-            lines.append(f"\n### {icon} {check.name} ({mode_badge})")
-            lines.append(f"\n{result.message}\n")
+            buf.write(f"\n### {icon} {check.name} ({mode_badge})\n\n{result.message}\n\n")
 
             # Add details if any
             if result.details:
-                lines.append("<details>")
-                lines.append(f"<summary>Details ({len(result.details)} finding(s))</summary>\n")
+                buf.write(f"<details>\n<summary>Details ({len(result.details)} finding(s))</summary>\n\n")
 
                 for detail in result.details:
-                    location = f"`{detail.file_path}`"
-                    if detail.line_number:
-                        location += f" line {detail.line_number}"
-
-                    lines.append(f"- {location}: {detail.message}")
+                    line_suffix = f" line {detail.line_number}" if detail.line_number else ""
+                    buf.write(f"- `{detail.file_path}`{line_suffix}: {detail.message}\n")
                     if detail.suggestion:
-                        lines.append(f"  - _💡 {detail.suggestion}_")
+                        buf.write(f"  - _💡 {detail.suggestion}_\n")
 
-                lines.append("\n</details>\n")
+                buf.write("\n</details>\n\n")
 
         # Add footer
-        lines.append("\n---")
-        lines.append("\n_Checks can be configured in `.pr_agent.toml`. See documentation for details._")
+        buf.write("\n---\n\n_Checks can be configured in `.pr_agent.toml`. See documentation for details._")
 
-        comment_body = "\n".join(lines)
+        comment_body = buf.getvalue()
 
         # Publish comment
         await self._publish_comment(comment_body)
 
     async def _publish_comment(self, comment: str):
-        """Publish a comment on the PR."""
+        """
+        Publish a comment on the PR.
+
+        Only updates of the persistent results comment are retried. Creating a
+        comment is not idempotent: a failure reported after the provider created
+        it would post a duplicate on retry, so new comments are published once.
+        """
+        checks_settings = get_settings().get("checks", {})
+        final_update_message = checks_settings.get("final_update_message", False)
         try:
-            if get_settings().get("checks", {}).get("persistent_comment", True):
-                # Use persistent comment
-                self.git_provider.publish_persistent_comment(
+            if not checks_settings.get("persistent_comment", True):
+                await asyncio.to_thread(self.git_provider.publish_comment, comment)
+            elif comment.startswith(_COMMENT_HEADER) and not final_update_message:
+                await self._publish_persistent_comment_with_retry(comment)
+            else:
+                # Messages without the header are never matched as the persistent
+                # comment, and the final update message is a new comment either way
+                await asyncio.to_thread(
+                    self.git_provider.publish_persistent_comment,
                     comment,
-                    initial_header="## 🔍 PR Checks Results",
+                    initial_header=_COMMENT_HEADER,
                     name="checks",
-                    final_update_message=get_settings().get("checks", {}).get("final_update_message", False)
+                    final_update_message=final_update_message
                 )
-            else:
-                # Regular comment
-                self.git_provider.publish_comment(comment)
-
         except Exception as e:
             self.logger.exception(f"Failed to publish comment: {e}")
+
+    @retry(
+        stop=stop_after_attempt(PUBLISH_RETRIES),
+        wait=wait_exponential(multiplier=1, max=8),
+        reraise=True
+    )
+    async def _publish_persistent_comment_with_retry(self, comment: str):
+        """
+        Publish the persistent checks comment, retrying transient provider failures with exponential backoff.
+
+        Retrying is safe because the comment starts with _COMMENT_HEADER: a
+        retry finds a comment created by a failed attempt and updates it in
+        place instead of adding a second one.
+        """
+        await asyncio.to_thread(
+            self.git_provider.publish_persistent_comment,
+            comment,
+            initial_header=_COMMENT_HEADER,
+            name="checks",
+            final_update_message=False
+        )
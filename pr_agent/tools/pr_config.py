@@ -1,3 +1,6 @@
+import os
+import re
+from functools import lru_cache
 from pathlib import Path
 from dynaconf import Dynaconf
 
@@ -5,6 +8,43 @@ from pr_agent.config_loader import get_settings, _find_repository_root
 from pr_agent.git_providers import get_git_provider
 from pr_agent.log import get_logger
 
+# Settings never shown by /config (compared lowercased)
+SKIP_KEYS = frozenset(key.lower() for key in [
+    'ai_disclaimer', 'ai_disclaimer_title', 'ANALYTICS_FOLDER', 'secret_provider', "skip_keys", "app_id", "redirect",
+    'trial_prefix_message', 'no_eligible_message', 'identity_provider', 'ALLOWED_REPOS',
+    'APP_NAME', 'PERSONAL_ACCESS_TOKEN', 'shared_secret', 'key', 'AWS_ACCESS_KEY_ID', 'AWS_SECRET_ACCESS_KEY', 'user_token',
+    'private_key', 'private_key_id', 'client_id', 'client_secret', 'token', 'bearer_token', 'jira_api_token', 'webhook_secret'
+])
+# Settings whose lowercased name contains any of these fragments are never shown either
+PARTIAL_SKIP_KEYS_RE = re.compile("|".join(map(re.escape, ['key', 'secret', 'token', 'private'])))
+
+
+@lru_cache(maxsize=4)
+def _load_configuration_headers(conf_file: str, mtime: float) -> frozenset[str]:
+    """
+    Parse configuration.toml and return its lowercased section headers.
+
+    Args:
+        conf_file: Path to configuration.toml
+        mtime: Modification time of the file, so an edited file is parsed again
+
+    Returns:
+        Lowercased section headers of the file
+    """
+    dynconf_kwargs = {'core_loaders': [],  # DISABLE default loaders, otherwise will load toml files more than once.
+         'loaders': ['pr_agent.custom_merge_loader'],
+         # Use a custom loader to merge sections, but overwrite their overlapping values. Do not use ENV variables.
+         'merge_enabled': True
+         # Merge multiple TOML files; prevent full section overwrite—only overlapping keys in sections overwrite prior ones.
+     }
+    conf_settings = Dynaconf(settings_files=[conf_file],
+                             # Security: Disable all dynamic loading features
+                             load_dotenv=False,  # Don't load .env files
+                             envvar_prefix=False,
+                             **dynconf_kwargs
+                             )
+    return frozenset(header.lower() for header in conf_settings.keys())
+
 
 class PRConfig:
     """
@@ -123,103 +163,86 @@ class PRConfig:
         Returns:
             Markdown formatted validation report
         """
-        report = "## 🔍 Path-Scoped Configuration Validation\n\n"
+        parts = ["## 🔍 Path-Scoped Configuration Validation\n\n"]
 
         # Overall status
         if not issues:
-            report += "✅ **All configurations are valid!**\n\n"
+            parts.append("✅ **All configurations are valid!**\n\n")
         else:
-            report += f"⚠️ **Found {len(issues)} validation issue(s)**\n\n"
+            parts.append(f"⚠️ **Found {len(issues)} validation issue(s)**\n\n")
 
         # Summary section
-        report += "<details>\n<summary><strong>Configuration Summary</strong></summary>\n\n"
-        report += "```yaml\n"
-        report += f"Path Config Enabled: {summary['path_config_enabled']}\n"
-        report += f"Repository Root: {summary['repo_root']}\n"
-        report += f"Max Depth: {summary['max_depth']}\n"
-        report += f"Changed Files: {summary['changed_files_count']}\n"
-        report += f"Discovered Configs: {len(summary['discovered_configs'])}\n"
-        report += "```\n"
-        report += "</details>\n\n"
+        parts.append("<details>\n<summary><strong>Configuration Summary</strong></summary>\n\n")
+        parts.append("```yaml\n")
+        parts.append(f"Path Config Enabled: {summary['path_config_enabled']}\n")
+        parts.append(f"Repository Root: {summary['repo_root']}\n")
+        parts.append(f"Max Depth: {summary['max_depth']}\n")
+        parts.append(f"Changed Files: {summary['changed_files_count']}\n")
+        parts.append(f"Discovered Configs: {len(summary['discovered_configs'])}\n")
+        parts.append("```\n")
+        parts.append("</details>\n\n")
 
         # Discovered configs
         if summary['discovered_configs']:
-            report += "<details>\n<summary><strong>Discovered Configuration Files</strong></summary>\n\n"
-            report += "| File | Depth |\n"
-            report += "|------|-------|\n"
+            parts.append("<details>\n<summary><strong>Discovered Configuration Files</strong></summary>\n\n")
+            parts.append("| File | Depth |\n")
+            parts.append("|------|-------|\n")
             for config in summary['discovered_configs']:
-                report += f"| `{config['path']}` | {config['depth']} |\n"
-            report += "\n</details>\n\n"
+                parts.append(f"| `{config['path']}` | {config['depth']} |\n")
+            parts.append("\n</details>\n\n")
 
         # Issues section
         if issues:
-            report += "### ❌ Validation Issues\n\n"
+            parts.append("### ❌ Validation Issues\n\n")
             for i, issue in enumerate(issues, 1):
-                report += f"**Issue {i}:** `{issue['file']}`\n"
-                report += f"- **Type:** {issue['type']}\n"
-                report += f"- **Details:** {issue['message']}\n\n"
+                parts.append(f"**Issue {i}:** `{issue['file']}`\n")
+                parts.append(f"- **Type:** {issue['type']}\n")
+                parts.append(f"- **Details:** {issue['message']}\n\n")
 
         # Recommendations
-        report += "<details>\n<summary><strong>Configuration Best Practices</strong></summary>\n\n"
-        report += "1. ✅ Only override allowed settings in subdirectory configs\n"
-        report += "2. ✅ Never commit API keys or secrets in config files\n"
-        report += "3. ✅ Use `_merge_strategy` directive to control merge behavior\n"
-        report += "4. ✅ Keep subdirectory configs focused on path-specific overrides\n"
-        report += "5. ✅ Document why each subdirectory config is needed\n"
-        report += "\n</details>\n"
+        parts.append("<details>\n<summary><strong>Configuration Best Practices</strong></summary>\n\n")
+        parts.append("1. ✅ Only override allowed settings in subdirectory configs\n")
+        parts.append("2. ✅ Never commit API keys or secrets in config files\n")
+        parts.append("3. ✅ Use `_merge_strategy` directive to control merge behavior\n")
+        parts.append("4. ✅ Keep subdirectory configs focused on path-specific overrides\n")
+        parts.append("5. ✅ Document why each subdirectory config is needed\n")
+        parts.append("\n</details>\n")
 
-        return report
+        return "".join(parts)
 
     def _prepare_pr_configs(self) -> str:
+        settings = get_settings()
         try:
-            conf_file = get_settings().find_file("configuration.toml")
-            dynconf_kwargs = {'core_loaders': [],  # DISABLE default loaders, otherwise will load toml files more than once.
-                 'loaders': ['pr_agent.custom_merge_loader'],
-                 # Use a custom loader to merge sections, but overwrite their overlapping values. Do not use ENV variables.
-                 'merge_enabled': True
-                 # Merge multiple TOML files; prevent full section overwrite—only overlapping keys in sections overwrite prior ones.
-             }
-            conf_settings = Dynaconf(settings_files=[conf_file],
-                                     # Security: Disable all dynamic loading features
-                                     load_dotenv=False,  # Don't load .env files
-                                     envvar_prefix=False,
-                                     **dynconf_kwargs
-                                     )
+            conf_file = settings.find_file("configuration.toml")
+            # Parsed once per file version; /config calls after the first skip the Dynaconf load
+            configuration_headers = _load_configuration_headers(conf_file, os.path.getmtime(conf_file))
         except Exception as e:
             get_logger().error("Caught exception during Dynaconf loading. Returning empty dict",
                                artifact={"exception": e})
-            conf_settings = {}
-        configuration_headers = [header.lower() for header in conf_settings.keys()]
-        relevant_configs = {
-            header: configs for header, configs in get_settings().to_dict().items()
-            if (header.lower().startswith("pr_") or header.lower().startswith("config")) and header.lower() in configuration_headers
-        }
-
-        skip_keys = ['ai_disclaimer', 'ai_disclaimer_title', 'ANALYTICS_FOLDER', 'secret_provider', "skip_keys", "app_id", "redirect",
-                     'trial_prefix_message', 'no_eligible_message', 'identity_provider', 'ALLOWED_REPOS',
-                     'APP_NAME', 'PERSONAL_ACCESS_TOKEN', 'shared_secret', 'key', 'AWS_ACCESS_KEY_ID', 'AWS_SECRET_ACCESS_KEY', 'user_token',
-                     'private_key', 'private_key_id', 'client_id', 'client_secret', 'token', 'bearer_token', 'jira_api_token','webhook_secret']
-        partial_skip_keys = ['key', 'secret', 'token', 'private']
-        extra_skip_keys = get_settings().config.get('config.skip_keys', [])
+            configuration_headers = frozenset()
+        relevant_configs = {}
+        for header, configs in settings.to_dict().items():
+            header_lower = header.lower()
+            if header_lower.startswith(("pr_", "config")) and header_lower in configuration_headers:
+                relevant_configs[header] = configs
+
+        skip_keys_lower = SKIP_KEYS
+        extra_skip_keys = settings.config.get('config.skip_keys', [])
         if extra_skip_keys:
-            skip_keys.extend(extra_skip_keys)
-        skip_keys_lower = [key.lower() for key in skip_keys]
+            skip_keys_lower = skip_keys_lower.union(key.lower() for key in extra_skip_keys)
 
 
-        markdown_text = "<details> <summary><strong>🛠️ PR-Agent Configurations:</strong></summary> \n\n"
-        markdown_text += f"\n\n```yaml\n\n"
+        parts = ["<details> <summary><strong>🛠️ PR-Agent Configurations:</strong></summary> \n\n", "\n\n```yaml\n\n"]
         for header, configs in relevant_configs.items():
             if configs:
-                markdown_text += "\n\n"
-                markdown_text += f"==================== {header} ===================="
+                parts.append(f"\n\n==================== {header} ====================")
+            header_lower = header.lower()
             for key, value in configs.items():
-                if key.lower() in skip_keys_lower:
-                    continue
-                if any(skip_key in key.lower() for skip_key in partial_skip_keys):
+                key_lower = key.lower()
+                if key_lower in skip_keys_lower or PARTIAL_SKIP_KEYS_RE.search(key_lower):
                     continue
-                markdown_text += f"\n{header.lower()}.{key.lower()} = {repr(value) if isinstance(value, str) else value}"
-                markdown_text += "  "
-        markdown_text += "\n```"
-        markdown_text += "\n</details>\n"
+                parts.append(f"\n{header_lower}.{key_lower} = {repr(value) if isinstance(value, str) else value}  ")
+        parts.append("\n```\n</details>\n")
+        markdown_text = "".join(parts)
         get_logger().info(f"Possible Configurations outputted to PR comment", artifact=markdown_text)
         return markdown_text
@@ -2,38 +2,74 @@
 Unit tests for ConfigDiscovery class.
 """
 
+import io
+import os
 import pytest
-from pathlib import Path
-import tempfile
 import shutil
+import zipfile
+from pathlib import Path
 
-from pr_agent.path_config.config_discovery import ConfigDiscovery, ConfigFile, CONFIG_FILENAMES
+from pr_agent.path_config.config_discovery import ConfigDiscovery, ConfigFile, CONFIG_FILENAMES, resolve_repo_root
 
+# A changed file directly under src/, which has no config of its own in the skeleton
+SRC_CHANGED_FILES = ("src/main.py",)
 
-class TestConfigDiscovery:
-    """Test suite for ConfigDiscovery class."""
+DEPTH_CONFIG_TEMPLATE = b"[config]\ndepth = %d\n"
 
-    @pytest.fixture
-    def temp_repo(self):
-        """Create a temporary repository structure for testing."""
-        temp_dir = tempfile.mkdtemp()
-        repo_root = Path(temp_dir)
 
-        # Create directory structure
-        (repo_root / "src").mkdir()
-        (repo_root / "src" / "backend").mkdir()
-        (repo_root / "src" / "frontend").mkdir()
-        (repo_root / "tests").mkdir()
+def _build_config_zip(configs):
+    """Pack a mapping of repo-relative config paths to contents into an in-memory zip archive."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for rel_path, content in configs.items():
+            archive.writestr(rel_path, content)
+    return buffer.getvalue()
 
-        # Create some files
-        (repo_root / "src" / "backend" / "main.py").touch()
-        (repo_root / "src" / "frontend" / "app.tsx").touch()
-        (repo_root / "tests" / "test_main.py").touch()
 
-        yield repo_root
+# Config layouts extracted into the repository in one pass by the tests that use them
+_NESTED_CONFIGS_ZIP = _build_config_zip({
+    ".pr_agent.toml": "[config]\nmodel = 'gpt-4'",
+    "src/.pr_agent.toml": "[pr_reviewer]\nextra_instructions = 'src level'",
+    "src/backend/.pr_agent.toml": "[pr_reviewer]\nextra_instructions = 'backend level'",
+})
+_BRANCH_CONFIGS_ZIP = _build_config_zip({
+    ".pr_agent.toml": "[config]\nroot = true",
+    "src/backend/.pr_agent.toml": "[config]\nbackend = true",
+    "src/frontend/.pr_agent.toml": "[config]\nfrontend = true",
+})
+
+# Paths for the ConfigFile tests, which never touch the filesystem
+_PATH_A = Path("/test/.pr_agent.toml")
+_PATH_B = Path("/test2/.pr_agent.toml")
+_REL = Path(".pr_agent.toml")
+
+
+@pytest.fixture(scope="session")
+def repo_skeleton(tmp_path_factory):
+    """Create the repository structure shared by the tests once per session."""
+    repo_root = tmp_path_factory.mktemp("skeleton")
+
+    # Create directory structure, one makedirs per leaf directory
+    for rel_dir in ("src/backend", "src/frontend", "tests"):
+        os.makedirs(repo_root / rel_dir)
+
+    # Create some empty files
+    for rel_file in ("src/backend/main.py", "src/frontend/app.tsx", "tests/test_main.py"):
+        os.close(os.open(repo_root / rel_file, os.O_WRONLY | os.O_CREAT, 0o644))
+
+    return repo_root
 
-        # Cleanup
-        shutil.rmtree(temp_dir)
+
+class TestConfigDiscovery:
+    """Test suite for ConfigDiscovery class."""
+
+    @pytest.fixture
+    def temp_repo(self, tmp_path, repo_skeleton):
+        """Create a temporary repository structure for testing."""
+        # Copied rather than linked: tests write configs into the skeleton's directories
+        repo_root = tmp_path / "repo"
+        shutil.copytree(repo_skeleton, repo_root)
+        return repo_root
 
     @pytest.fixture
     def discovery(self, temp_repo):
@@ -62,11 +98,7 @@ class TestConfigDiscovery:
     def test_find_nested_configs(self, temp_repo, discovery):
         """Test finding multiple nested configuration files."""
         # Create configs at different levels
-        (temp_repo / ".pr_agent.toml").write_text("[config]\nmodel = 'gpt-4'")
-        (temp_repo / "src" / ".pr_agent.toml").write_text("[pr_reviewer]\nextra_instructions = 'src level'")
-        (temp_repo / "src" / "backend" / ".pr_agent.toml").write_text(
-            "[pr_reviewer]\nextra_instructions = 'backend level'"
-        )
+        zipfile.ZipFile(io.BytesIO(_NESTED_CONFIGS_ZIP)).extractall(temp_repo)
 
         configs = discovery.discover_configs(["src/backend/main.py"])
 
@@ -76,19 +108,18 @@ class TestConfigDiscovery:
         assert configs[1].depth == 1
         assert configs[2].depth == 2
 
-    def test_alternative_config_names(self, temp_repo, discovery):
+    @pytest.mark.parametrize("config_name", CONFIG_FILENAMES, ids=list(CONFIG_FILENAMES))
+    def test_alternative_config_names(self, temp_repo, config_name):
         """Test support for alternative config file names."""
-        # Test each supported name
-        for config_name in CONFIG_FILENAMES:
-            config_path = temp_repo / config_name
-            config_path.write_text("[config]\ntest = true")
+        config_path = temp_repo / config_name
+        config_path.write_text("[config]\ntest = true")
 
-            configs = discovery.discover_configs(["src/main.py"])
-            assert len(configs) == 1
-            assert configs[0].path == config_path
+        # A fresh instance per case, so no discovery cache carries over
+        discovery = ConfigDiscovery(temp_repo, max_depth=5)
+        configs = discovery.discover_configs(list(SRC_CHANGED_FILES))
 
-            # Clean up for next iteration
-            config_path.unlink()
+        assert len(configs) == 1
+        assert configs[0].path == config_path
 
     def test_config_precedence(self, temp_repo, discovery):
         """Test that first config name in precedence list wins."""
@@ -104,16 +135,12 @@ class TestConfigDiscovery:
     def test_max_depth_limit(self, temp_repo):
         """Test that max_depth limit is enforced."""
         # Create deep nested structure
-        deep_path = temp_repo / "a" / "b" / "c" / "d" / "e" / "f"
-        deep_path.mkdir(parents=True)
-        (deep_path / "file.py").touch()
+        os.makedirs(temp_repo / "a" / "b" / "c" / "d" / "e" / "f")
+        (temp_repo / "a" / "b" / "c" / "d" / "e" / "f" / "file.py").touch()
 
         # Create configs at various depths
-        (temp_repo / ".pr_agent.toml").write_text("[config]\ndepth = 0")
-        (temp_repo / "a" / ".pr_agent.toml").write_text("[config]\ndepth = 1")
-        (temp_repo / "a" / "b" / "c" / ".pr_agent.toml").write_text("[config]\ndepth = 3")
-        (temp_repo / "a" / "b" / "c" / "d" / "e" / ".pr_agent.toml").write_text("[config]\ndepth = 5")
-        (temp_repo / "a" / "b" / "c" / "d" / "e" / "f" / ".pr_agent.toml").write_text("[config]\ndepth = 6")
+        for rel_dir, depth in ((".", 0), ("a", 1), ("a/b/c", 3), ("a/b/c/d/e", 5), ("a/b/c/d/e/f", 6)):
+            (temp_repo / rel_dir / ".pr_agent.toml").write_bytes(DEPTH_CONFIG_TEMPLATE % depth)
 
         # With max_depth=5, should stop before the deepest config
         discovery = ConfigDiscovery(temp_repo, max_depth=5)
@@ -142,6 +169,56 @@ class TestConfigDiscovery:
         assert cache_size1 == 1
         assert cache_size2 == 1  # Cache should still have 1 entry
 
+    def test_cache_ignores_file_order(self, temp_repo, discovery):
+        """Test that the same changed files in a different order hit the cache."""
+        (temp_repo / ".pr_agent.toml").write_text("[config]\nmodel = 'gpt-4'")
+
+        configs1 = discovery.discover_configs(["src/backend/main.py", "tests/test_main.py"])
+        configs2 = discovery.discover_configs(["tests/test_main.py", "src/backend/main.py"])
+
+        assert configs1 is configs2
+        assert discovery.get_cache_size() == 1
+
+    def test_directory_lookups_shared(self, temp_repo, discovery, monkeypatch):
+        """Test that each directory is looked up on disk only once across changed files."""
+        (temp_repo / ".pr_agent.toml").write_text("[config]\nmodel = 'gpt-4'")
+        scanned = []
+        scan = discovery._scan_config_at_path
+        monkeypatch.setattr(discovery, "_scan_config_at_path", lambda d: scanned.append(d) or scan(d))
+
+        configs = discovery.discover_configs(["src/backend/main.py", "src/backend/util.py", "src/app.py"])
+
+        assert [c.depth for c in configs] == [0]
+        assert len(scanned) == len(set(scanned))
+
+    def test_ancestor_chains_reused(self, temp_repo, discovery, monkeypatch):
+        """Test that later discoveries splice in the config chain of already walked ancestors."""
+        (temp_repo / ".pr_agent.toml").write_text("[config]\nmodel = 'gpt-4'")
+        (temp_repo / "src" / ".pr_agent.toml").write_text("[pr_reviewer]\nnum_max_findings = 3")
+        discovery.discover_configs(["src/backend/main.py"])
+
+        looked_up = []
+        find = discovery._find_config_at_path
+        monkeypatch.setattr(discovery, "_find_config_at_path", lambda d: looked_up.append(d) or find(d))
+
+        configs = discovery.discover_configs(["src/backend/api/routes.py"])
+
+        assert [c.relative_path for c in configs] == [Path(".pr_agent.toml"), Path("src/.pr_agent.toml")]
+        assert looked_up == [str(discovery.repo_root), str(discovery.repo_root / "src" / "backend" / "api")]
+
+    def test_shared_ancestors_keep_depth_budget(self, temp_repo):
+        """Test that a walk cut short by max_depth does not hide ancestors from shallower files."""
+        (temp_repo / "a" / "b" / "c").mkdir(parents=True)
+        (temp_repo / "a" / ".pr_agent.toml").write_text("[config]\ndepth = 1")
+        discovery = ConfigDiscovery(temp_repo, max_depth=1)
+
+        visited = {}
+        assert discovery._walk_up_from_directory(temp_repo / "a" / "b" / "c", visited) == []
+        configs = discovery._walk_up_from_directory(temp_repo / "a" / "b", visited)
+
+        assert [c.relative_path for c in configs] == [Path("a/.pr_agent.toml")]
+        assert discovery._walk_up_from_directory(temp_repo / "a" / "b" / "c", visited) == []
+
     def test_clear_cache(self, temp_repo, discovery):
         """Test cache clearing."""
         (temp_repo / ".pr_agent.toml").write_text("[config]\nmodel = 'gpt-4'")
@@ -174,9 +251,7 @@ class TestConfigDiscovery:
     def test_multiple_files_discovery(self, temp_repo, discovery):
         """Test discovery with multiple changed files."""
         # Create configs in different branches
-        (temp_repo / ".pr_agent.toml").write_text("[config]\nroot = true")
-        (temp_repo / "src" / "backend" / ".pr_agent.toml").write_text("[config]\nbackend = true")
-        (temp_repo / "src" / "frontend" / ".pr_agent.toml").write_text("[config]\nfrontend = true")
+        zipfile.ZipFile(io.BytesIO(_BRANCH_CONFIGS_ZIP)).extractall(temp_repo)
 
         changed_files = [
             "src/backend/main.py",
@@ -190,21 +265,54 @@ class TestConfigDiscovery:
         config_paths = [str(c.relative_path) for c in configs]
         assert ".pr_agent.toml" in config_paths  # root
 
+
+class TestConfigFile:
+    """Test suite for ConfigFile, which needs no repository or discovery instance."""
+
     def test_config_file_hashable(self):
         """Test that ConfigFile objects are hashable."""
-        config1 = ConfigFile(Path("/test/.pr_agent.toml"), depth=0, relative_path=Path(".pr_agent.toml"))
-        config2 = ConfigFile(Path("/test/.pr_agent.toml"), depth=0, relative_path=Path(".pr_agent.toml"))
+        config1 = ConfigFile(_PATH_A, depth=0, relative_path=_REL)
+        config2 = ConfigFile(_PATH_A, depth=0, relative_path=_REL)
 
         # Should be usable in sets
         config_set = {config1, config2}
         assert len(config_set) == 1
 
+    def test_config_file_has_no_instance_dict(self):
+        """Test that ConfigFile instances store only their fields, without a per-instance __dict__."""
+        config = ConfigFile(_PATH_A, depth=0, relative_path=_REL)
+
+        assert not hasattr(config, "__dict__")
+        with pytest.raises(AttributeError):
+            config.depth = 1
+
     def test_config_file_equality(self):
         """Test ConfigFile equality comparison."""
-        config1 = ConfigFile(Path("/test/.pr_agent.toml"), depth=0, relative_path=Path(".pr_agent.toml"))
-        config2 = ConfigFile(Path("/test/.pr_agent.toml"), depth=0, relative_path=Path(".pr_agent.toml"))
-        config3 = ConfigFile(Path("/test2/.pr_agent.toml"), depth=0, relative_path=Path(".pr_agent.toml"))
+        config1 = ConfigFile(_PATH_A, depth=0, relative_path=_REL)
+        config2 = ConfigFile(_PATH_A, depth=0, relative_path=_REL)
+        config3 = ConfigFile(_PATH_B, depth=0, relative_path=_REL)
 
         assert config1 == config2
         assert config1 != config3
         assert config1 != "not a config"
+
+
+class TestResolveRepoRoot:
+    """Test suite for resolve_repo_root."""
+
+    def test_absolute_root_resolved_once(self, tmp_path):
+        """Test that an absolute root resolves to the same cached Path for str and Path inputs."""
+        resolved = resolve_repo_root(str(tmp_path))
+
+        assert resolved == tmp_path.resolve()
+        assert resolve_repo_root(tmp_path) is resolved
+
+    def test_relative_root_follows_working_directory(self, tmp_path, monkeypatch):
+        """Test that a relative root is resolved against the current working directory."""
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+
+        monkeypatch.chdir(tmp_path / "a")
+        assert resolve_repo_root(".") == (tmp_path / "a").resolve()
+        monkeypatch.chdir(tmp_path / "b")
+        assert resolve_repo_root(".") == (tmp_path / "b").resolve()
@@ -2,40 +2,56 @@
 Unit tests for ConfigMerger class.
 """
 
+import json
+import os
 import pytest
 from pathlib import Path
-import tempfile
-import shutil
-from jinja2.exceptions import SecurityError
+import tomllib
 
-from pr_agent.path_config.config_merger import ConfigMerger, MergeStrategy
+from pr_agent.path_config import config_merger as config_merger_module
+from pr_agent.path_config.config_merger import ConfigMerger, MergeStrategy, SecurityError
 from pr_agent.path_config.config_discovery import ConfigFile
+from pr_agent.path_config.config_resolver import ConfigResolver
+
+# Config contents shared by several tests
+ROOT_REVIEWER_TOML = b"[pr_reviewer]\nnum_max_findings = 3\n"
+CHILD_MODEL_TOML = b'[config]\nmodel = "forbidden"  # Not allowed in subdirectory\n'
+
+# Relative paths of the root and src/ configs used throughout the tests
+_ROOT_REL = Path(".pr_agent.toml")
+_SRC_REL = Path("src/.pr_agent.toml")
+
+
+def config_file_at(path, depth=0):
+    """Build a ConfigFile for a root config, or for a src/ config when depth is 1."""
+    return ConfigFile(path, depth=depth, relative_path=_SRC_REL if depth else _ROOT_REL)
 
 
 class TestConfigMerger:
     """Test suite for ConfigMerger class."""
 
     @pytest.fixture
-    def temp_repo(self):
-        """Create a temporary repository structure for testing."""
-        temp_dir = tempfile.mkdtemp()
-        repo_root = Path(temp_dir)
-        repo_root.mkdir(exist_ok=True)
-
-        yield repo_root
+    def child_dir(self, tmp_path):
+        """Create a subdirectory to hold a child config."""
+        child_dir = tmp_path / "src"
+        child_dir.mkdir()
+        return child_dir
 
-        # Cleanup
-        shutil.rmtree(temp_dir)
+    @pytest.fixture(scope="class")
+    def shared_merger(self, tmp_path_factory):
+        """Create one ConfigMerger for the tests that use the default overrides."""
+        return ConfigMerger(tmp_path_factory.mktemp("merger_root"), max_depth=5)
 
     @pytest.fixture
-    def merger(self, temp_repo):
-        """Create a ConfigMerger instance."""
-        return ConfigMerger(temp_repo, max_depth=5)
+    def merger(self, shared_merger):
+        """Provide the shared ConfigMerger with its parse and validation caches cleared."""
+        shared_merger.clear_cache()
+        return shared_merger
 
-    def test_init(self, temp_repo):
+    def test_init(self, tmp_path):
         """Test ConfigMerger initialization."""
-        merger = ConfigMerger(temp_repo, max_depth=3)
-        assert merger.repo_root == temp_repo.resolve()
+        merger = ConfigMerger(tmp_path, max_depth=3)
+        assert merger.repo_root == tmp_path.resolve()
         assert merger.max_depth == 3
         assert len(merger.allowed_overrides) > 0
         assert len(merger.denied_overrides) > 0
@@ -45,29 +61,36 @@ class TestConfigMerger:
         result = merger.merge_configs([])
         assert result == {}
 
-    def test_merge_single_config(self, temp_repo, merger):
-        """Test merging a single configuration."""
-        config_path = temp_repo / ".pr_agent.toml"
-        config_path.write_text("""
-[config]
-model = "gpt-4"
-
-[pr_reviewer]
-num_max_findings = 5
-        """)
-
-        config_file = ConfigFile(config_path, depth=0, relative_path=Path(".pr_agent.toml"))
-        result = merger.merge_configs([config_file])
-
-        assert "config" in result
-        assert result["config"]["model"] == "gpt-4"
-        assert "pr_reviewer" in result
-        assert result["pr_reviewer"]["num_max_findings"] == 5
-
-    def test_merge_override_strategy(self, temp_repo, merger):
+    @pytest.mark.parametrize("body,depth,base_config,expected", [
+        (b'[config]\nmodel = "gpt-4"\n\n[pr_reviewer]\nnum_max_findings = 5\n', 0, None,
+         [(("config", "model"), "gpt-4"), (("pr_reviewer", "num_max_findings"), 5)]),
+        (b'[pr_reviewer]\nextra_instructions = "root"\n\n[[config.skip_keys]]\nvalues = ["key1", "key2"]\n', 0, None,
+         [(("pr_reviewer", "extra_instructions"), "root")]),
+        (b'[pr_reviewer]\nextra_instructions = "This is allowed"\nnum_max_findings = 10\n', 1, None,
+         [(("pr_reviewer", "extra_instructions"), "This is allowed")]),
+        (b'[pr_reviewer]\nextra_instructions = "test"\n', 0, {"config": {"model": "gpt-3.5"}},
+         [(("config", "model"), "gpt-3.5"), (("pr_reviewer", "extra_instructions"), "test")]),
+    ], ids=["single_config", "array_of_tables", "allowed_override", "base_config"])
+    def test_merge_single_file(self, tmp_path, merger, body, depth, base_config, expected):
+        """Test that merging one config file, optionally onto a base config, exposes the expected values."""
+        config_dir = tmp_path / "src" if depth else tmp_path
+        config_dir.mkdir(exist_ok=True)
+        config_path = config_dir / ".pr_agent.toml"
+        config_path.write_bytes(body)
+        config_file = config_file_at(config_path, depth=depth)
+
+        result = merger.merge_configs([config_file], base_config=base_config)
+
+        for key_path, value in expected:
+            node = result
+            for key in key_path:
+                node = node[key]
+            assert node == value, key_path
+
+    def test_merge_override_strategy(self, tmp_path, merger, child_dir):
         """Test that child configs override parent values."""
         # Root config
-        root_config = temp_repo / ".pr_agent.toml"
+        root_config = tmp_path / ".pr_agent.toml"
         root_config.write_text("""
 [pr_reviewer]
 extra_instructions = "root instructions"
@@ -75,8 +98,6 @@ num_max_findings = 3
         """)
 
         # Child config
-        child_dir = temp_repo / "src"
-        child_dir.mkdir()
         child_config = child_dir / ".pr_agent.toml"
         child_config.write_text("""
 [pr_reviewer]
@@ -84,8 +105,8 @@ extra_instructions = "child instructions"
         """)
 
         config_files = [
-            ConfigFile(root_config, depth=0, relative_path=Path(".pr_agent.toml")),
-            ConfigFile(child_config, depth=1, relative_path=Path("src/.pr_agent.toml"))
+            config_file_at(root_config),
+            config_file_at(child_config, depth=1)
         ]
 
         result = merger.merge_configs(config_files)
@@ -95,71 +116,15 @@ extra_instructions = "child instructions"
         # But root value for num_max_findings should remain if not overridden
         assert result["pr_reviewer"]["num_max_findings"] == 3
 
-    def test_merge_extend_lists(self, temp_repo, merger):
-        """Test that lists can be extended based on strategy."""
-        root_config = temp_repo / ".pr_agent.toml"
-        root_config.write_text("""
-[pr_reviewer]
-extra_instructions = "root"
-
-[[config.skip_keys]]
-values = ["key1", "key2"]
-        """)
-
-        result = merger.merge_configs([
-            ConfigFile(root_config, depth=0, relative_path=Path(".pr_agent.toml"))
-        ])
-
-        assert "pr_reviewer" in result
-
-    def test_validate_denied_overrides(self, temp_repo, merger):
-        """Test that denied overrides are rejected in subdirectory configs."""
-        child_dir = temp_repo / "src"
-        child_dir.mkdir()
-        child_config = child_dir / ".pr_agent.toml"
-        child_config.write_text("""
-[config]
-model = "gpt-4"  # This should be denied
-
-[openai]
-key = "secret"  # This should also be denied
-        """)
-
-        config_file = ConfigFile(child_config, depth=1, relative_path=Path("src/.pr_agent.toml"))
-
-        with pytest.raises(SecurityError) as exc_info:
-            merger.merge_configs([config_file])
-
-        assert "cannot be overridden" in str(exc_info.value).lower()
-
-    def test_allowed_overrides_accepted(self, temp_repo, merger):
-        """Test that allowed overrides work in subdirectory configs."""
-        child_dir = temp_repo / "src"
-        child_dir.mkdir()
-        child_config = child_dir / ".pr_agent.toml"
-        child_config.write_text("""
-[pr_reviewer]
-extra_instructions = "This is allowed"
-num_max_findings = 10
-        """)
-
-        config_file = ConfigFile(child_config, depth=1, relative_path=Path("src/.pr_agent.toml"))
-
-        # Should not raise an error
-        result = merger.merge_configs([config_file])
-        assert result["pr_reviewer"]["extra_instructions"] == "This is allowed"
-
-    def test_merge_strategy_directive(self, temp_repo, merger):
+    def test_merge_strategy_directive(self, tmp_path, merger, child_dir):
         """Test _merge_strategy directive in config."""
-        root_config = temp_repo / ".pr_agent.toml"
+        root_config = tmp_path / ".pr_agent.toml"
         root_config.write_text("""
 [pr_reviewer]
 extra_instructions = "root"
 num_max_findings = 3
         """)
 
-        child_dir = temp_repo / "src"
-        child_dir.mkdir()
         child_config = child_dir / ".pr_agent.toml"
         child_config.write_text("""
 [pr_reviewer]
@@ -168,8 +133,8 @@ extra_instructions = "child"
         """)
 
         config_files = [
-            ConfigFile(root_config, depth=0, relative_path=Path(".pr_agent.toml")),
-            ConfigFile(child_config, depth=1, relative_path=Path("src/.pr_agent.toml"))
+            config_file_at(root_config),
+            config_file_at(child_config, depth=1)
         ]
 
         result = merger.merge_configs(config_files)
@@ -177,43 +142,52 @@ extra_instructions = "child"
         # Both values should be present due to extend strategy
         assert "pr_reviewer" in result
 
-    def test_security_validation(self, temp_repo, merger):
-        """Test that security validation is applied to all configs."""
-        config_path = temp_repo / ".pr_agent.toml"
-        config_path.write_text("""
-[config]
-model = "gpt-4"
-
-[dangerous]
-dynaconf_include = ["other_file.toml"]
-        """)
-
-        config_file = ConfigFile(config_path, depth=0, relative_path=Path(".pr_agent.toml"))
+    @pytest.mark.parametrize("body,depth,issue_type,expected", [
+        (b'[config]\nmodel = "x"\n', 1, "security_violation", "cannot be overridden"),
+        (b'[openai]\nkey = "s"\n', 1, "security_violation", "cannot be overridden"),
+        (b'[dangerous]\ndynaconf_include = ["x"]\n', 0, "load_error", "dynaconf"),
+    ], ids=["denied_config_model", "denied_openai_key", "dynaconf_directive"])
+    def test_security_violations_rejected(self, tmp_path, merger, body, depth, issue_type, expected):
+        """Test that denied overrides and dangerous directives are reported and left out of the merge."""
+        config_files = []
+        expected_config = {}
+        if depth:
+            # A valid root layer must still be merged when the child layer is rejected
+            root_config = tmp_path / ".pr_agent.toml"
+            root_config.write_bytes(ROOT_REVIEWER_TOML)
+            config_files.append(config_file_at(root_config))
+            expected_config = tomllib.loads(ROOT_REVIEWER_TOML.decode())
+        config_dir = tmp_path / "src" if depth else tmp_path
+        config_dir.mkdir(exist_ok=True)
+        config_path = config_dir / ".pr_agent.toml"
+        config_path.write_bytes(body)
+        config_files.append(config_file_at(config_path, depth=depth))
+
+        issues = []
+        result = merger.merge_configs(config_files, issues=issues)
+        assert [(issue["file"], issue["type"]) for issue in issues] == [
+            (str(config_files[-1].relative_path), issue_type)
+        ]
+        assert expected in issues[0]["message"].lower()
+        assert result == expected_config
 
-        with pytest.raises(SecurityError):
-            merger.merge_configs([config_file])
+        # The resolver must not expose the rejected layer for files under it either
+        resolved = ConfigResolver(tmp_path, max_depth=5).get_config_for_file("src/app.py")
+        assert dict(resolved.config) == expected_config
 
-    def test_validate_config_consistency(self, temp_repo, merger):
+    def test_validate_config_consistency(self, tmp_path, merger, child_dir):
         """Test configuration validation method."""
         # Create valid root config
-        root_config = temp_repo / ".pr_agent.toml"
-        root_config.write_text("""
-[pr_reviewer]
-num_max_findings = 3
-        """)
+        root_config = tmp_path / ".pr_agent.toml"
+        root_config.write_bytes(ROOT_REVIEWER_TOML)
 
         # Create invalid child config
-        child_dir = temp_repo / "src"
-        child_dir.mkdir()
         child_config = child_dir / ".pr_agent.toml"
-        child_config.write_text("""
-[config]
-model = "forbidden"  # Not allowed in subdirectory
-        """)
+        child_config.write_bytes(CHILD_MODEL_TOML)
 
         config_files = [
-            ConfigFile(root_config, depth=0, relative_path=Path(".pr_agent.toml")),
-            ConfigFile(child_config, depth=1, relative_path=Path("src/.pr_agent.toml"))
+            config_file_at(root_config),
+            config_file_at(child_config, depth=1)
         ]
 
         issues = merger.validate_config_consistency(config_files)
@@ -221,16 +195,34 @@ model = "forbidden"  # Not allowed in subdirectory
         assert len(issues) > 0
         assert any(issue["type"] == "security_violation" for issue in issues)
 
-    def test_validate_config_consistency_all_valid(self, temp_repo, merger):
+    def test_merge_configs_collects_issues(self, tmp_path, merger, child_dir):
+        """Test that merge_configs reports validation issues while merging valid configs."""
+        root_config = tmp_path / ".pr_agent.toml"
+        root_config.write_bytes(ROOT_REVIEWER_TOML)
+
+        child_config = child_dir / ".pr_agent.toml"
+        child_config.write_bytes(CHILD_MODEL_TOML)
+
+        issues = []
+        result = merger.merge_configs([
+            config_file_at(root_config),
+            config_file_at(child_config, depth=1),
+            ConfigFile(child_dir / "missing.toml", depth=1, relative_path=Path("src/missing.toml"))
+        ], issues=issues)
+
+        assert result == {"pr_reviewer": {"num_max_findings": 3}}
+        assert [(issue["file"], issue["type"]) for issue in issues] == [
+            ("src/.pr_agent.toml", "security_violation"),
+            ("src/missing.toml", "load_error"),
+        ]
+
+    def test_validate_config_consistency_all_valid(self, tmp_path, merger):
         """Test validation with all valid configs."""
-        root_config = temp_repo / ".pr_agent.toml"
-        root_config.write_text("""
-[pr_reviewer]
-num_max_findings = 3
-        """)
+        root_config = tmp_path / ".pr_agent.toml"
+        root_config.write_bytes(ROOT_REVIEWER_TOML)
 
         config_files = [
-            ConfigFile(root_config, depth=0, relative_path=Path(".pr_agent.toml"))
+            config_file_at(root_config)
         ]
 
         issues = merger.validate_config_consistency(config_files)
@@ -259,16 +251,14 @@ num_max_findings = 3
         assert flat["config.nested.value"] == 42
         assert "pr_reviewer.extra_instructions" in flat
 
-    def test_merge_different_types(self, temp_repo, merger):
+    def test_merge_different_types(self, tmp_path, merger, child_dir):
         """Test merging when types differ (scalar vs dict)."""
-        root_config = temp_repo / ".pr_agent.toml"
+        root_config = tmp_path / ".pr_agent.toml"
         root_config.write_text("""
 [pr_reviewer]
 setting = "string_value"
         """)
 
-        child_dir = temp_repo / "src"
-        child_dir.mkdir()
         child_config = child_dir / ".pr_agent.toml"
         child_config.write_text("""
 [pr_reviewer]
@@ -276,8 +266,8 @@ setting = 42  # Different type
         """)
 
         config_files = [
-            ConfigFile(root_config, depth=0, relative_path=Path(".pr_agent.toml")),
-            ConfigFile(child_config, depth=1, relative_path=Path("src/.pr_agent.toml"))
+            config_file_at(root_config),
+            config_file_at(child_config, depth=1)
         ]
 
         result = merger.merge_configs(config_files)
@@ -285,62 +275,262 @@ setting = 42  # Different type
         # Child value should win
         assert result["pr_reviewer"]["setting"] == 42
 
-    def test_merge_with_base_config(self, temp_repo, merger):
-        """Test merging with a base configuration."""
-        base_config = {
-            "config": {
-                "model": "gpt-3.5"
-            }
+    def test_merge_dict_does_not_mutate_inputs(self, tmp_path, merger):
+        """Test that merging builds new dicts instead of modifying base or overlay."""
+        config_file = config_file_at(tmp_path / ".pr_agent.toml")
+        base = {"pr_reviewer": {"num_max_findings": 3, "labels": ["a"]}}
+        overlay = {"pr_reviewer": {"extra_instructions": "test", "labels": ["b"]}}
+
+        result = merger._merge_dict(base, overlay, config_file, is_root=True)
+
+        assert result["pr_reviewer"] == {
+            "num_max_findings": 3,
+            "labels": ["b"],
+            "extra_instructions": "test",
         }
+        assert base == {"pr_reviewer": {"num_max_findings": 3, "labels": ["a"]}}
+        assert overlay == {"pr_reviewer": {"extra_instructions": "test", "labels": ["b"]}}
+
+    def test_layered_config_get_path_memoized(self, tmp_path, merger):
+        """Test that nested lookups on a merged config are resolved once per path, including misses."""
+        config_path = tmp_path / ".pr_agent.toml"
+        config_path.write_bytes(ROOT_REVIEWER_TOML)
+        result = merger.merge_layered([config_file_at(config_path)])
+
+        assert result.get_path(("pr_reviewer", "num_max_findings")) == 3
+        assert result.get_path(("pr_reviewer", "missing"), "default") == "default"
+        assert result.get_path(("pr_reviewer", "num_max_findings", "deeper")) is None
+        assert set(result._paths) == {
+            ("pr_reviewer", "num_max_findings"), ("pr_reviewer", "missing"), ("pr_reviewer", "num_max_findings", "deeper")
+        }
+
+    def test_merge_dict_nested_sections(self, tmp_path, merger):
+        """Test that nested sections merge level by level and honor merge strategy directives."""
+        config_file = config_file_at(tmp_path / "src" / ".pr_agent.toml", depth=1)
+        base = {"a": {"b": {"c": 1, "d": 2}, "e": {"f": 3, "g": 4}}}
+        overlay = {"a": {"_merge_strategy": "extend", "b": {"_merge_strategy": "extend", "c": 5}, "e": {"f": 6}}}
+
+        result = merger._merge_dict(base, overlay, config_file)
+
+        assert result["a"]["b"] == {"c": 5, "d": 2, "_merge_strategy": "extend"}
+        assert result["a"]["e"] == {"f": 6}
+        assert base == {"a": {"b": {"c": 1, "d": 2}, "e": {"f": 3, "g": 4}}}
+
+    def test_parsed_configs_cached_until_modified(self, tmp_path, merger, monkeypatch):
+        """Test that config files are reparsed only when their modification time changes."""
+        config_path = tmp_path / ".pr_agent.toml"
+        config_path.write_bytes(ROOT_REVIEWER_TOML)
+        config_file = config_file_at(config_path)
+
+        loads = []
+        parse = tomllib.loads
+        monkeypatch.setattr(tomllib, "loads", lambda text: loads.append(text) or parse(text))
 
-        new_config = temp_repo / ".pr_agent.toml"
-        new_config.write_text("""
+        merger.merge_configs([config_file])
+        merger.validate_config_consistency([config_file])
+        assert len(loads) == 1
+
+        config_path.write_text("[pr_reviewer]\nnum_max_findings = 7")
+        stat = config_path.stat()
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        result = merger.merge_configs([config_file])
+        assert len(loads) == 2
+        assert result["pr_reviewer"]["num_max_findings"] == 7
+
+    @pytest.mark.parametrize("mmap_min_bytes", [0, 4096], ids=["mapped", "read"])
+    def test_load_config_file_read_paths(self, tmp_path, merger, monkeypatch, mmap_min_bytes):
+        """Test that configs load the same whether they are memory-mapped or read in one call."""
+        monkeypatch.setattr(ConfigMerger, "MMAP_MIN_BYTES", mmap_min_bytes)
+        config_path = tmp_path / ".pr_agent.toml"
+        config_path.write_bytes(ROOT_REVIEWER_TOML)
+
+        assert merger._load_config_file(config_file_at(config_path)) == {"pr_reviewer": {"num_max_findings": 3}}
+
+    def test_parse_cache_detects_size_change_at_same_mtime(self, tmp_path, merger):
+        """Test that a rewrite keeping the modification time is reparsed when the file size changes."""
+        config_path = tmp_path / ".pr_agent.toml"
+        config_path.write_bytes(ROOT_REVIEWER_TOML)
+        stat = config_path.stat()
+        config_file = config_file_at(config_path)
+        merger.merge_configs([config_file])
+
+        config_path.write_bytes(b"[pr_reviewer]\nnum_max_findings = 10\n")
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        result = merger.merge_configs([config_file])
+        assert result["pr_reviewer"]["num_max_findings"] == 10
+
+    def test_parse_cache_evicts_least_recently_used(self, tmp_path, merger, monkeypatch):
+        """Test that the parse cache is capped and evicts the least recently used file."""
+        monkeypatch.setattr(merger, "MAX_PARSE_CACHE_ENTRIES", 2)
+        config_files = []
+        for name in ("a", "b", "c"):
+            (tmp_path / name).mkdir()
+            config_path = tmp_path / name / ".pr_agent.toml"
+            config_path.write_bytes(ROOT_REVIEWER_TOML)
+            config_files.append(ConfigFile(config_path, depth=1, relative_path=Path(name, ".pr_agent.toml")))
+
+        merger.merge_configs(config_files[:2])
+        merger.merge_configs([config_files[0]])
+        merger.merge_configs([config_files[2]])
+
+        assert list(merger._parse_cache) == [config_files[0].path, config_files[2].path]
+
+    def test_sections_merged_on_access(self, tmp_path, merger, child_dir, monkeypatch):
+        """Test that merge_layered defers merging each section until it is read."""
+        root_config = tmp_path / ".pr_agent.toml"
+        root_config.write_text("""
 [pr_reviewer]
-extra_instructions = "test"
+extra_instructions = "root"
+num_max_findings = 3
+
+[pr_description]
+extra_instructions = "root"
         """)
 
-        config_files = [
-            ConfigFile(new_config, depth=0, relative_path=Path(".pr_agent.toml"))
-        ]
+        child_config = child_dir / ".pr_agent.toml"
+        child_config.write_text("""
+[pr_reviewer]
+_merge_strategy = "extend"
+extra_instructions = "child"
 
-        result = merger.merge_configs(config_files, base_config=base_config)
+[pr_description]
+extra_instructions = "child"
+        """)
 
-        # Should have both base and new settings
-        assert "config" in result
-        assert result["config"]["model"] == "gpt-3.5"
-        assert "pr_reviewer" in result
-        assert result["pr_reviewer"]["extra_instructions"] == "test"
+        result = merger.merge_layered([
+            config_file_at(root_config),
+            config_file_at(child_config, depth=1)
+        ])
+
+        merged_keys = []
+        merge_value = merger._merge_value
+        monkeypatch.setattr(
+            merger,
+            "_merge_value",
+            lambda base_value, overlay, key, *args, **kwargs: (
+                merged_keys.append(key) or merge_value(base_value, overlay, key, *args, **kwargs)
+            )
+        )
+
+        assert result["pr_reviewer"]["num_max_findings"] == 3
+        assert result["pr_reviewer"]["extra_instructions"] == "child"
+        assert "pr_reviewer" in merged_keys
+        assert "pr_description" not in merged_keys
 
-    def test_custom_allowed_overrides(self, temp_repo):
+        assert result.to_dict()["pr_description"] == {"extra_instructions": "child"}
+        assert "pr_description" in merged_keys
+
+    def test_merged_config_owned_by_caller(self, tmp_path, merger):
+        """Test that merge_configs returns a plain dict whose nested values callers may modify."""
+        config_path = tmp_path / ".pr_agent.toml"
+        config_path.write_bytes(ROOT_REVIEWER_TOML)
+        config_file = config_file_at(config_path)
+
+        result = merger.merge_configs([config_file])
+        assert type(result) is dict
+        assert json.loads(json.dumps(result)) == result
+        result["pr_reviewer"]["num_max_findings"] = 99
+
+        assert merger.merge_configs([config_file])["pr_reviewer"]["num_max_findings"] == 3
+        assert merger.merge_layered([config_file])["pr_reviewer"]["num_max_findings"] == 3
+
+    def test_empty_config_file(self, tmp_path, merger):
+        """Test that an empty config file loads as an empty config."""
+        config_path = tmp_path / ".pr_agent.toml"
+        config_path.touch()
+
+        config_file = config_file_at(config_path)
+        assert merger.merge_configs([config_file]) == {}
+
+    def test_security_validation_memoized_by_content(self, tmp_path, merger, monkeypatch):
+        """Test that unchanged file contents are security-validated only once."""
+        config_path = tmp_path / ".pr_agent.toml"
+        config_path.write_bytes(ROOT_REVIEWER_TOML)
+        config_file = config_file_at(config_path)
+
+        validated = []
+        validate = config_merger_module.validate_file_security
+        monkeypatch.setattr(
+            config_merger_module,
+            "validate_file_security",
+            lambda data, filename: validated.append(filename) or validate(data, filename)
+        )
+
+        merger.merge_configs([config_file])
+        merger.merge_configs([config_file])
+        assert len(validated) == 1
+
+        config_path.write_text("[pr_reviewer]\nnum_max_findings = 4")
+        stat = config_path.stat()
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        merger.merge_configs([config_file])
+        assert len(validated) == 2
+
+    def test_custom_allowed_overrides(self, tmp_path):
         """Test custom allowed overrides list."""
         custom_allowed = ["custom.setting"]
         merger = ConfigMerger(
-            temp_repo,
+            tmp_path,
             allowed_overrides=custom_allowed
         )
 
         assert merger.allowed_overrides == custom_allowed
 
-    def test_custom_denied_overrides(self, temp_repo):
+    def test_custom_denied_overrides(self, tmp_path):
         """Test custom denied overrides list."""
         custom_denied = ["custom.forbidden"]
         merger = ConfigMerger(
-            temp_repo,
+            tmp_path,
             denied_overrides=custom_denied
         )
 
         assert merger.denied_overrides == custom_denied
 
+    def test_denied_overrides_match_key_prefixes(self, tmp_path):
+        """Test that denied overrides reject any key starting with a denied path."""
+        merger = ConfigMerger(tmp_path, denied_overrides=["custom.forbidden"])
+        config_file = config_file_at(tmp_path / "src" / ".pr_agent.toml", depth=1)
+
+        for config_data in (
+            {"custom": {"forbidden": 1}},
+            {"custom": {"forbidden_value": 1}},
+            {"custom": {"forbidden": {"nested": 1}}},
+        ):
+            with pytest.raises(SecurityError):
+                merger._validate_overrides(config_data, config_file)
+
+        merger._validate_overrides({"custom": {"allowed": 1}}, config_file)
+
+    def test_unrelated_sections_not_flattened(self, tmp_path, monkeypatch):
+        """Test that sections no override rule mentions are skipped without flattening."""
+        merger = ConfigMerger(tmp_path, denied_overrides=["custom.forbidden"])
+        config_file = config_file_at(tmp_path / "src" / ".pr_agent.toml", depth=1)
+
+        flattened = []
+        iter_flat = merger._iter_flat
+        monkeypatch.setattr(
+            merger,
+            "_iter_flat",
+            lambda d, parent_key="", sep=".": flattened.append(parent_key) or iter_flat(d, parent_key, sep)
+        )
+
+        merger._validate_overrides({"unrelated": {"nested": {"value": 1}}, "pr_reviewer": {"num_max_findings": 2}}, config_file)
+        assert flattened == ["pr_reviewer"]
+
+        with pytest.raises(SecurityError):
+            merger._validate_overrides({"unrelated": {"value": 1}, "custom": {"forbidden": 1}}, config_file)
+
     def test_merge_strategy_enum(self):
         """Test MergeStrategy enum values."""
-        assert MergeStrategy.OVERRIDE.value == "override"
-        assert MergeStrategy.EXTEND.value == "extend"
-        assert MergeStrategy.INHERIT.value == "inherit"
+        assert (MergeStrategy.OVERRIDE.value, MergeStrategy.EXTEND.value, MergeStrategy.INHERIT.value) == (
+            "override", "extend", "inherit"
+        )
 
-    def test_invalid_merge_strategy(self, temp_repo, merger):
+    def test_invalid_merge_strategy(self, merger, child_dir):
         """Test handling of invalid merge strategy."""
-        child_dir = temp_repo / "src"
-        child_dir.mkdir()
         child_config = child_dir / ".pr_agent.toml"
         child_config.write_text("""
 [pr_reviewer]
@@ -349,7 +539,7 @@ extra_instructions = "test"
         """)
 
         config_files = [
-            ConfigFile(child_config, depth=1, relative_path=Path("src/.pr_agent.toml"))
+            config_file_at(child_config, depth=1)
         ]
 
         # Should fall back to default strategy without error
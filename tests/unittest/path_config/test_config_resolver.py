@@ -2,38 +2,42 @@
 Unit tests for ConfigResolver class.
 """
 
+import os
 import pytest
-from pathlib import Path
-import tempfile
 import shutil
+from pathlib import Path
 
+from pr_agent.path_config import config_resolver as config_resolver_module
 from pr_agent.path_config.config_resolver import ConfigResolver, ResolvedConfig
 
 
-class TestConfigResolver:
-    """Test suite for ConfigResolver class."""
+@pytest.fixture(scope="session")
+def repo_skeleton(tmp_path_factory):
+    """Create the repository structure shared by the tests once per session."""
+    repo_root = tmp_path_factory.mktemp("resolver_skeleton")
 
-    @pytest.fixture
-    def temp_repo(self):
-        """Create a temporary repository structure for testing."""
-        temp_dir = tempfile.mkdtemp()
-        repo_root = Path(temp_dir)
+    # Create directory structure, one makedirs per leaf directory
+    for rel_dir in ("src/backend", "src/frontend", "tests"):
+        os.makedirs(repo_root / rel_dir)
 
-        # Create directory structure
-        (repo_root / "src").mkdir()
-        (repo_root / "src" / "backend").mkdir()
-        (repo_root / "src" / "frontend").mkdir()
-        (repo_root / "tests").mkdir()
+    # Create some empty files
+    for rel_file in ("src/backend/main.py", "src/frontend/app.tsx", "tests/test_main.py"):
+        os.close(os.open(repo_root / rel_file, os.O_WRONLY | os.O_CREAT, 0o644))
 
-        # Create some files
-        (repo_root / "src" / "backend" / "main.py").touch()
-        (repo_root / "src" / "frontend" / "app.tsx").touch()
-        (repo_root / "tests" / "test_main.py").touch()
+    return repo_root
 
-        yield repo_root
 
-        # Cleanup
-        shutil.rmtree(temp_dir)
+class TestConfigResolver:
+    """Test suite for ConfigResolver class."""
+
+    @pytest.fixture
+    def temp_repo(self, tmp_path, repo_skeleton):
+        """Create a temporary repository structure for testing."""
+        # Directories are copied so tests can add configs; the empty source files
+        # are never written to, so they are hardlinked to the skeleton
+        repo_root = tmp_path / "repo"
+        shutil.copytree(repo_skeleton, repo_root, copy_function=os.link)
+        return repo_root
 
     @pytest.fixture
     def resolver(self, temp_repo):
@@ -58,6 +62,16 @@ class TestConfigResolver:
         assert result.config == {}
         assert len(result.source_configs) == 0
 
+    def test_disabled_path_config_skips_discovery(self, temp_repo, monkeypatch):
+        """Test that a resolver with path config disabled never discovers or caches configs."""
+        resolver = ConfigResolver(temp_repo, enable_path_config=False)
+        monkeypatch.setattr(resolver.discovery, "discover_configs", lambda files: pytest.fail("discovery ran"))
+
+        resolver.get_config_for_file("src/main.py")
+        resolver.get_config_for_files(["src/main.py", "tests/test_main.py"])
+
+        assert len(resolver._resolution_cache) == 0
+
     def test_get_config_for_file_no_configs(self, temp_repo, resolver):
         """Test getting config when no config files exist."""
         result = resolver.get_config_for_file("src/backend/main.py")
@@ -165,6 +179,27 @@ num_max_findings = 3
 
         assert result1 is result2  # Should be same object from cache
 
+    def test_resolution_cache_evicts_least_recently_used(self, temp_repo, resolver, monkeypatch):
+        """Test that the per-file resolution cache is bounded and evicts the least recently used file."""
+        monkeypatch.setattr(ConfigResolver, "MAX_RESOLUTION_CACHE_ENTRIES", 2)
+
+        resolver.get_config_for_files(["src/backend/main.py", "src/frontend/app.tsx"])
+        resolver.get_config_for_file("src/backend/main.py")
+        resolver.get_config_for_file("tests/test_main.py")
+
+        assert list(resolver._resolution_cache) == ["src/backend/main.py", "tests/test_main.py"]
+
+    def test_dir_cache_evicts_least_recently_used(self, temp_repo, resolver, monkeypatch):
+        """Test that the per-directory config cache is bounded, also within one batch."""
+        (temp_repo / ".pr_agent.toml").write_text("[pr_reviewer]\nnum_max_findings = 3")
+        monkeypatch.setattr(ConfigResolver, "MAX_DIR_CACHE_ENTRIES", 1)
+
+        resolver.get_config_for_file("src/backend/main.py")
+        results = resolver.get_config_for_files(["src/backend/util.py", "src/frontend/app.tsx", "tests/test_main.py"])
+
+        assert all(result.config["pr_reviewer"]["num_max_findings"] == 3 for result in results.values())
+        assert list(resolver._dir_configs) == [str(temp_repo.resolve() / "tests")]
+
     def test_clear_cache(self, temp_repo, resolver):
         """Test cache clearing."""
         (temp_repo / ".pr_agent.toml").write_text("""
@@ -209,6 +244,19 @@ extra_instructions = "test"
 
         assert value == "default_value"
 
+    def test_global_fallback_reflects_settings_updates(self, resolver):
+        """Test that global fallbacks follow settings updated in place."""
+        settings = config_resolver_module.get_settings()
+        original = settings.get("pr_reviewer.num_max_findings")
+        try:
+            settings.set("pr_reviewer.num_max_findings", 3)
+            assert resolver.get_effective_setting("src/main.py", "pr_reviewer.num_max_findings") == 3
+
+            settings.set("pr_reviewer.num_max_findings", 99)
+            assert resolver.get_effective_setting("src/main.py", "pr_reviewer.num_max_findings") == 99
+        finally:
+            settings.set("pr_reviewer.num_max_findings", original)
+
     def test_validate_all_configs(self, temp_repo, resolver):
         """Test validation of all configurations."""
         # Create valid config
@@ -282,6 +330,13 @@ num_max_findings = 3
 
         assert "global configuration" in info
 
+    def test_resolved_config_immutable(self, resolver):
+        """Test that resolved configs cannot be modified, so shared results stay consistent."""
+        result = resolver.get_config_for_file("src/main.py")
+
+        with pytest.raises(AttributeError):
+            result.file_path = "other.py"
+
     def test_filter_applicable_configs(self, temp_repo, resolver):
         """Test filtering configs applicable to a specific file."""
         # Create configs at different levels
@@ -301,6 +356,75 @@ num_max_findings = 3
         # Root config should be applicable
         assert any(".pr_agent.toml" == path for path in config_paths)
 
+    def test_batch_shares_applicable_configs_per_directory(self, temp_repo, resolver):
+        """Test that files in the same directory share one applicable-config lookup."""
+        (temp_repo / ".pr_agent.toml").write_text("[pr_reviewer]\nnum_max_findings = 3")
+        (temp_repo / "src" / ".pr_agent.toml").write_text("[pr_reviewer]\nextra_instructions = 'src'")
+
+        results = resolver.get_config_for_files(["src/backend/main.py", "src/backend/util.py", "tests/test_main.py"])
+
+        backend_sources = results["src/backend/main.py"].source_configs
+        assert [str(c.relative_path) for c in backend_sources] == [".pr_agent.toml", "src/.pr_agent.toml"]
+        assert results["src/backend/util.py"].source_configs is backend_sources
+        assert [str(c.relative_path) for c in results["tests/test_main.py"].source_configs] == [".pr_agent.toml"]
+
+    def test_sibling_file_skips_discovery(self, temp_repo, resolver, monkeypatch):
+        """Test that a file in an already resolved directory reuses its configs without rediscovery."""
+        (temp_repo / ".pr_agent.toml").write_text("[pr_reviewer]\nnum_max_findings = 3")
+        main = resolver.get_config_for_file("src/backend/main.py")
+
+        discoveries = []
+        discover = resolver.discovery.discover_configs
+        monkeypatch.setattr(resolver.discovery, "discover_configs", lambda files: discoveries.append(files) or discover(files))
+        util = resolver.get_config_for_file("src/backend/util.py")
+
+        assert discoveries == []
+        assert util.config is main.config
+        assert util.file_path == "src/backend/util.py"
+
+    def test_batch_discovers_only_unresolved_directories(self, temp_repo, resolver, monkeypatch):
+        """Test that a batch walks the tree only for files in directories not resolved before."""
+        (temp_repo / ".pr_agent.toml").write_text("[pr_reviewer]\nnum_max_findings = 3")
+        resolver.get_config_for_file("src/backend/main.py")
+
+        discoveries = []
+        discover = resolver.discovery.discover_configs
+        monkeypatch.setattr(resolver.discovery, "discover_configs", lambda files: discoveries.append(files) or discover(files))
+        file_paths = ["tests/test_main.py", "src/backend/util.py", "src/backend/main.py"]
+        results = resolver.get_config_for_files(file_paths)
+
+        assert discoveries == [["tests/test_main.py"]]
+        assert list(results) == file_paths
+        assert results["src/backend/util.py"].config["pr_reviewer"]["num_max_findings"] == 3
+
+    def test_directory_index_reused_for_same_discovery(self, temp_repo, resolver):
+        """Test that per-file lookups against the same discovered configs share one directory index."""
+        (temp_repo / ".pr_agent.toml").write_text("[pr_reviewer]\nnum_max_findings = 3")
+        changed_files = ["src/backend/main.py", "tests/test_main.py"]
+
+        resolver.get_config_for_file("src/backend/main.py", changed_files)
+        configs_by_dir = resolver._configs_by_dir
+        resolver.get_config_for_file("tests/test_main.py", changed_files)
+
+        assert resolver._configs_by_dir is configs_by_dir
+        assert list(configs_by_dir) == [()]
+
+    def test_batch_merges_once_per_config_set(self, temp_repo, resolver, monkeypatch):
+        """Test that files with the same applicable configs share one merged config."""
+        (temp_repo / ".pr_agent.toml").write_text("[pr_reviewer]\nnum_max_findings = 3")
+
+        merges = []
+        merge_layered = resolver.merger.merge_layered
+        monkeypatch.setattr(
+            resolver.merger, "merge_layered", lambda configs: merges.append(configs) or merge_layered(configs)
+        )
+
+        results = resolver.get_config_for_files(["src/backend/main.py", "src/backend/util.py", "tests/test_main.py"])
+
+        assert len(merges) == 1
+        assert results["src/backend/main.py"].config is results["tests/test_main.py"].config
+        assert results["src/backend/util.py"].config["pr_reviewer"]["num_max_findings"] == 3
+
     def test_get_config_for_files_disabled(self, temp_repo):
         """Test batch config retrieval when path config is disabled."""
         resolver = ConfigResolver(temp_repo, enable_path_config=False)
@@ -312,6 +436,18 @@ num_max_findings = 3
         for result in results.values():
             assert result.config == {}
 
+    def test_disabled_results_share_empty_config(self, temp_repo):
+        """Test that files resolved with path config disabled share one read-only empty config."""
+        resolver = ConfigResolver(temp_repo, enable_path_config=False)
+
+        results = resolver.get_config_for_files(["src/main.py", "tests/test.py"])
+        single = resolver.get_config_for_file("src/other.py")
+
+        assert results["src/main.py"].config is results["tests/test.py"].config is single.config
+        assert results["src/main.py"].source_configs is single.source_configs
+        with pytest.raises(TypeError):
+            single.config["pr_reviewer"] = {}
+
     def test_get_config_for_files_empty_list(self, temp_repo, resolver):
         """Test batch config retrieval with empty file list."""
         results = resolver.get_config_for_files([])
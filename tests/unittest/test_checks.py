@@ -4,15 +4,241 @@
 Unit tests for PR checks module.
 """
 
+import asyncio
+import json
+import re
+
 import pytest
+from pr_agent.checks import built_in_checks
 from pr_agent.checks.check_context import CheckContext
+from pr_agent.checks.check_result import CheckResult
+from pr_agent.checks.orchestrator import CheckOrchestrator
+from pr_agent.checks.result_cache import CheckResultCache
 from pr_agent.checks.built_in_checks import (
+    FreeTextRuleCheck,
     PatternCheck,
     FileSizeCheck,
     RequiredFilesCheck,
     ForbiddenPatternsCheck,
+    build_hyperscan_database,
+    combine_patterns,
+    hyperscan_candidate_lines,
+    hyperscan_line_matches,
+    buffer_scan_pattern,
+    regex_buffer_matches,
+    regex_candidate_lines,
 )
+from pr_agent.algo.ai_handlers.base_ai_handler import BaseAiHandler
 from pr_agent.algo.types import FilePatchInfo, EDIT_TYPE
+from pr_agent.config_loader import get_settings
+
+
+class TestBaseCheckFiltering:
+    """Tests for BaseCheck path filtering."""
+
+    def test_filter_context_applies_paths_and_excludes(self):
+        """Test that filtered files honour include/exclude patterns and keep their order."""
+        check = PatternCheck(
+            name="no_print",
+            description="Forbid print",
+            pattern=r"print\(",
+            paths=["src/**/*.py", "scripts/*.py"],
+            exclude_paths=["**/test_*.py"]
+        )
+        context = CheckContext(
+            pr_url="test",
+            pr_title="Test PR",
+            pr_description="Test",
+            pr_author="test",
+            files_changed=["scripts/run.py", "src/app/main.py", "src/app/test_main.py", "README.md"]
+        )
+
+        context = check.filter_context(context)
+
+        assert context.filtered_files == ["scripts/run.py", "src/app/main.py"]
+
+    def test_filter_context_shares_all_files_view(self):
+        """Test that checks whose filters keep every file share one filtered context."""
+        context = CheckContext(
+            pr_url="test",
+            pr_title="Test PR",
+            pr_description="Test",
+            pr_author="test",
+            files_changed=["src/app.py", "README.md"]
+        )
+
+        default_context = PatternCheck(name="a", description="A", pattern="a").filter_context(context)
+        glob_context = PatternCheck(name="b", description="B", pattern="b", paths=["**"]).filter_context(context)
+        py_context = PatternCheck(name="c", description="C", pattern="c", paths=["*.py"]).filter_context(context)
+
+        assert default_context.filtered_files == ["src/app.py", "README.md"]
+        assert glob_context is default_context
+        assert py_context.filtered_files == ["src/app.py"]
+        assert context.filtered_files is None
+
+    def test_patch_views_computed_once(self):
+        """Test that patch lines and sizes are cached on the context."""
+        patch = FilePatchInfo(
+            base_file="", head_file="", patch="+a\n+b",
+            filename="test.txt", edit_type=EDIT_TYPE.MODIFIED
+        )
+        context = CheckContext(
+            pr_url="test",
+            pr_title="Test PR",
+            pr_description="Test",
+            pr_author="test",
+            files_changed=["test.txt"],
+            patches=[patch]
+        )
+
+        lines = context.get_patch_lines(patch)
+
+        assert lines == ["+a", "+b"]
+        assert context.get_patch_lines(patch) is lines
+        assert context.get_patch_bytes(patch) == 5
+        assert context.patch_bytes == {"test.txt": 5}
+        assert context.get_patch_line_offsets(patch) == [2]
+        assert context.get_patch_line_offsets(patch) is context.patch_line_offsets["test.txt"]
+
+    def test_patch_numbered_lines_shared(self):
+        """Test that hunk line numbers are parsed once per PR and match the new file."""
+        patch = FilePatchInfo(
+            base_file="", head_file="", patch="--- a\n+++ b\n@@ -3,2 +10,3 @@ def f():\n ctx\n-old\n+new\n+more",
+            filename="test.txt", edit_type=EDIT_TYPE.MODIFIED
+        )
+        context = CheckContext(
+            pr_url="test",
+            pr_title="Test PR",
+            pr_description="Test",
+            pr_author="test",
+            files_changed=["test.txt"],
+            patches=[patch]
+        )
+
+        numbered = context.get_patch_numbered_lines(patch)
+
+        assert [number for _, number in numbered] == [None, None, None, 10, None, 11, 12]
+        assert context.get_patch_numbered_lines(patch) is numbered
+
+    def test_patch_added_lines_shared(self):
+        """Test that the added lines of a patch are extracted once per PR with their line indices."""
+        patch = FilePatchInfo(
+            base_file="", head_file="", patch="@@ -1,2 +1,3 @@\n ctx\n-old\n+new\n+more",
+            filename="test.txt", edit_type=EDIT_TYPE.MODIFIED
+        )
+        context = CheckContext(
+            pr_url="test",
+            pr_title="Test PR",
+            pr_description="Test",
+            pr_author="test",
+            files_changed=["test.txt"],
+            patches=[patch]
+        )
+
+        added = context.get_patch_added_lines(patch)
+
+        assert added == ("new\nmore", [3, 4])
+        assert context.get_patch_added_lines(patch) is added
+
+    def test_patch_bytes_counts_utf8(self):
+        """Test that non-ASCII patches are measured in UTF-8 bytes."""
+        patch = FilePatchInfo(
+            base_file="", head_file="", patch="+é",
+            filename="test.txt", edit_type=EDIT_TYPE.MODIFIED
+        )
+        context = CheckContext(
+            pr_url="test",
+            pr_title="Test PR",
+            pr_description="Test",
+            pr_author="test",
+            files_changed=["test.txt"],
+            patches=[patch]
+        )
+
+        assert context.get_patch_bytes(patch) == 3
+
+    def test_input_hash_reuses_patch_digests(self):
+        """Test that input hashes are built from per-file patch digests computed once per PR."""
+        patches = [
+            FilePatchInfo(base_file="", head_file="", patch="+a", filename="a.py", edit_type=EDIT_TYPE.MODIFIED),
+            FilePatchInfo(base_file="", head_file="", patch="+b", filename="b.md", edit_type=EDIT_TYPE.MODIFIED),
+        ]
+        context = CheckContext(
+            pr_url="test",
+            pr_title="Test PR",
+            pr_description="Test",
+            pr_author="test",
+            files_changed=["a.py", "b.md"],
+            patches=patches
+        )
+        py_context = PatternCheck(name="a", description="A", pattern="a", paths=["*.py"]).filter_context(context)
+        all_context = PatternCheck(name="b", description="B", pattern="b").filter_context(context)
+
+        py_hash = CheckResultCache.input_hash(py_context)
+        CheckResultCache.input_hash(all_context)
+        digest = context.patch_digests["a.py"][1]
+        CheckResultCache.input_hash(all_context)
+
+        assert context.patch_digests["a.py"][1] is digest
+        assert set(context.patch_digests) == {"a.py", "b.md"}
+
+        patches[1].patch = "+changed"
+        changed = CheckContext(
+            pr_url="test", pr_title="Test PR", pr_description="Test", pr_author="test",
+            files_changed=["a.py", "b.md"], patches=patches
+        )
+        assert CheckResultCache.input_hash(
+            PatternCheck(name="a", description="A", pattern="a", paths=["*.py"]).filter_context(changed)
+        ) == py_hash
+
+    def test_config_materialized_on_first_use(self):
+        """Test that config_getter is called only when a check first reads the config."""
+        calls = []
+        context = CheckContext(
+            pr_url="test",
+            pr_title="Test PR",
+            pr_description="Test",
+            pr_author="test",
+            config_getter=lambda: calls.append(1) or {"checks": {}}
+        )
+
+        assert calls == []
+        assert context.get_config() == {"checks": {}}
+        assert context.get_config() is context.config
+        assert calls == [1]
+
+    def test_identical_patterns_share_path_spec(self):
+        """Test that checks with the same patterns reuse one compiled path spec."""
+        first = PatternCheck(name="a", description="A", pattern="a")
+        second = PatternCheck(name="b", description="B", pattern="b")
+
+        assert first._path_spec is second._path_spec
+
+    def test_path_regex_matches_path_spec(self):
+        """Test that the combined path regex agrees with pattern-by-pattern matching."""
+        check = PatternCheck(
+            name="a", description="A", pattern="a",
+            paths=["src/**/*.py", "docs/", "/setup.py"], exclude_paths=["**/test_*.py"]
+        )
+        negated = PatternCheck(name="b", description="B", pattern="b", paths=["**/*.py", "!src/skip.py"])
+
+        assert check._path_re is not None
+        assert negated._path_re is None
+        files = ["src/app.py", "src/pkg/test_app.py", "docs/index.md", "setup.py", "lib/setup.py", "src/skip.py"]
+        assert [f for f in files if check.should_check_file(f)] == ["src/app.py", "docs/index.md", "setup.py", "src/skip.py"]
+        assert [f for f in files if negated.should_check_file(f)] == [
+            "src/app.py", "src/pkg/test_app.py", "setup.py", "lib/setup.py"
+        ]
+
+    def test_identical_patterns_share_compiled_regexes(self):
+        """Test that checks created for separate runs reuse compiled regexes and prefilters."""
+        first = ForbiddenPatternsCheck(name="a", description="A", custom_patterns=[(r"internal\.corp", "Host")])
+        second = ForbiddenPatternsCheck(name="a", description="A", custom_patterns=[(r"internal\.corp", "Host")])
+
+        assert [p for p, _ in first.patterns] == [p for p, _ in second.patterns]
+        assert all(a is b for (a, _), (b, _) in zip(first.patterns, second.patterns))
+        assert first._combined_pattern is second._combined_pattern
+        assert first._hyperscan_db is second._hyperscan_db
 
 
 @pytest.mark.asyncio
@@ -110,6 +336,33 @@ class TestPatternCheck:
 
         assert result.passed
 
+    async def test_backtracking_pattern_guarded(self):
+        """Test that user patterns prone to catastrophic backtracking run on the regex engine."""
+        pytest.importorskip("regex")
+        check = PatternCheck(
+            name="no_b_runs",
+            description="Pathological pattern",
+            pattern=r"(a|a)*b"
+        )
+
+        context = CheckContext(
+            pr_url="test",
+            pr_title="Test PR",
+            pr_description="Test",
+            pr_author="test",
+            files_changed=["test.txt"],
+            patches=[FilePatchInfo(
+                base_file="", head_file="", patch="+" + "a" * 40,
+                filename="test.txt", edit_type=EDIT_TYPE.MODIFIED
+            )]
+        )
+
+        context = check.filter_context(context)
+        result = await check.run(context)
+
+        assert not isinstance(check.pattern, re.Pattern)
+        assert result.passed
+
 
 @pytest.mark.asyncio
 class TestFileSizeCheck:
@@ -245,6 +498,30 @@ class TestRequiredFilesCheck:
 
         assert result.passed
 
+    async def test_glob_patterns(self):
+        """Test that trigger and required files use glob matching."""
+        check = RequiredFilesCheck(
+            name="migrations",
+            description="Require a migration when models change",
+            trigger_files=["src/models/*.py", "schema.sql"],
+            required_files=["migrations/*.py", "CHANGELOG.md"]
+        )
+
+        context = CheckContext(
+            pr_url="test",
+            pr_title="Test PR",
+            pr_description="Test",
+            pr_author="test",
+            files_changed=["src/models/user.py", "migrations/0002_user.py"],
+            patches=[]
+        )
+
+        context = check.filter_context(context)
+        result = await check.run(context)
+
+        assert not result.passed
+        assert [d.message for d in result.details] == ["Missing required file pattern: CHANGELOG.md"]
+
 
 @pytest.mark.asyncio
 class TestForbiddenPatternsCheck:
@@ -335,3 +612,690 @@ class TestForbiddenPatternsCheck:
 
         assert not result.passed
         assert "private key" in result.details[0].message.lower()
+
+    async def test_custom_pattern_detected_without_default_literals(self):
+        """Test that custom patterns are still checked when no default pattern literal is present."""
+        check = ForbiddenPatternsCheck(
+            name="no_secrets",
+            description="Prevent secrets in code",
+            custom_patterns=[(r"INTERNAL-\d{6}", "Internal ticket id detected")]
+        )
+
+        context = CheckContext(
+            pr_url="test",
+            pr_title="Test PR",
+            pr_description="Test",
+            pr_author="test",
+            files_changed=["notes.txt"],
+            patches=[FilePatchInfo(
+                base_file="", head_file="", patch="+see INTERNAL-123456",
+                filename="notes.txt", edit_type=EDIT_TYPE.MODIFIED
+            )]
+        )
+
+        context = check.filter_context(context)
+        result = await check.run(context)
+
+        assert not result.passed
+        assert result.details[0].message == "Internal ticket id detected"
+
+    async def test_timed_out_custom_pattern_does_not_hide_secrets(self, monkeypatch):
+        """Test that a custom pattern timing out on a line still lets the other patterns report it."""
+        pytest.importorskip("regex")
+        monkeypatch.setattr(built_in_checks, "_PATTERN_SEARCH_TIMEOUT_SECONDS", 0.05)
+        check = ForbiddenPatternsCheck(
+            name="no_secrets",
+            description="Prevent secrets in code",
+            custom_patterns=[(r"(\w|\w\w)+\s*$", "Slow pattern")]
+        )
+
+        context = CheckContext(
+            pr_url="test",
+            pr_title="Test PR",
+            pr_description="Test",
+            pr_author="test",
+            files_changed=["config.py"],
+            patches=[FilePatchInfo(
+                base_file="", head_file="", patch="+" + "a" * 40 + "! api_key = abcdefghij0123456789abcd",
+                filename="config.py", edit_type=EDIT_TYPE.MODIFIED
+            )]
+        )
+
+        result = await check.run(check.filter_context(context))
+
+        assert not result.passed
+        assert [d.message for d in result.details] == [
+            "API key detected",
+            r"Pattern search timed out: (\w|\w\w)+\s*$",
+        ]
+
+    async def test_all_patterns_on_line_reported(self, monkeypatch):
+        """Test that each pattern matching a line is reported, with combined-search hits not searched again."""
+        check = ForbiddenPatternsCheck(
+            name="no_secrets",
+            description="Prevent secrets in code",
+            custom_patterns=[(r"corp\.example", "Internal host"), (r"INTERNAL-\d{6}", "Internal ticket id")]
+        )
+        searched = []
+        search = built_in_checks.search_pattern
+        monkeypatch.setattr(
+            built_in_checks, "search_pattern",
+            lambda pattern, text, pos=0: searched.append(pattern) or search(pattern, text, pos)
+        )
+
+        context = CheckContext(
+            pr_url="test",
+            pr_title="Test PR",
+            pr_description="Test",
+            pr_author="test",
+            files_changed=["notes.md"],
+            patches=[FilePatchInfo(
+                base_file="", head_file="", patch="+INTERNAL-123456 on corp.example",
+                filename="notes.md", edit_type=EDIT_TYPE.MODIFIED
+            )]
+        )
+
+        result = await check.run(check.filter_context(context))
+
+        assert [d.message for d in result.details] == ["Internal host", "Internal ticket id"]
+        individual = {pattern for pattern, _ in check.patterns[-2:]}
+        assert not individual.intersection(searched)
+
+
+class FakeAIHandler:
+    """Minimal AI handler that returns a canned JSON verdict and counts calls."""
+
+    def __init__(self):
+        self.calls = 0
+        self.prompts = []
+
+    async def chat_completion(self, model, system, user, temperature=0.2, img_path=None):
+        self.calls += 1
+        self.prompts.append((system, user))
+        return '{"passed": true, "message": "Rule satisfied", "details": [], "severity": "info"}', "stop"
+
+    async def batch_chat_completion(self, requests, semaphore=None):
+        self.batch_calls = getattr(self, "batch_calls", 0) + 1
+        return await BaseAiHandler.batch_chat_completion(self, requests, semaphore)
+
+
+@pytest.fixture
+def checks_prompts():
+    """Provide the pr_checks_prompts section and a clean verdict cache."""
+    settings = get_settings()
+    settings.set("pr_checks_prompts", {
+        "system": "system prompt",
+        "user": "{{ rule_description }}{% for file in files %}\n{{ file.patch }}{% endfor %}",
+        "system_delta": "delta system prompt",
+        "user_delta": "{{ previous_verdict }}{% for file in files %}\n{{ file.patch }}{% endfor %}",
+        "system_multi": "multi system prompt",
+        "user_multi": "{% for rule in rules %}{{ rule.name }}\n{% endfor %}{% for file in files %}{{ file.patch }}{% endfor %}",
+    })
+    built_in_checks._verdict_cache.clear()
+    built_in_checks._evaluation_sessions.clear()
+    yield
+    built_in_checks._verdict_cache.clear()
+    built_in_checks._evaluation_sessions.clear()
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("checks_prompts")
+class TestFreeTextRuleCheck:
+    """Tests for FreeTextRuleCheck."""
+
+    def _make_context(self, patch: str) -> CheckContext:
+        return CheckContext(
+            pr_url="test",
+            pr_title="Test PR",
+            pr_description="Test",
+            pr_author="test",
+            files_changed=["app.py"],
+            patches=[FilePatchInfo(
+                base_file="", head_file="", patch=patch,
+                filename="app.py", edit_type=EDIT_TYPE.MODIFIED
+            )]
+        )
+
+    async def test_verdict_cached_for_identical_input(self):
+        """Test that an unchanged PR reuses the cached verdict instead of calling the model."""
+        handler = FakeAIHandler()
+        check = FreeTextRuleCheck(
+            name="tests_required",
+            description="Require tests",
+            rule="All new functions must have tests",
+            ai_handler=lambda: handler
+        )
+
+        first = await check.run(check.filter_context(self._make_context("+def foo():\n+    pass")))
+        second = await check.run(check.filter_context(self._make_context("+def foo():\n+    pass")))
+
+        assert handler.calls == 1
+        assert first.passed and second.passed
+        assert first is not second
+
+    async def test_volatile_rule_not_cached(self):
+        """Test that rules depending on time or author always call the model."""
+        handler = FakeAIHandler()
+        check = FreeTextRuleCheck(
+            name="recent_changes",
+            description="Recent changes",
+            rule="Changes made today must include a changelog entry",
+            ai_handler=lambda: handler
+        )
+
+        await check.run(check.filter_context(self._make_context("+def foo():\n+    pass")))
+        await check.run(check.filter_context(self._make_context("+def foo():\n+    pass")))
+
+        assert handler.calls == 2
+        assert not built_in_checks._verdict_cache
+
+    async def test_verdict_cache_miss_on_patch_change(self):
+        """Test that a changed patch triggers a new model call."""
+        handler = FakeAIHandler()
+        check = FreeTextRuleCheck(
+            name="tests_required",
+            description="Require tests",
+            rule="All new functions must have tests",
+            ai_handler=lambda: handler
+        )
+
+        await check.run(check.filter_context(self._make_context("+def foo():\n+    pass")))
+        await check.run(check.filter_context(self._make_context("+def bar():\n+    pass")))
+
+        assert handler.calls == 2
+
+    async def test_incremental_evaluation_sends_only_new_hunks(self):
+        """Test that a revision appending hunks is evaluated with the delta prompt."""
+        handler = FakeAIHandler()
+        check = FreeTextRuleCheck(
+            name="tests_required",
+            description="Require tests",
+            rule="All new functions must have tests",
+            ai_handler=lambda: handler
+        )
+
+        hunks = [f"@@ -{i},1 +{i},1 @@\n+line_{i}" for i in range(1, 6)]
+        await check.run(check.filter_context(self._make_context("\n".join(hunks))))
+
+        new_hunk = "@@ -10,1 +10,1 @@\n+appended_line"
+        await check.run(check.filter_context(self._make_context("\n".join(hunks + [new_hunk]))))
+
+        assert handler.calls == 2
+        system, user = handler.prompts[-1]
+        assert system == "delta system prompt"
+        assert "appended_line" in user
+        assert "line_1" not in user
+
+    async def test_full_evaluation_when_hunk_removed(self):
+        """Test that dropping an evaluated hunk forces a full evaluation even with a high overlap."""
+        handler = FakeAIHandler()
+        check = FreeTextRuleCheck(
+            name="tests_required",
+            description="Require tests",
+            rule="All new functions must have tests",
+            ai_handler=lambda: handler
+        )
+
+        hunks = [f"@@ -{i},1 +{i},1 @@\n+line_{i}" for i in range(1, 11)]
+        await check.run(check.filter_context(self._make_context("\n".join(hunks))))
+
+        new_hunk = "@@ -20,1 +20,1 @@\n+appended_line"
+        await check.run(check.filter_context(self._make_context("\n".join(hunks[1:] + [new_hunk]))))
+
+        assert handler.calls == 2
+        system, user = handler.prompts[-1]
+        assert system == "system prompt"
+        assert "line_2" in user and "appended_line" in user
+
+    async def test_full_evaluation_when_diff_rewritten(self):
+        """Test that a mostly rewritten diff falls back to a full evaluation."""
+        handler = FakeAIHandler()
+        check = FreeTextRuleCheck(
+            name="tests_required",
+            description="Require tests",
+            rule="All new functions must have tests",
+            ai_handler=lambda: handler
+        )
+
+        await check.run(check.filter_context(self._make_context("@@ -1,1 +1,1 @@\n+old_line")))
+        await check.run(check.filter_context(self._make_context("@@ -1,1 +1,1 @@\n+new_line")))
+
+        system, _ = handler.prompts[-1]
+        assert system == "system prompt"
+
+    async def test_prompt_template_compiled_once(self):
+        """Test that prompt templates are compiled at init and recompiled only when settings change."""
+        check = FreeTextRuleCheck(
+            name="tests_required",
+            description="Require tests",
+            rule="All new functions must have tests",
+            ai_handler=FakeAIHandler
+        )
+        prompts = get_settings().pr_checks_prompts
+
+        template = check._get_template("user", prompts.user)
+        assert check._get_template("user", prompts.user) is template
+        assert check._get_template("user", "{{ rule_description }}") is not template
+
+
+class TestCombinePatterns:
+    """Tests for combine_patterns."""
+
+    def test_scopes_global_flags(self):
+        """Test that leading inline flags stay scoped to their own alternative."""
+        combined = combine_patterns([re.compile(r"(?i)secret"), re.compile(r"Token")])
+
+        assert combined.search("SECRET").lastgroup == "g0"
+        assert combined.search("Token").lastgroup == "g1"
+        assert combined.search("TOKEN") is None
+
+    def test_uncombinable_patterns_return_none(self):
+        """Test that patterns with conflicting group names are not combined."""
+        combined = combine_patterns([re.compile(r"(?P<g1>a)"), re.compile(r"b")])
+
+        assert combined is None
+
+
+class TestHyperscanPrefilter:
+    """Tests for the optional Hyperscan prefilter."""
+
+    def test_candidate_lines(self):
+        """Test that the prefilter reports the lines containing matches."""
+        pytest.importorskip("hyperscan")
+        database = build_hyperscan_database([re.compile(r"console\.log")])
+
+        candidates = hyperscan_candidate_lines(database, "+a = 1\n+console.log(a)\n b = 2")
+
+        assert candidates == {1}
+
+    def test_line_matches_report_pattern_ids(self):
+        """Test that the prefilter reports which patterns may match each line."""
+        pytest.importorskip("hyperscan")
+        database = build_hyperscan_database([re.compile(r"console\.log"), re.compile(r"debugger")])
+
+        line_matches = hyperscan_line_matches(database, "+console.log(a)\n+a = 1\n+debugger; console.log(b)")
+
+        assert line_matches == {0: {0}, 2: {0, 1}}
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("make_check,patch", [
+        (
+            lambda: PatternCheck(name="xy", description="", pattern=r"x[^a-z]y", message="Found"),
+            "+val = xAy\n+val = xay",
+        ),
+        (
+            lambda: ForbiddenPatternsCheck(
+                name="no_secrets", description="", custom_patterns=[(r"TOKEN_[^a-z]{4}", "Token")]
+            ),
+            "+TOKEN_ABCD\n+TOKEN_abcd",
+        ),
+    ], ids=["pattern_check", "forbidden_patterns"])
+    async def test_negated_class_results_match_without_hyperscan(self, monkeypatch, make_check, patch):
+        """Test that case-sensitive negated classes report the same lines with and without Hyperscan."""
+        pytest.importorskip("hyperscan")
+        context = CheckContext(
+            pr_url="test",
+            pr_title="Test PR",
+            pr_description="Test",
+            pr_author="test",
+            files_changed=["app.py"],
+            patches=[FilePatchInfo(
+                base_file="", head_file="", patch=patch, filename="app.py", edit_type=EDIT_TYPE.MODIFIED
+            )]
+        )
+        check = make_check()
+        assert check._hyperscan_db is not None
+        with_hyperscan = await check.run(check.filter_context(context))
+
+        monkeypatch.setattr(built_in_checks, "build_hyperscan_database", lambda *args, **kwargs: None)
+        check = make_check()
+        without_hyperscan = await check.run(check.filter_context(context))
+
+        assert not with_hyperscan.passed
+        assert with_hyperscan.details == without_hyperscan.details
+
+    def test_line_start_anchor_not_prefiltered_for_stripped_lines(self):
+        """Test that anchored patterns are not prefiltered when lines lose their diff prefix."""
+        pytest.importorskip("hyperscan")
+
+        assert build_hyperscan_database([re.compile(r"^secret")], lines_are_stripped=True) is None
+        assert build_hyperscan_database([re.compile(r"[^\s]{8,}")], lines_are_stripped=True) is not None
+
+
+class TestBufferScanPrefilter:
+    """Tests for the whole-patch regex prefilter used without Hyperscan."""
+
+    @pytest.mark.parametrize("pattern", [r"console\.log", r"^\+\s*print", r"x[^y]*z", r"\bTODO$", r"a\s*b"])
+    def test_candidates_cover_matching_lines(self, pattern):
+        """Test that every line matched on its own is among the candidate lines."""
+        patch = "+a\n+ab x\n-xz\n+ print(1)  # TODO\n console.log(x)\n+TODO"
+        lines = patch.split("\n")
+        compiled = re.compile(pattern)
+        newlines = [i for i, char in enumerate(patch) if char == "\n"]
+
+        candidates = regex_candidate_lines(buffer_scan_pattern(compiled), patch, newlines)
+
+        assert {i for i, line in enumerate(lines) if compiled.search(line)} <= candidates
+
+    @pytest.mark.asyncio
+    async def test_clean_patch_skipped_after_one_search(self, monkeypatch):
+        """Test that a patch with no secrets is ruled out without searching its lines."""
+        monkeypatch.setattr(built_in_checks, "build_hyperscan_database", lambda *args, **kwargs: None)
+        check = ForbiddenPatternsCheck(name="no_secrets", description="Prevent secrets in code")
+        searched = []
+        monkeypatch.setattr(
+            built_in_checks, "search_pattern",
+            lambda pattern, text, pos=0: searched.append(text)
+        )
+
+        context = CheckContext(
+            pr_url="test",
+            pr_title="Test PR",
+            pr_description="Test",
+            pr_author="test",
+            files_changed=["auth.py"],
+            patches=[FilePatchInfo(
+                base_file="", head_file="", patch="+token = get_token()\n+password = None",
+                filename="auth.py", edit_type=EDIT_TYPE.MODIFIED
+            )]
+        )
+
+        result = await check.run(check.filter_context(context))
+
+        assert result.passed
+        assert searched == []
+        assert regex_buffer_matches(check._buffer_pattern, "x = 1\npassword = 'hunter22'")
+
+    def test_lookaround_not_prefiltered(self):
+        """Test that patterns whose meaning depends on the line end are not scanned across lines."""
+        assert buffer_scan_pattern(re.compile(r"a(?!\s)")) is None
+        assert buffer_scan_pattern(re.compile(r"end\Z")) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("checks_prompts")
+class TestCheckOrchestrator:
+    """Tests for CheckOrchestrator."""
+
+    async def test_batched_llm_checks(self, monkeypatch):
+        """Test that free-text checks are submitted as a single batch alongside local checks."""
+        monkeypatch.setattr(get_settings().checks, "batch_llm_checks", True, raising=False)
+        handler = FakeAIHandler()
+        checks = [
+            FreeTextRuleCheck(name="rule_a", description="A", rule="Rule A", ai_handler=lambda: handler),
+            PatternCheck(name="no_print", description="No print", pattern=r"print\("),
+            FreeTextRuleCheck(name="rule_b", description="B", rule="Rule B", ai_handler=lambda: handler),
+        ]
+        context = CheckContext(
+            pr_url="test",
+            pr_title="Test PR",
+            pr_description="Test",
+            pr_author="test",
+            files_changed=["app.py"],
+            patches=[FilePatchInfo(
+                base_file="", head_file="", patch="+print('hi')",
+                filename="app.py", edit_type=EDIT_TYPE.MODIFIED
+            )]
+        )
+
+        results = await CheckOrchestrator(checks).run_all(context)
+
+        assert list(results) == ["rule_a", "no_print", "rule_b"]
+        assert handler.batch_calls == 1
+        assert handler.calls == 2
+        assert results["rule_a"].passed and results["rule_b"].passed
+        assert not results["no_print"].passed
+
+    async def test_rules_evaluated_in_shared_prompts(self, monkeypatch):
+        """Test that rules seeing the same files share prompts, with missing verdicts evaluated separately."""
+        monkeypatch.setattr(get_settings().checks, "batch_rules", True, raising=False)
+        monkeypatch.setattr(get_settings().checks, "max_rules_per_batch", 3, raising=False)
+
+        class MultiRuleAIHandler(FakeAIHandler):
+            async def chat_completion(self, **kwargs):
+                if kwargs["system"] != "multi system prompt":
+                    return await super().chat_completion(**kwargs)
+                self.calls += 1
+                self.prompts.append((kwargs["system"], kwargs["user"]))
+                # No verdict for rule_c, which must then be evaluated on its own
+                return json.dumps({
+                    "rule_a": {"passed": True, "message": "ok"},
+                    "rule_b": {"passed": False, "message": "violated", "severity": "warning"},
+                }), "stop"
+
+        handler = MultiRuleAIHandler()
+        checks = [
+            FreeTextRuleCheck(name=f"rule_{name}", description="Rule", rule=f"Rule {name}", ai_handler=lambda: handler)
+            for name in "abcd"
+        ]
+        context = CheckContext(
+            pr_url="test",
+            pr_title="Test PR",
+            pr_description="Test",
+            pr_author="test",
+            files_changed=["app.py"],
+            patches=[FilePatchInfo(
+                base_file="", head_file="", patch="+x = 1",
+                filename="app.py", edit_type=EDIT_TYPE.MODIFIED
+            )]
+        )
+
+        results = await CheckOrchestrator(checks).run_all(context)
+
+        assert list(results) == ["rule_a", "rule_b", "rule_c", "rule_d"]
+        assert [system for system, _ in handler.prompts].count("multi system prompt") == 1
+        assert handler.calls == 3
+        assert results["rule_a"].passed and not results["rule_b"].passed
+        assert results["rule_c"].passed and results["rule_d"].passed
+
+    @pytest.mark.parametrize("batch_llm_checks", [False, True], ids=["per_check", "batched"])
+    async def test_llm_concurrency_bounded(self, monkeypatch, batch_llm_checks):
+        """Test that concurrent free-text evaluations are limited by max_llm_concurrency."""
+        monkeypatch.setattr(get_settings().checks, "max_llm_concurrency", 2, raising=False)
+        monkeypatch.setattr(get_settings().checks, "batch_llm_checks", batch_llm_checks, raising=False)
+        active = 0
+        peak = 0
+
+        class SlowAIHandler(FakeAIHandler):
+            async def chat_completion(self, **kwargs):
+                nonlocal active, peak
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+                return await super().chat_completion(**kwargs)
+
+        handler = SlowAIHandler()
+        checks = [
+            FreeTextRuleCheck(name=f"rule_{i}", description="Rule", rule=f"Rule {i}", ai_handler=lambda: handler)
+            for i in range(5)
+        ]
+        context = CheckContext(
+            pr_url="test",
+            pr_title="Test PR",
+            pr_description="Test",
+            pr_author="test",
+            files_changed=["app.py"],
+            patches=[FilePatchInfo(
+                base_file="", head_file="", patch="+x = 1",
+                filename="app.py", edit_type=EDIT_TYPE.MODIFIED
+            )]
+        )
+
+        results = await CheckOrchestrator(checks).run_all(context)
+
+        assert all(result.passed for result in results.values())
+        assert handler.calls == 5
+        assert peak == 2
+
+    async def test_llm_requests_sent_before_local_checks(self):
+        """Test that free-text requests are in flight before local checks run."""
+        events = []
+
+        class RecordingAIHandler(FakeAIHandler):
+            async def chat_completion(self, **kwargs):
+                events.append("llm")
+                return await super().chat_completion(**kwargs)
+
+        class RecordingPatternCheck(PatternCheck):
+            async def run(self, context):
+                events.append("local")
+                return await super().run(context)
+
+        handler = RecordingAIHandler()
+        checks = [
+            RecordingPatternCheck(name="no_print", description="No print", pattern=r"print\("),
+            FreeTextRuleCheck(name="rule_a", description="A", rule="Rule A", ai_handler=lambda: handler),
+        ]
+        context = CheckContext(
+            pr_url="test",
+            pr_title="Test PR",
+            pr_description="Test",
+            pr_author="test",
+            files_changed=["app.py"],
+            patches=[FilePatchInfo(
+                base_file="", head_file="", patch="+x = 1",
+                filename="app.py", edit_type=EDIT_TYPE.MODIFIED
+            )]
+        )
+
+        results = await CheckOrchestrator(checks).run_all(context)
+
+        assert events == ["llm", "local"]
+        assert list(results) == ["no_print", "rule_a"]
+
+    async def test_identical_requests_coalesced(self):
+        """Test that concurrent checks sending the same prompt share one model call."""
+        class SlowAIHandler(FakeAIHandler):
+            async def chat_completion(self, **kwargs):
+                await asyncio.sleep(0.01)
+                return await super().chat_completion(**kwargs)
+
+        handler = SlowAIHandler()
+        checks = [
+            FreeTextRuleCheck(name=name, description="Rule", rule="Same rule", ai_handler=lambda: handler)
+            for name in ("rule_a", "rule_b")
+        ]
+        context = CheckContext(
+            pr_url="test",
+            pr_title="Test PR",
+            pr_description="Test",
+            pr_author="test",
+            files_changed=["app.py"],
+            patches=[FilePatchInfo(
+                base_file="", head_file="", patch="+x = 1",
+                filename="app.py", edit_type=EDIT_TYPE.MODIFIED
+            )]
+        )
+
+        results = await CheckOrchestrator(checks).run_all(context)
+
+        assert handler.calls == 1
+        assert results["rule_a"].passed and results["rule_b"].passed
+        assert not built_in_checks._inflight_requests
+
+    async def test_has_blocking_failures(self):
+        """Test that only failed blocking checks block the merge."""
+        checks = [
+            PatternCheck(name="advisory", description="Advisory", pattern="a"),
+            PatternCheck(name="blocking", description="Blocking", pattern="b", mode="blocking"),
+        ]
+        orchestrator = CheckOrchestrator(checks)
+
+        advisory_failed = {
+            "advisory": CheckResult(passed=False, message="failed"),
+            "blocking": CheckResult(passed=True, message="passed"),
+        }
+        blocking_failed = {
+            "advisory": CheckResult(passed=True, message="passed"),
+            "blocking": CheckResult(passed=False, message="failed"),
+        }
+
+        assert not orchestrator.has_blocking_failures(advisory_failed)
+        assert orchestrator.has_blocking_failures(blocking_failed)
+
+    async def test_replay_uses_stored_results(self, monkeypatch, tmp_path):
+        """Test that replay mode serves stored results and errors on a miss instead of running checks."""
+        handler = FakeAIHandler()
+        checks = [FreeTextRuleCheck(name="rule_a", description="A", rule="Rule A", ai_handler=lambda: handler)]
+        context = CheckContext(
+            pr_url="test",
+            pr_title="Test PR",
+            pr_description="Test",
+            pr_author="test",
+            files_changed=["app.py"],
+            patches=[FilePatchInfo(
+                base_file="", head_file="", patch="+x = 1",
+                filename="app.py", edit_type=EDIT_TYPE.MODIFIED
+            )]
+        )
+        cache = CheckResultCache(str(tmp_path / "checks.db"))
+
+        monkeypatch.setattr(get_settings().checks, "cache_policy", "write-only", raising=False)
+        recorded = await CheckOrchestrator(checks, result_cache=cache).run_all(context)
+
+        monkeypatch.setattr(get_settings().checks, "cache_policy", "replay", raising=False)
+        replayed = await CheckOrchestrator(checks, result_cache=cache).run_all(context)
+        context.patches[0].patch = "+x = 2"
+        missed = await CheckOrchestrator(checks, result_cache=cache).run_all(context)
+
+        assert handler.calls == 1
+        assert replayed["rule_a"] == recorded["rule_a"]
+        assert not missed["rule_a"].passed
+        assert "No cached result" in missed["rule_a"].message
+
+    async def test_changed_check_config_misses_cache(self, monkeypatch, tmp_path):
+        """Test that stored results are not reused once a check's configuration changes."""
+        context = CheckContext(
+            pr_url="test",
+            pr_title="Test PR",
+            pr_description="Test",
+            pr_author="test",
+            files_changed=["app.py"],
+            patches=[FilePatchInfo(
+                base_file="", head_file="", patch="+x = 1",
+                filename="app.py", edit_type=EDIT_TYPE.MODIFIED
+            )]
+        )
+        cache = CheckResultCache(str(tmp_path / "checks.db"))
+
+        monkeypatch.setattr(get_settings().checks, "cache_policy", "write-only", raising=False)
+        await CheckOrchestrator(
+            [PatternCheck(name="no_x", description="X", pattern="x = 1")], result_cache=cache
+        ).run_all(context)
+
+        monkeypatch.setattr(get_settings().checks, "cache_policy", "replay", raising=False)
+        replayed = await CheckOrchestrator(
+            [PatternCheck(name="no_x", description="X", pattern="x = 1")], result_cache=cache
+        ).run_all(context)
+        changed_pattern = await CheckOrchestrator(
+            [PatternCheck(name="no_x", description="X", pattern="x = 2")], result_cache=cache
+        ).run_all(context)
+        changed_limit = await CheckOrchestrator(
+            [FileSizeCheck(name="no_x", description="X", max_pr_lines=1)], result_cache=cache
+        ).run_all(context)
+
+        assert replayed["no_x"].message == "Forbidden pattern found 1 time(s): x = 1"
+        assert "No cached result" in changed_pattern["no_x"].message
+        assert "No cached result" in changed_limit["no_x"].message
+
+    async def test_filter_shared_between_identical_path_specs(self):
+        """Test that checks with the same path patterns share one filtered context."""
+        checks = [
+            PatternCheck(name="a", description="A", pattern="a"),
+            PatternCheck(name="b", description="B", pattern="b"),
+            PatternCheck(name="py_only", description="Python", pattern="c", paths=["*.py"]),
+        ]
+        context = CheckContext(
+            pr_url="test",
+            pr_title="Test PR",
+            pr_description="Test",
+            pr_author="test",
+            files_changed=["app.py", "README.md"]
+        )
+
+        filtered = CheckOrchestrator(checks)._filter_contexts(context, checks)
+
+        assert filtered["a"] is filtered["b"]
+        assert filtered["a"].filtered_files == ["app.py", "README.md"]
+        assert filtered["py_only"].filtered_files == ["app.py"]
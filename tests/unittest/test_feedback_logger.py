@@ -0,0 +1,133 @@
+# AGPL-3.0 License
+
+"""
+Unit tests for the feedback logger.
+"""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from pr_agent.config_loader import get_settings
+from pr_agent.feedback.feedback_event import FeedbackEvent, FeedbackEventData
+from pr_agent.feedback.feedback_logger import FeedbackLogger
+from pr_agent.feedback.preference import Preference
+
+
+def make_event(
+    repository: str = "org/repo",
+    day: int = 1,
+    event_type: FeedbackEvent = FeedbackEvent.THUMBS_UP,
+    **kwargs
+) -> FeedbackEventData:
+    return FeedbackEventData(
+        event_type=event_type,
+        timestamp=datetime(2024, 1, day, 12, 0, 0),
+        pr_id="1",
+        repository=repository,
+        user="alice",
+        **kwargs
+    )
+
+
+@pytest.fixture
+def feedback_logger(monkeypatch, tmp_path):
+    """Provide an enabled feedback logger writing to a temporary directory."""
+    monkeypatch.setattr(get_settings().feedback, "enabled", True, raising=False)
+    return FeedbackLogger(str(tmp_path))
+
+
+@pytest.mark.asyncio
+class TestFeedbackLogger:
+    """Tests for FeedbackLogger."""
+
+    async def test_events_appended_to_daily_log(self, feedback_logger):
+        """Test that events are appended to one compact JSONL file per repository per day."""
+        try:
+            await feedback_logger.log_event(make_event(day=1))
+            await feedback_logger.log_event(make_event(day=1))
+            await feedback_logger.log_event(make_event(day=2))
+        finally:
+            await feedback_logger.close()
+
+        files = sorted(path.name for path in feedback_logger.events_dir.iterdir())
+        assert files == ["org_repo_20240101.jsonl", "org_repo_20240102.jsonl"]
+
+        lines = (feedback_logger.events_dir / "org_repo_20240101.jsonl").read_text().splitlines()
+        assert len(lines) == 2
+        assert ": " not in lines[0]
+        assert json.loads(lines[0]) == make_event(day=1).to_dict()
+
+    async def test_open_event_logs_bounded(self, feedback_logger, monkeypatch):
+        """Test that only the most recently written event logs are kept open."""
+        monkeypatch.setattr(FeedbackLogger, "MAX_OPEN_WRITERS", 2)
+        try:
+            for repository in ("org/a", "org/b", "org/c", "org/a"):
+                await feedback_logger.log_event(make_event(repository=repository))
+
+            assert list(feedback_logger._writers) == [("org_c", "20240101"), ("org_a", "20240101")]
+        finally:
+            await feedback_logger.close()
+
+        lines = (feedback_logger.events_dir / "org_a_20240101.jsonl").read_text().splitlines()
+        assert len(lines) == 2
+
+    async def test_load_events_reads_legacy_files(self, feedback_logger):
+        """Test that legacy per-event JSON files are loaded alongside JSONL logs."""
+        legacy_event = make_event(day=3)
+        with open(feedback_logger.events_dir / "org_repo_20240103_120000_000000.json", "w") as f:
+            json.dump(legacy_event.to_dict(), f, indent=2)
+
+        try:
+            await feedback_logger.log_event(make_event(day=1))
+            await feedback_logger.log_event(make_event(repository="org/repo_other", day=1))
+        finally:
+            await feedback_logger.close()
+
+        events = await feedback_logger.load_events("org/repo")
+
+        assert [event.timestamp.day for event in events] == [1, 3]
+        assert all(event.repository == "org/repo" for event in events)
+
+    async def test_preferences_round_trip(self, feedback_logger):
+        """Test that saved preferences are loaded back."""
+        preferences = [Preference(
+            pattern_type="suggestion_category",
+            pattern="security",
+            weight=0.5,
+            confidence=0.3,
+            sample_count=3
+        )]
+
+        await feedback_logger.save_preferences("org/repo", preferences)
+
+        assert await feedback_logger.load_preferences("org/repo") == preferences
+        assert await feedback_logger.load_preferences("org/missing") == []
+
+    async def test_extract_preferences(self, feedback_logger, monkeypatch):
+        """Test that feedback signals are aggregated per pattern."""
+        monkeypatch.setattr(get_settings().feedback, "min_samples_for_preference", 2, raising=False)
+
+        try:
+            for event_type in (FeedbackEvent.SUGGESTION_APPLIED,) * 3 + (FeedbackEvent.THUMBS_DOWN,):
+                await feedback_logger.log_event(make_event(
+                    event_type=event_type, finding_category="security", file_path="src/app.py"
+                ))
+            await feedback_logger.log_event(make_event(
+                event_type=FeedbackEvent.SUGGESTION_DISMISSED, finding_category="style"
+            ))
+            await feedback_logger.log_event(make_event(
+                event_type=FeedbackEvent.COMMENT_REPLIED, finding_category="style"
+            ))
+        finally:
+            await feedback_logger.close()
+
+        preferences = await feedback_logger.extract_preferences("org/repo")
+
+        assert [(p.pattern_type, p.pattern, p.sample_count) for p in preferences] == [
+            ("file_type", "*.py", 4),
+            ("suggestion_category", "security", 4),
+        ]
+        assert preferences[1].weight == pytest.approx(0.2)
+        assert preferences[1].confidence == pytest.approx(0.4)
@@ -0,0 +1,72 @@
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+
+import pytest
+
+from pr_agent.algo import json_utils
+
+
+class _Record:
+    def to_dict(self):
+        return {"b": 2, "a": "é"}
+
+
+class _Color(Enum):
+    RED = "red"
+
+
+@dataclass
+class _Point:
+    x: int
+    color: _Color
+    seen_at: datetime
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """Run a test against orjson and against the json fallback."""
+    if request.param and not json_utils.ORJSON_AVAILABLE:
+        pytest.skip("orjson is not installed")
+    monkeypatch.setattr(json_utils, "ORJSON_AVAILABLE", request.param)
+    return request.param
+
+
+class TestJsonUtils:
+    def test_compact_output_matches_across_backends(self, backend):
+        """Both backends emit the same compact UTF-8 bytes"""
+        assert json_utils.dumps({"b": [1, 2], "a": "é"}, sort_keys=True) == '{"a":"é","b":[1,2]}'.encode()
+
+    def test_indent_and_newline_options(self, backend):
+        """Indented and newline-terminated output"""
+        assert json_utils.dumps({"a": 1}, indent=True) == b'{\n  "a": 1\n}'
+        assert json_utils.dumps([1], append_newline=True) == b"[1]\n"
+
+    def test_default_hook(self, backend):
+        """The default hook serializes unsupported objects"""
+        assert json_utils.dumps([_Record()], default=lambda obj: obj.to_dict()) == '[{"b":2,"a":"é"}]'.encode()
+
+    def test_to_dict_objects_serialized_without_default(self, backend):
+        """Objects exposing to_dict() serialize the same way with both backends"""
+        assert json_utils.dumps({"record": _Record()}) == '{"record":{"b":2,"a":"é"}}'.encode()
+
+    def test_dataclasses_datetimes_and_enums_match_across_backends(self, backend):
+        """Types only orjson supports natively go through the shared fallback"""
+        point = _Point(x=1, color=_Color.RED, seen_at=datetime(2024, 5, 1, 12, 0, 0, 5))
+
+        assert json_utils.dumps([point]) == b'[{"x":1,"color":"red","seen_at":"2024-05-01T12:00:00.000005"}]'
+
+    def test_unsupported_objects_raise_type_error(self, backend):
+        """Objects without a JSON representation raise TypeError with both backends"""
+        with pytest.raises(TypeError):
+            json_utils.dumps(object())
+
+    def test_loads_accepts_bytes_text_and_memoryview(self, backend):
+        """Decode every input type the stores read back"""
+        for data in (b'{"a":1}', '{"a":1}', memoryview(b'{"a":1}')):
+            assert json_utils.loads(data) == {"a": 1}
+
+    def test_loads_rejects_invalid_json(self, backend):
+        """Invalid JSON raises a ValueError with both backends"""
+        with pytest.raises(ValueError):
+            json_utils.loads(b"{not json")
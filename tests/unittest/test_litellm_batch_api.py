@@ -0,0 +1,87 @@
+import pytest
+
+from pr_agent.algo.ai_handlers import litellm_ai_handler
+from pr_agent.algo.ai_handlers.litellm_ai_handler import LiteLLMAIHandler
+from pr_agent.config_loader import get_settings
+
+
+class _Batch:
+    def __init__(self, status):
+        self.id = "batch_1"
+        self.status = status
+        self.output_file_id = None
+
+
+class _File:
+    id = "file_1"
+
+
+@pytest.fixture
+def handler(monkeypatch):
+    """Provide a handler with the Batch API enabled and individual completions recorded."""
+    monkeypatch.setattr(get_settings().litellm, "use_batch_api", True, raising=False)
+    monkeypatch.setattr(get_settings().litellm, "batch_timeout", 0, raising=False)
+    monkeypatch.setattr(get_settings().litellm, "batch_poll_interval", 0, raising=False)
+    handler = LiteLLMAIHandler()
+    handler.individual_models = []
+
+    async def chat_completion(model, system, user, temperature=0.2, img_path=None):
+        handler.individual_models.append(model)
+        return "individual", "stop"
+
+    monkeypatch.setattr(handler, "chat_completion", chat_completion)
+    return handler
+
+
+@pytest.fixture
+def batch_calls(monkeypatch):
+    """Record the Batch API calls made through litellm; submitted jobs never complete."""
+    calls = []
+
+    async def acreate_file(**kwargs):
+        calls.append(("create_file", kwargs["custom_llm_provider"]))
+        return _File()
+
+    async def acreate_batch(**kwargs):
+        calls.append(("create_batch", kwargs["custom_llm_provider"]))
+        return _Batch("in_progress")
+
+    async def aretrieve_batch(**kwargs):
+        calls.append(("retrieve_batch", kwargs["custom_llm_provider"]))
+        return _Batch("in_progress")
+
+    async def acancel_batch(**kwargs):
+        calls.append(("cancel_batch", kwargs["custom_llm_provider"]))
+        return _Batch("cancelling")
+
+    for name, func in [("acreate_file", acreate_file), ("acreate_batch", acreate_batch),
+                       ("aretrieve_batch", aretrieve_batch), ("acancel_batch", acancel_batch)]:
+        monkeypatch.setattr(litellm_ai_handler.litellm, name, func)
+    return calls
+
+
+class TestBatchApi:
+    @pytest.mark.asyncio
+    async def test_timed_out_batch_cancelled_before_fallback(self, handler, batch_calls):
+        """A batch that misses the deadline is cancelled before the requests are resent"""
+        requests = [{"model": "gpt-4o", "system": "s", "user": f"u{i}"} for i in range(2)]
+
+        responses = await handler.batch_chat_completion(requests)
+
+        assert responses == ["individual", "individual"]
+        assert batch_calls == [("create_file", "openai"), ("create_batch", "openai"), ("cancel_batch", "openai")]
+
+    @pytest.mark.asyncio
+    async def test_unsupported_provider_sent_individually(self, handler, batch_calls):
+        """Models whose provider has no Batch API never submit a batch"""
+        requests = [{"model": "anthropic/claude-3-5-sonnet-20240620", "system": "s", "user": f"u{i}"} for i in range(2)]
+
+        responses = await handler.batch_chat_completion(requests)
+
+        assert responses == ["individual", "individual"]
+        assert batch_calls == []
+
+    def test_provider_derived_from_model(self, handler):
+        """The provider comes from the model, and mixed providers are not batched"""
+        assert handler._get_batch_api_provider([{"model": "openai/gpt-4o"}]) == ("openai", ["gpt-4o"])
+        assert handler._get_batch_api_provider([{"model": "gpt-4o"}, {"model": "anthropic/claude-3-5-sonnet-20240620"}]) == (None, None)
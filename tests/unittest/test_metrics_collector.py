@@ -0,0 +1,215 @@
+# AGPL-3.0 License
+
+"""
+Unit tests for the dashboard metrics collector.
+"""
+
+import asyncio
+from datetime import datetime
+
+import aiosqlite
+import pytest
+
+from pr_agent.config_loader import get_settings
+from pr_agent.dashboard.metrics import collector as collector_module
+from pr_agent.dashboard.metrics.collector import MetricEvent, MetricsCollector
+
+
+@pytest.fixture
+def collector(monkeypatch, tmp_path):
+    """Provide an enabled collector backed by a temporary database."""
+    monkeypatch.setattr(get_settings().dashboard, "enabled", True, raising=False)
+    return MetricsCollector(f"sqlite:///{tmp_path / 'metrics.db'}")
+
+
+@pytest.mark.asyncio
+class TestMetricsCollector:
+    """Tests for MetricsCollector."""
+
+    async def test_record_and_query(self, collector):
+        """Test that recorded metrics are returned by get_metrics."""
+        try:
+            for value in (1.0, 2.0):
+                await collector.record_metric(MetricEvent(
+                    timestamp=datetime(2024, 1, int(value)),
+                    repository="org/repo",
+                    metric_type="check_run",
+                    metric_value=value,
+                    metadata={"check": "lint"}
+                ))
+
+            metrics = await collector.get_metrics(repository="org/repo", metric_type="check_run")
+            table = await collector.get_metrics_rows(repository="org/repo", metric_type="check_run")
+        finally:
+            await collector.close()
+
+        assert [dict(zip(table["columns"], row)) for row in table["rows"]] == metrics
+
+        assert [metric["metric_value"] for metric in metrics] == [2.0, 1.0]
+        assert metrics[0]["repository"] == "org/repo"
+
+    async def test_connections_reused(self, collector):
+        """Test that sequential operations share one pooled connection."""
+        try:
+            await collector.get_metrics()
+            await collector.get_metrics()
+            assert collector._pool._opened == 1
+        finally:
+            await collector.close()
+
+        assert collector._pool is None
+
+    async def test_connection_pragmas_applied(self, collector):
+        """Test that pooled connections use WAL journaling and relaxed syncing."""
+        try:
+            await collector.initialize()
+            async with collector._pool.connection() as db:
+                async with db.execute("PRAGMA journal_mode") as cursor:
+                    journal_mode = (await cursor.fetchone())[0]
+                async with db.execute("PRAGMA synchronous") as cursor:
+                    synchronous = (await cursor.fetchone())[0]
+        finally:
+            await collector.close()
+
+        assert journal_mode == "wal"
+        assert synchronous == 1
+
+    async def test_metrics_written_in_batches(self, collector):
+        """Test that recorded events are queued and written by the background flush."""
+        try:
+            for value in range(3):
+                await collector.record_metric(MetricEvent(
+                    timestamp=datetime(2024, 1, 1),
+                    repository="org/repo",
+                    metric_type="check_run",
+                    metric_value=float(value),
+                    metadata={}
+                ))
+
+            assert collector._queue.qsize() == 3
+            await collector.flush()
+            assert collector._queue.qsize() == 0
+
+            metrics = await collector.get_metrics()
+        finally:
+            await collector.close()
+
+        assert len(metrics) == 3
+
+    async def test_filtered_query_uses_composite_index(self, collector):
+        """Test that repository and type filters are served by the composite index without sorting."""
+        try:
+            await collector.initialize()
+            async with collector._pool.connection() as db:
+                async with db.execute(
+                    f"EXPLAIN QUERY PLAN {collector_module._METRICS_QUERIES[0b0011]}",
+                    ("org/repo", "check_run", 10)
+                ) as cursor:
+                    plan = " ".join(row[-1] for row in await cursor.fetchall())
+        finally:
+            await collector.close()
+
+        assert "idx_metrics_repo_type_ts" in plan
+        assert "TEMP B-TREE" not in plan
+
+    async def test_timestamps_stored_as_integers(self, collector):
+        """Test that timestamps are stored as unix microseconds and returned as ISO strings."""
+        timestamp = datetime(2024, 1, 2, 3, 4, 5, 678901)
+        try:
+            await collector.record_metric(MetricEvent(
+                timestamp=timestamp,
+                repository="org/repo",
+                metric_type="check_run",
+                metric_value=1.0,
+                metadata={}
+            ))
+            in_range = await collector.get_metrics(start_date=datetime(2024, 1, 2), end_date=datetime(2024, 1, 3))
+            out_of_range = await collector.get_metrics(start_date=datetime(2024, 1, 3))
+
+            async with collector._pool.connection() as db:
+                async with db.execute("SELECT typeof(timestamp) FROM metrics") as cursor:
+                    stored_type = (await cursor.fetchone())[0]
+        finally:
+            await collector.close()
+
+        assert stored_type == "integer"
+        assert [metric["timestamp"] for metric in in_range] == [timestamp.isoformat()]
+        assert out_of_range == []
+
+    async def test_text_timestamps_migrated(self, collector):
+        """Test that a database created with ISO timestamps is migrated on initialization."""
+        async with aiosqlite.connect(collector.db_path) as db:
+            await db.execute("""
+                CREATE TABLE metrics (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    timestamp TEXT NOT NULL,
+                    repository TEXT NOT NULL,
+                    metric_type TEXT NOT NULL,
+                    metric_value REAL NOT NULL,
+                    metadata TEXT
+                )
+            """)
+            await db.execute("CREATE INDEX idx_metrics_timestamp ON metrics(timestamp)")
+            await db.execute(
+                "INSERT INTO metrics (timestamp, repository, metric_type, metric_value, metadata) VALUES (?, ?, ?, ?, ?)",
+                ("2024-01-02T03:04:05", "org/repo", "check_run", 1.0, "{}")
+            )
+            await db.commit()
+
+        try:
+            metrics = await collector.get_metrics(start_date=datetime(2024, 1, 2))
+        finally:
+            await collector.close()
+
+        assert [metric["timestamp"] for metric in metrics] == ["2024-01-02T03:04:05"]
+
+    async def test_enabled_flag_snapshotted(self, collector, monkeypatch):
+        """Test that the enabled flag is read at construction and re-read by refresh_config."""
+        event = MetricEvent(
+            timestamp=datetime(2024, 1, 1),
+            repository="org/repo",
+            metric_type="check_run",
+            metric_value=1.0,
+            metadata={}
+        )
+        try:
+            monkeypatch.setattr(get_settings().dashboard, "enabled", False, raising=False)
+            await collector.record_metric(event)
+            collector.refresh_config()
+            await collector.record_metric(event)
+            metrics = await collector.get_metrics()
+        finally:
+            await collector.close()
+
+        # Only the event recorded before refresh_config picked up the disabled flag is stored
+        assert len(metrics) == 1
+
+    async def test_concurrent_initialize_runs_once(self, collector):
+        """Test that concurrent first calls initialize the schema and flusher only once."""
+        try:
+            await asyncio.gather(*(collector.initialize() for _ in range(5)))
+            flusher_task = collector._flusher_task
+            await collector.initialize()
+
+            assert collector._pool._opened == 1
+            assert collector._flusher_task is flusher_task
+        finally:
+            await collector.close()
+
+    async def test_metadata_decoded_and_filterable(self, collector):
+        """Test that metadata is returned decoded and can be filtered in SQL."""
+        try:
+            for pr_id in (1, 2):
+                await collector.record_metric(MetricEvent(
+                    timestamp=datetime(2024, 1, pr_id),
+                    repository="org/repo",
+                    metric_type="pr_reviewed",
+                    metric_value=1.0,
+                    metadata={"pr_id": pr_id}
+                ))
+
+            metrics = await collector.get_metrics(metadata_field="pr_id", metadata_value=2)
+        finally:
+            await collector.close()
+
+        assert [metric["metadata"] for metric in metrics] == [{"pr_id": 2}]
@@ -0,0 +1,123 @@
+# AGPL-3.0 License
+
+"""
+Unit tests for the PR state data structures.
+"""
+
+from datetime import datetime
+
+import pytest
+
+# Settings must be loaded before pr_agent.log, which pr_agent.state imports
+import pr_agent.config_loader  # noqa: F401
+from pr_agent.state.finding import decode_timestamp, encode_timestamp
+from pr_agent.state.pr_state import DEFAULT_MAX_CONVERSATION_HISTORY, PRState
+
+
+class TestTimestamps:
+    """Tests for timestamp serialization."""
+
+    @pytest.mark.parametrize("timestamp", [
+        datetime(2024, 5, 1, 12, 30, 45, 123456),
+        datetime(2024, 5, 1, 12, 30, 45, 999999),
+        datetime(1999, 12, 31, 23, 59, 59, 1),
+        datetime(2024, 5, 1),
+    ])
+    def test_round_trip_keeps_microseconds(self, timestamp):
+        """Test that encoding then decoding returns the same datetime."""
+        encoded = encode_timestamp(timestamp)
+
+        assert isinstance(encoded, int)
+        assert decode_timestamp(encoded) == timestamp
+
+    def test_missing_timestamps(self):
+        """Test that missing timestamps stay None."""
+        assert encode_timestamp(None) is None
+        assert decode_timestamp(None) is None
+        assert decode_timestamp("") is None
+
+    def test_iso_strings_decoded(self):
+        """Test that ISO 8601 strings written by earlier versions are still accepted."""
+        assert decode_timestamp("2024-05-01T12:30:45.123456") == datetime(2024, 5, 1, 12, 30, 45, 123456)
+
+    def test_state_with_iso_timestamps_loads(self):
+        """Test that a state stored with ISO timestamps loads and is re-encoded as microseconds."""
+        data = {
+            "pr_id": "owner/repo/1",
+            "provider": "github",
+            "findings": [{
+                "id": "abc",
+                "file_path": "app.py",
+                "line_range": [1, 2],
+                "category": "security",
+                "severity": "high",
+                "message": "Hardcoded secret",
+                "suggestion": None,
+                "status": "resolved",
+                "created_at": "2024-05-01T12:00:00.000001",
+                "resolved_at": "2024-05-02T08:15:00",
+            }],
+            "reviewed_commits": ["abc123"],
+            "last_review_at": "2024-05-02T09:00:00.500000",
+            "paused": False,
+            "conversation_history": [{
+                "role": "user",
+                "content": "Why?",
+                "timestamp": "2024-05-02T09:01:00",
+                "metadata": {},
+            }],
+            "metadata": {},
+        }
+
+        state = PRState.from_dict(data)
+
+        assert state.findings[0].created_at == datetime(2024, 5, 1, 12, 0, 0, 1)
+        assert state.findings[0].resolved_at == datetime(2024, 5, 2, 8, 15)
+        assert state.last_review_at == datetime(2024, 5, 2, 9, 0, 0, 500000)
+        assert state.conversation_history[0].timestamp == datetime(2024, 5, 2, 9, 1)
+
+        encoded = state.to_dict()
+        assert isinstance(encoded["last_review_at"], int)
+        assert PRState.from_dict(encoded) == state
+
+
+class TestConversationHistory:
+    """Tests for the bounded conversation history."""
+
+    def test_history_capped_at_bound(self):
+        """Test that only the most recent messages are kept once the bound is reached."""
+        state = PRState(pr_id="owner/repo/1", provider="github", max_conversation_history=3)
+
+        for i in range(5):
+            state.add_message("user", f"message {i}")
+
+        assert [m.content for m in state.conversation_history] == ["message 2", "message 3", "message 4"]
+
+    def test_default_bound(self):
+        """Test that states use the default bound unless one is given."""
+        state = PRState(pr_id="owner/repo/1", provider="github")
+
+        assert state.conversation_history.maxlen == DEFAULT_MAX_CONVERSATION_HISTORY
+
+    def test_get_recent_messages(self):
+        """Test that the most recent messages are returned oldest first."""
+        state = PRState(pr_id="owner/repo/1", provider="github")
+        for i in range(5):
+            state.add_message("user", f"message {i}")
+
+        assert [m.content for m in state.get_recent_messages(2)] == ["message 3", "message 4"]
+        assert [m.content for m in state.get_recent_messages(10)] == [f"message {i}" for i in range(5)]
+        assert state.get_recent_messages(0) == []
+
+    def test_bound_persisted(self):
+        """Test that a custom bound survives serialization."""
+        state = PRState(pr_id="owner/repo/1", provider="github", max_conversation_history=3)
+        for i in range(5):
+            state.add_message("user", f"message {i}")
+
+        loaded = PRState.from_dict(state.to_dict())
+
+        assert loaded.max_conversation_history == 3
+        assert loaded.conversation_history.maxlen == 3
+        loaded.add_message("user", "message 5")
+        assert [m.content for m in loaded.conversation_history] == ["message 3", "message 4", "message 5"]
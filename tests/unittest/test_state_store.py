@@ -0,0 +1,212 @@
+# AGPL-3.0 License
+
+"""
+Unit tests for the PR state stores.
+"""
+
+import asyncio
+
+import pytest
+
+# Settings must be loaded before pr_agent.log, which the state stores import
+import pr_agent.config_loader  # noqa: F401
+from pr_agent.state import state_store as state_store_module
+from pr_agent.state.finding import Finding
+from pr_agent.state.pr_state import PRState
+from pr_agent.state.state_store import FileStateStore, SQLiteStateStore
+
+
+def make_state(pr_id="owner/repo/1"):
+    """Build a PR state with a finding, a reviewed commit and a message."""
+    state = PRState(pr_id=pr_id, provider="github", reviewed_commits=["abc123"], metadata={"head": "abc123"})
+    state.add_finding(Finding(
+        file_path="app.py",
+        line_range=(1, 2),
+        category="security",
+        severity="high",
+        message="Hardcoded secret",
+    ))
+    state.add_message("user", "Why is this flagged?")
+    return state
+
+
+@pytest.fixture
+def write_calls(monkeypatch):
+    """Count the state files written by FileStateStore."""
+    calls = []
+    write_state_file = FileStateStore._write_state_file
+
+    def recording_write(self, file_path, data):
+        calls.append(file_path.name)
+        write_state_file(self, file_path, data)
+
+    monkeypatch.setattr(FileStateStore, "_write_state_file", recording_write)
+    return calls
+
+
+@pytest.mark.asyncio
+class TestFileStateStore:
+    """Tests for FileStateStore."""
+
+    async def test_save_writes_immediately_by_default(self, tmp_path, write_calls):
+        """Test that without a flush delay every save is written before it returns."""
+        store = FileStateStore(str(tmp_path / "state"))
+        state = make_state()
+
+        await store.save(state)
+        await store.save(state)
+
+        assert write_calls == ["owner_repo_1.json", "owner_repo_1.json"]
+        assert await FileStateStore(str(tmp_path / "state")).load(state.pr_id) == state
+
+    async def test_saves_coalesced_within_flush_delay(self, tmp_path, write_calls):
+        """Test that repeated saves within the flush delay are written once, with the latest snapshot."""
+        store = FileStateStore(str(tmp_path / "state"), flush_delay=0.01)
+        state = make_state()
+
+        await store.save(state)
+        state.paused = True
+        await store.save(state)
+        assert write_calls == []
+        await asyncio.sleep(0.05)
+
+        assert write_calls == ["owner_repo_1.json"]
+        assert (await FileStateStore(str(tmp_path / "state")).load(state.pr_id)).paused
+
+    async def test_pending_snapshot_isolated_from_live_state(self, tmp_path, write_calls):
+        """Test that mutating a state after saving it changes neither the snapshot nor loaded copies."""
+        store = FileStateStore(str(tmp_path / "state"), flush_delay=60)
+        state = make_state()
+        try:
+            await store.save(state)
+            state.reviewed_commits.append("def456")
+            state.metadata["head"] = "def456"
+
+            loaded = await store.load(state.pr_id)
+            loaded.reviewed_commits.append("loaded")
+            assert loaded.metadata == {"head": "abc123"}
+        finally:
+            await store.close()
+
+        stored = await FileStateStore(str(tmp_path / "state")).load(state.pr_id)
+        assert stored.reviewed_commits == ["abc123"]
+        assert stored.metadata == {"head": "abc123"}
+
+    async def test_close_writes_pending_states(self, tmp_path, write_calls):
+        """Test that close() cancels the scheduled flush and writes pending states."""
+        store = FileStateStore(str(tmp_path / "state"), flush_delay=60)
+        await store.save(make_state("owner/repo/1"))
+        await store.save(make_state("owner/repo/2"))
+
+        await store.close()
+
+        assert sorted(write_calls) == ["owner_repo_1.json", "owner_repo_2.json"]
+        assert store._flush_task is None and not store._pending
+
+    async def test_failed_write_stays_pending(self, tmp_path, monkeypatch):
+        """Test that flush() keeps states whose write failed and raises the error."""
+        store = FileStateStore(str(tmp_path / "state"), flush_delay=60)
+        state = make_state()
+        await store.save(state)
+
+        def failing_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(state_store_module.os, "replace", failing_replace)
+        with pytest.raises(OSError, match="disk full"):
+            await store.flush()
+        assert state.pr_id in store._pending
+        assert await store.load(state.pr_id) == state
+
+        monkeypatch.undo()
+        await store.close()
+        assert not store._pending
+        assert await FileStateStore(str(tmp_path / "state")).load(state.pr_id) == state
+
+    async def test_failed_write_keeps_previous_file(self, tmp_path, monkeypatch):
+        """Test that a failed write leaves the previous state file intact and no temporary files behind."""
+        store = FileStateStore(str(tmp_path / "state"))
+        state = make_state()
+        await store.save(state)
+
+        def failing_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(state_store_module.os, "replace", failing_replace)
+        state.paused = True
+        with pytest.raises(OSError):
+            await store.save(state)
+        monkeypatch.undo()
+
+        assert [path.name for path in (tmp_path / "state").iterdir()] == ["owner_repo_1.json"]
+        assert not (await FileStateStore(str(tmp_path / "state")).load(state.pr_id)).paused
+
+
+@pytest.fixture
+def sqlite_store(tmp_path):
+    """Provide a SQLite state store backed by a temporary database."""
+    return SQLiteStateStore(str(tmp_path / "state.db"))
+
+
+@pytest.mark.asyncio
+class TestSQLiteStateStore:
+    """Tests for SQLiteStateStore."""
+
+    async def test_save_load_round_trip(self, sqlite_store):
+        """Test that a saved state loads back equal."""
+        state = make_state()
+        try:
+            await sqlite_store.save(state)
+            loaded = await sqlite_store.load(state.pr_id)
+        finally:
+            await sqlite_store.close()
+
+        assert loaded == state
+
+    async def test_save_replaces_previous_state(self, sqlite_store):
+        """Test that saving a PR again overwrites its stored state."""
+        state = make_state()
+        try:
+            await sqlite_store.save(state)
+            state.reviewed_commits.append("def456")
+            state.paused = True
+            await sqlite_store.save(state)
+            loaded = await sqlite_store.load(state.pr_id)
+        finally:
+            await sqlite_store.close()
+
+        assert loaded.reviewed_commits == ["abc123", "def456"]
+        assert loaded.paused
+
+    async def test_missing_pr_returns_none(self, sqlite_store):
+        """Test that loading a PR that was never saved returns None."""
+        try:
+            assert await sqlite_store.load("owner/repo/404") is None
+        finally:
+            await sqlite_store.close()
+
+    async def test_delete(self, sqlite_store):
+        """Test that a deleted state no longer loads, and deleting it again is a no-op."""
+        state = make_state()
+        try:
+            await sqlite_store.save(state)
+            await sqlite_store.delete(state.pr_id)
+            await sqlite_store.delete(state.pr_id)
+            assert await sqlite_store.load(state.pr_id) is None
+        finally:
+            await sqlite_store.close()
+
+    async def test_reuse_after_close_reopens_connection(self, sqlite_store):
+        """Test that the connection is reopened after close() and stored states persist."""
+        state = make_state()
+        try:
+            await sqlite_store.save(state)
+            await sqlite_store.close()
+            assert sqlite_store._db is None
+
+            assert await sqlite_store.load(state.pr_id) == state
+            assert sqlite_store._db is not None
+            await sqlite_store.save(make_state("owner/repo/2"))
+            assert await sqlite_store.load("owner/repo/2") is not None
+        finally:
+            await sqlite_store.close()